@@ -17,6 +17,77 @@ If you ❤️ this package, please leave your ⭐ to us, thank you very much!
 __version__ = "3.1.5"
 __author__ = "Xiaokang2022 <2951256653@qq.com>"
 
-from .core import *
-from .standard import *
-from .toolbox.enhanced import *
+import typing as _typing
+
+from ._lazy import attach as _attach
+
+__all__, __getattr__, __dir__ = _attach(__name__, {
+    ".core.configs": (
+        "Env",
+        "Font",
+        "Constant",
+        "reset",
+    ),
+    ".core.containers": (
+        "Tk",
+        "Toplevel",
+        "Canvas",
+        "ScrollableCanvas",
+    ),
+    ".standard.dialogs": (
+        "TkMessage",
+        "TkColorChooser",
+        "TkFontChooser",
+    ),
+    ".standard.widgets": (
+        "Text",
+        "Image",
+        "Label",
+        "Button",
+        "Switch",
+        "InputBox",
+        "ToggleButton",
+        "CheckBox",
+        "RadioBox",
+        "ProgressBar",
+        "UnderlineButton",
+        "HighlightButton",
+        "IconButton",
+        "Slider",
+        "SegmentedButton",
+        "SpinBox",
+        "OptionButton",
+        "ComboBox",
+        "Spinner",
+        "Tooltip",
+        "VirtualList",
+        "VirtualGrid",
+    ),
+    ".toolbox.enhanced": (
+        "PhotoImage",
+    ),
+}, {
+    "animation": ".animation",
+    "color": ".color",
+    "core": ".core",
+    "standard": ".standard",
+    "theme": ".theme",
+    "toolbox": ".toolbox",
+    "configs": ".core.configs",
+    "containers": ".core.containers",
+    "virtual": ".core.virtual",
+    "dialogs": ".standard.dialogs",
+    "features": ".standard.features",
+    "images": ".standard.images",
+    "shapes": ".standard.shapes",
+    "styles": ".standard.styles",
+    "texts": ".standard.texts",
+    "widgets": ".standard.widgets",
+})
+
+if _typing.TYPE_CHECKING:
+    from .core.configs import *
+    from .core.containers import *
+    from .standard.dialogs import *
+    from .standard.widgets import *
+    from .toolbox.enhanced import *
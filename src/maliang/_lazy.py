@@ -0,0 +1,59 @@
+# Copyright (c) 2024-2025 Xiaokang2022. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for details.
+
+"""Lazy loading of the contents of packages.
+
+The submodules of a package are only imported when one of their contents is
+accessed for the first time, see PEP 562 for details.
+"""
+
+from __future__ import annotations as _
+
+__all__ = (
+    "attach",
+)
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def attach(
+    package: str,
+    objects: dict[str, tuple[str, ...]],
+    modules: dict[str, str] | None = None,
+) -> tuple[tuple[str, ...], Callable[[str], Any], Callable[[], list[str]]]:
+    """Make the contents of a package to be loaded on first access.
+
+    Args:
+        package: the name of the package, generally is ``__name__``.
+        objects: relative names of submodules and the names of the objects
+            exported by them.
+        modules: names and relative names of the submodules that can be
+            accessed as attributes of the package.
+
+    Returns:
+        The ``__all__``, ``__getattr__`` and ``__dir__`` of the package.
+    """
+    if modules is None:
+        modules = {}
+
+    locations = {name: module for module, names in objects.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        if (module := modules.get(name)) is not None:
+            value = importlib.import_module(module, package)
+        elif (module := locations.get(name)) is not None:
+            value = getattr(importlib.import_module(module, package), name)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        # Cache the value so that this function is skipped next time
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *locations, *modules})
+
+    return (*locations, *modules), __getattr__, __dir__
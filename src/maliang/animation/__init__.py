@@ -8,5 +8,45 @@ as well as highly customizable control functions. In addition, control
 functions also applies to the related functions of the ``color`` subpackage.
 """
 
-from .animations import *
-from .controllers import *
+import typing as _typing
+
+from .._lazy import attach as _attach
+
+__all__, __getattr__, __dir__ = _attach(__name__, {
+    ".animations": (
+        "Animation",
+        "MoveWindow",
+        "MoveTkWidget",
+        "MoveWidget",
+        "MoveElement",
+        "MoveItem",
+        "GradientTkWidget",
+        "GradientItem",
+        "ScaleFontSize",
+    ),
+    ".controllers": (
+        "generate",
+        "linear",
+        "smooth",
+        "rebound",
+        "ease_in",
+        "ease_out",
+    ),
+    ".quality": (
+        "enable_adaptive_quality",
+        "disable_adaptive_quality",
+        "get_quality_level",
+        "get_quality_history",
+        "scale_fps",
+        "scale_duration",
+    ),
+}, {
+    "animations": ".animations",
+    "controllers": ".controllers",
+    "quality": ".quality",
+})
+
+if _typing.TYPE_CHECKING:
+    from .animations import *
+    from .controllers import *
+    from .quality import *
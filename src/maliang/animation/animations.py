@@ -21,18 +21,26 @@ __all__ = (
     "ScaleFontSize",
 )
 
+import time
+import tkinter
+import weakref
 from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any, overload
 
 from ..color import convert, rgb
 from ..core import configs, containers
-from . import controllers
+from . import controllers, quality
 
 if TYPE_CHECKING:
-    import tkinter
-
     from ..core import virtual
 
+_attached_animations: weakref.WeakSet[Animation] = weakref.WeakSet()
+"""Animations that are attached to a widget or a window."""
+
+_owned_animations: weakref.WeakKeyDictionary[Any, weakref.WeakSet[Animation]] = weakref.WeakKeyDictionary()
+"""Animations of each widget, canvas or window, which are stopped when it is
+destroyed."""
+
 
 class Animation:
     """Base animation class.
@@ -76,20 +84,31 @@ class Animation:
         self.repeat_delay = repeat_delay
         self.derivation = derivation
 
-        self._delay: int = 1000 // fps
+        self._fps = fps
+        self._duration = duration
         self._tasks: list[str] = []
         self._count: int = repeat
 
-        if self._delay <= duration:
-            self._total_frames, self._leave_ms = divmod(duration, self._delay)
-        else:
-            self._delay, self._total_frames, self._leave_ms = duration, 1, 0
+        # Scheduled frames as (due time, function, arguments), same order as
+        # ``_tasks``, and the remaining frames as (delay, function, arguments)
+        # while the animation is paused
+        self._schedule: list[tuple[float, Callable[..., Any], tuple]] = []
+        self._remains: list[tuple[int, Callable[..., Any], tuple]] | None = None
+        self._target: virtual.Widget | tkinter.Misc | None = None
+        self._hidden: bool = False
+
+        self._set_frame_rate(fps)
 
     @property
     def active(self) -> bool:
         """The active state of the animation."""
         return bool(self._tasks)
 
+    @property
+    def paused(self) -> bool:
+        """Whether the animation is paused."""
+        return self._remains is not None
+
     @property
     def count(self) -> int:
         """The number of loops remaining."""
@@ -114,21 +133,29 @@ class Animation:
         if delay > 0:
             return configs.Env.root.after(delay, self.start)
 
+        self._set_frame_rate(quality.scale_fps(self._fps))
+
+        frames: list[tuple[int, Callable[..., Any], tuple]] = []
         delay, last_percentage = 0, 0
 
         for i in range(1, self._total_frames + 1):
             delay += self._delay + (i < self._leave_ms)
             percentage = self.controller(i / self._total_frames)
-            self._tasks.append(configs.Env.root.after(
-                delay, self.command, percentage - last_percentage))
+            frames.append((delay, self.command, (percentage - last_percentage,)))
 
             if self.derivation:
                 last_percentage = percentage
 
         if self.end is not None:
-            self._tasks.append(configs.Env.root.after(delay, self.end))
+            frames.append((delay, self.end, ()))
 
-        self._tasks.append(configs.Env.root.after(delay, self._repeat))
+        frames.append((delay, self._repeat, ()))
+
+        if self._target is not None and not self._viewable():
+            # Nothing is drawn until the target is visible
+            self._remains, self._hidden = frames, True
+        else:
+            self._schedule_frames(frames)
 
         return None
 
@@ -151,13 +178,39 @@ class Animation:
         if delay > 0:
             return configs.Env.root.after(delay, self.stop)
 
-        while self._tasks:
-            configs.Env.root.after_cancel(self._tasks.pop())
-
+        self._cancel_frames()
+        self._remains, self._hidden = None, False
         self._count = self.repeat
 
         return None
 
+    def pause(self) -> None:
+        """Pause the animation.
+
+        The remaining frames are kept with their time offsets, and nothing is
+        scheduled until the animation is resumed.
+        """
+        if not self._tasks:
+            return
+
+        tk = configs.Env.root.tk
+        pending = set(tk.splitlist(tk.call("after", "info")))
+        now = time.perf_counter()
+
+        self._remains = [
+            (max(round((due-now) * 1000), 0), func, args)
+            for task, (due, func, args) in zip(self._tasks, self._schedule)
+            if task in pending]
+        self._cancel_frames()
+
+    def resume(self) -> None:
+        """Resume the animation that is paused."""
+        if self._remains is None:
+            return
+
+        frames, self._remains, self._hidden = self._remains, None, False
+        self._schedule_frames(frames)
+
     def skip(self, count: int = 1) -> None:
         """Skip some loops.
 
@@ -166,14 +219,159 @@ class Animation:
         """
         self._count = max(self._count-count, 0)
 
+    def attach(self, target: virtual.Widget | tkinter.Misc) -> None:
+        """Attach the animation to a widget or a window.
+
+        The animation is paused automatically when the target is not viewable,
+        such as the widget being forgotten or scrolled out of view, or the
+        window being withdrawn or iconified, and it is resumed when the target
+        is viewable again.
+
+        Args:
+            target: a virtual widget, or a widget or window of ``tkinter``.
+        """
+        self._target = target
+        _attached_animations.add(self)
+        self._update_visibility()
+
+    def detach(self) -> None:
+        """Detach the animation from its target, and resume it if it is paused
+        because of the target."""
+        self._target = None
+        _attached_animations.discard(self)
+
+        if self._hidden:
+            self.resume()
+
+    @staticmethod
+    def update_visibility() -> None:
+        """Pause or resume attached animations according to whether their
+        targets are viewable.
+
+        It is called automatically when a widget is forgotten, a window is
+        mapped or unmapped, or a canvas is scrolled.
+        """
+        for animation in tuple(_attached_animations):
+            animation._update_visibility()  # pylint: disable=W0212
+
+    @staticmethod
+    def owned_by(owner: Any) -> list[Animation]:
+        """Return the active animations of a widget, a canvas or a window.
+
+        Args:
+            owner: the object that the animations change.
+        """
+        return [animation for animation in _owned_animations.get(owner, ())
+                if animation.active or animation.paused]
+
+    @staticmethod
+    def stop_owned(owner: Any) -> None:
+        """Stop all animations of a widget, a canvas or a window.
+
+        It is called automatically when a virtual widget, a canvas or a window
+        of ``maliang`` is destroyed, so that no frame touches it afterwards.
+
+        Args:
+            owner: the object that the animations change.
+        """
+        for animation in tuple(_owned_animations.pop(owner, ())):
+            animation.stop()
+
+            if animation._target is not None:  # pylint: disable=W0212
+                animation.detach()
+
+    def _own(self, *owners: Any) -> None:
+        """Register the objects that the animation changes.
+
+        Args:
+            owners: the objects that the animation changes.
+        """
+        for owner in owners:
+            _owned_animations.setdefault(owner, weakref.WeakSet()).add(self)
+
+    def _viewable(self) -> bool:
+        """Whether the target of the animation is viewable."""
+        if isinstance(target := self._target, tkinter.Misc):
+            return bool(target.winfo_exists() and target.winfo_viewable())
+
+        if not target.exists() or target.disappeared:
+            return False
+
+        canvas = target.master
+
+        if not canvas.winfo_viewable():
+            return False
+
+        x1, y1, x2, y2 = target.region()
+        left, top = canvas.canvasx(0), canvas.canvasy(0)
+        right, bottom = left + canvas.winfo_width(), top + canvas.winfo_height()
+
+        return x1 < right and x2 > left and y1 < bottom and y2 > top
+
+    def _update_visibility(self) -> None:
+        """Pause or resume the animation according to its target."""
+        if isinstance(self._target, tkinter.Misc):
+            destroyed = not self._target.winfo_exists()
+        else:
+            destroyed = not self._target.exists()
+
+        if destroyed:
+            self.stop()
+            self.detach()
+        elif self._viewable():
+            if self._hidden:
+                self.resume()
+        elif self._tasks:
+            self.pause()
+            self._hidden = True
+
+    def _set_frame_rate(self, fps: int) -> None:
+        """Set the frame rate of the animation.
+
+        Args:
+            fps: frame rate of the animation.
+        """
+        self._delay: int = 1000 // fps
+
+        if self._delay <= self._duration:
+            self._total_frames, self._leave_ms = divmod(self._duration, self._delay)
+        else:
+            self._delay, self._total_frames, self._leave_ms = self._duration, 1, 0
+
+    def _schedule_frames(
+        self,
+        frames: list[tuple[int, Callable[..., Any], tuple]],
+    ) -> None:
+        """Schedule frames of the animation.
+
+        Args:
+            frames: a list of (delay, function, arguments).
+        """
+        now = time.perf_counter()
+
+        for delay, func, args in frames:
+            self._tasks.append(configs.Env.root.after(delay, func, *args))
+            self._schedule.append((now + delay/1000, func, args))
+
+    def _cancel_frames(self) -> None:
+        """Cancel all scheduled frames of the animation."""
+        while self._tasks:
+            configs.Env.root.after_cancel(self._tasks.pop())
+
+        self._schedule.clear()
+
     def _repeat(self) -> None:
         """Processing of the number of repetitions."""
         self._tasks.clear()
+        self._schedule.clear()
 
         if self._count != 0:
             self._count -= 1
-            if task := self.start(delay=self.repeat_delay):
-                self._tasks.append(task)
+
+            if self.repeat_delay > 0:
+                self._schedule_frames([(self.repeat_delay, self.start, ())])
+            else:
+                self.start()
         else:
             self._count = self.repeat
 
@@ -218,6 +416,7 @@ class MoveWindow(Animation):
             duration, callback, controller=controller, end=end, fps=fps,
             repeat=repeat, repeat_delay=repeat_delay,
         )
+        self._own(window)
 
 
 class MoveTkWidget(Animation):
@@ -261,6 +460,7 @@ class MoveTkWidget(Animation):
                 controller=controller, end=end, fps=fps, repeat=repeat,
                 repeat_delay=repeat_delay,
             )
+            self._own(widget)
         else:
             raise RuntimeError("The tkinter widget is not laid out by Place.")
 
@@ -332,6 +532,7 @@ class MoveWidget(Animation):
             duration, command, controller=controller, end=end, fps=fps,
             repeat=repeat, repeat_delay=repeat_delay, derivation=True,
         )
+        self._own(*(widget if isinstance(widget, Sequence) else (widget,)))
 
 
 class MoveElement(Animation):
@@ -401,6 +602,7 @@ class MoveElement(Animation):
             duration, command, controller=controller, end=end, fps=fps,
             repeat=repeat, repeat_delay=repeat_delay, derivation=True,
         )
+        self._own(*{e.widget for e in (element if isinstance(element, Sequence) else (element,))})
 
 
 class MoveItem(Animation):
@@ -474,6 +676,7 @@ class MoveItem(Animation):
             duration, command, controller=controller, end=end, fps=fps,
             repeat=repeat, repeat_delay=repeat_delay, derivation=True,
         )
+        self._own(canvas)
 
 
 class GradientTkWidget(Animation):
@@ -560,6 +763,7 @@ class GradientTkWidget(Animation):
             duration, command, controller=controller, end=end, fps=fps,
             repeat=repeat, repeat_delay=repeat_delay, derivation=derivation,
         )
+        self._own(widget)
 
 
 class GradientItem(Animation):
@@ -650,6 +854,7 @@ class GradientItem(Animation):
             duration, command, controller=controller, end=end, fps=fps,
             repeat=repeat, repeat_delay=repeat_delay, derivation=derivation,
         )
+        self._own(canvas)
 
 
 class ScaleFontSize(Animation):
@@ -724,3 +929,4 @@ class ScaleFontSize(Animation):
             controller=controller, end=end, fps=fps, repeat=repeat,
             repeat_delay=repeat_delay, derivation=derivation,
         )
+        self._own(text.widget)
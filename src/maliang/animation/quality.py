@@ -0,0 +1,194 @@
+# Copyright (c) 2024-2025 Xiaokang2022. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for details.
+
+"""Adaptive quality of animations.
+
+When enabled, the responsiveness of the event loop of ``tkinter`` is measured
+periodically. If it exceeds the frame budget, the quality is stepped down, and
+if there is enough headroom again, the quality is stepped up.
+
+* level ``0``: full quality.
+* level ``1``: the frame rate of animations is halved.
+* level ``2``: the duration of gradient animations is also halved.
+* level ``3``: styles of widgets are changed instantly, without gradients.
+"""
+
+from __future__ import annotations as _
+
+__all__ = (
+    "enable_adaptive_quality",
+    "disable_adaptive_quality",
+    "get_quality_level",
+    "get_quality_history",
+    "scale_fps",
+    "scale_duration",
+)
+
+import collections
+import time
+
+from ..core import configs
+
+_MAX_LEVEL = 3
+"""The lowest quality level."""
+
+_level: int = 0
+"""The current quality level."""
+
+_history: collections.deque[tuple[float, int, float, float]] = collections.deque(maxlen=100)
+"""Changes of the quality level, as (timestamp, level, lag, frame time)."""
+
+_budget: float = 20
+"""The frame budget, in milliseconds."""
+
+_interval: int = 200
+"""The interval between two measurements, in milliseconds."""
+
+_patience: int = 3
+"""The number of consecutive measurements required to change the level."""
+
+_task: str | None = None
+"""The identifier of the scheduled measurement."""
+
+_counter: int = 0
+"""Consecutive measurements over (positive) or under (negative) the budget."""
+
+
+def enable_adaptive_quality(
+    budget: float = 20,
+    *,
+    interval: int = 200,
+    patience: int = 3,
+) -> None:
+    """Enable the adaptive quality of animations.
+
+    Args:
+        budget: the frame budget, in milliseconds. The quality is stepped down
+            when the lag of the event loop or the frame time exceeds it.
+        interval: the interval between two measurements, in milliseconds.
+        patience: the number of consecutive measurements required to step the
+            quality down. Twice as many are required to step it up.
+    """
+    global _budget, _interval, _patience  # pylint: disable=W0603
+    _budget, _interval, _patience = budget, interval, patience
+
+    if _task is None:
+        _measure(time.perf_counter() + interval/1000)
+
+
+def disable_adaptive_quality() -> None:
+    """Disable the adaptive quality of animations and restore full quality."""
+    global _task  # pylint: disable=W0603
+
+    if _task is not None:
+        configs.Env.root.after_cancel(_task)
+        _task = None
+
+    _set_level(0, 0, 0)
+
+
+def get_quality_level() -> int:
+    """Get the current quality level, ``0`` is full quality."""
+    return _level
+
+
+def get_quality_history() -> list[tuple[float, int, float, float]]:
+    """Get the recent changes of the quality level.
+
+    Returns:
+        A list of (timestamp, level, lag, frame time), the timestamp is the
+            value of ``time.perf_counter`` and the others are in milliseconds.
+    """
+    return list(_history)
+
+
+def scale_fps(fps: int) -> int:
+    """Scale the frame rate of an animation to the current quality level.
+
+    Args:
+        fps: the original frame rate.
+
+    Returns:
+        The scaled frame rate.
+    """
+    return fps if _level == 0 else max(fps // 2, 1)
+
+
+def scale_duration(duration: int) -> int:
+    """Scale the duration of a gradient animation to the current quality level.
+
+    Args:
+        duration: the original duration, in milliseconds.
+
+    Returns:
+        The scaled duration, ``0`` indicates no gradient animation.
+    """
+    if _level >= _MAX_LEVEL:
+        return 0
+
+    return duration if _level < 2 else duration // 2
+
+
+def _set_level(level: int, lag: float, frame_time: float) -> None:
+    """Set the quality level and record it.
+
+    Args:
+        level: the new quality level.
+        lag: the lag of the event loop, in milliseconds.
+        frame_time: the frame time, in milliseconds.
+    """
+    global _level, _counter  # pylint: disable=W0603
+    _counter = 0
+
+    if level != _level:
+        _level = level
+        _history.append((time.perf_counter(), level, lag, frame_time))
+
+
+def _measure(expected: float) -> None:
+    """Schedule a measurement of the event loop.
+
+    The lag is how late the measurement is called, and the frame time is how
+    long the event loop is busy until it becomes idle.
+
+    Args:
+        expected: the expected time of the measurement.
+    """
+    global _task  # pylint: disable=W0603
+
+    def probe() -> None:
+        start = time.perf_counter()
+        configs.Env.root.after_idle(
+            _evaluate, (start-expected) * 1000, start)
+        _measure(start + _interval/1000)
+
+    _task = configs.Env.root.after(
+        max(round((expected-time.perf_counter()) * 1000), 0), probe)
+
+
+def _evaluate(lag: float, start: float) -> None:
+    """Step the quality level according to a measurement.
+
+    Args:
+        lag: the lag of the event loop, in milliseconds.
+        start: the time when the measurement started.
+    """
+    global _counter  # pylint: disable=W0603
+
+    if _task is None:  # Disabled meanwhile
+        return
+
+    frame_time = (time.perf_counter()-start) * 1000
+
+    if max(lag, frame_time) > _budget:
+        _counter = max(_counter, 0) + 1
+
+        if _counter >= _patience and _level < _MAX_LEVEL:
+            _set_level(_level + 1, lag, frame_time)
+    elif max(lag, frame_time) < _budget / 2:
+        _counter = min(_counter, 0) - 1
+
+        if -_counter >= _patience*2 and _level > 0:
+            _set_level(_level - 1, lag, frame_time)
+    else:
+        _counter = 0
@@ -7,4 +7,48 @@ Supports the processing of color strings in RGB and HSL formats, as well as the
 conversion between color names and color codes.
 """
 
-from .convert import *
+import typing as _typing
+
+from .._lazy import attach as _attach
+
+__all__, __getattr__, __dir__ = _attach(__name__, {
+    ".convert": (
+        "rgb_to_hex",
+        "hex_to_rgb",
+        "rgba_to_hex",
+        "hex_to_rgba",
+        "hsl_to_rgb",
+        "rgb_to_hsl",
+        "hsl_to_hex",
+        "hex_to_hsl",
+        "name_to_rgb",
+        "rgb_to_name",
+        "name_to_hex",
+        "hex_to_name",
+        "nearest_name",
+        "fix_hex_length",
+        "str_to_rgb",
+        "rgb2hex",
+        "hex2rgb",
+        "rgba2hex",
+        "hex2rgba",
+        "hsl2rgb",
+        "rgb2hsl",
+        "hsl2hex",
+        "hex2hsl",
+        "name2rgb",
+        "rgb2name",
+        "name2hex",
+        "hex2name",
+        "nearest2name",
+        "str2rgb",
+    ),
+}, {
+    "colortable": ".colortable",
+    "convert": ".convert",
+    "hsl": ".hsl",
+    "rgb": ".rgb",
+})
+
+if _typing.TYPE_CHECKING:
+    from .convert import *
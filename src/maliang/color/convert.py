@@ -25,6 +25,7 @@ __all__ = (
     "rgb_to_name",
     "name_to_hex",
     "hex_to_name",
+    "nearest_name",
     "fix_hex_length",
     "str_to_rgb",
     # Alias
@@ -40,14 +41,18 @@ __all__ = (
     "rgb2name",
     "name2hex",
     "hex2name",
+    "nearest2name",
     "str2rgb",
 )
 
 import colorsys
+import functools
+import heapq
 import math
+from typing import Literal
 
 from ..core import configs
-from . import colortable, rgb
+from . import rgb
 
 
 def rgb_to_hex(value: tuple[int, int, int], /) -> str:
@@ -192,6 +197,8 @@ def name_to_rgb(value: str, /) -> tuple[int, int, int]:
     Returns:
         A RGB code.
     """
+    from . import colortable  # Load the huge table on first use
+
     if rgb_code := colortable.MAPPING_TABLE.get(value.lower()):
         return rgb_code
 
@@ -207,6 +214,8 @@ def rgb_to_name(value: tuple[int, int, int], /) -> list[str]:
     Returns:
         A list of color names.
     """
+    from . import colortable  # Load the huge table on first use
+
     str_list: list[str] = []
 
     for name, rgb_code in colortable.MAPPING_TABLE.items():
@@ -240,6 +249,155 @@ def hex_to_name(value: str, /) -> list[str]:
     return rgb_to_name(hex_to_rgb(value))
 
 
+def nearest_name(
+    value: tuple[int, int, int],
+    /,
+    k: int = 1,
+    *,
+    space: Literal["rgb", "lab"] = "rgb",
+) -> list[str]:
+    """Find the color names closest to a RGB code.
+
+    The search is backed by a k-d tree over the color table, which is built
+    once per color space on first use.
+
+    Args:
+        value: a RGB code.
+        k: the number of color names to return.
+        space: the color space in which the distance is measured, ``"lab"``
+            is closer to human perception.
+
+    Returns:
+        A list of color names, ordered from the closest to the farthest.
+
+    Raises:
+        ValueError: if the color space is not supported.
+
+    Examples:
+        >>> nearest_name((250, 128, 112))
+        ['salmon']
+        >>> nearest_name((0, 127, 1), space="lab")
+        ['green']
+    """
+    if space not in ("rgb", "lab"):
+        raise ValueError(f"Unsupported color space ({space}).")
+
+    names, tree = _get_tree(space)
+    target = _rgb_to_lab(value) if space == "lab" else value
+    heap: list[tuple[float, int]] = []
+
+    if k > 0:
+        _search_tree(tree, target, k, heap)
+
+    return [names[-index] for _, index in sorted(heap, reverse=True)]
+
+
+def _rgb_to_lab(value: tuple[int, int, int], /) -> tuple[float, float, float]:
+    """Convert a RGB code to a CIELAB code (D65 white point).
+
+    Args:
+        value: a RGB code.
+
+    Returns:
+        A CIELAB code.
+    """
+    r, g, b = (c/12.92 if c <= 0.04045 else ((c+0.055) / 1.055) ** 2.4
+               for c in (v/255 for v in value))
+
+    x = (0.4124564*r + 0.3575761*g + 0.1804375*b) / 0.95047
+    y = (0.2126729*r + 0.7151522*g + 0.0721750*b) / 1.00000
+    z = (0.0193339*r + 0.1191920*g + 0.9503041*b) / 1.08883
+
+    fx, fy, fz = (t ** (1/3) if t > 216/24389 else (24389/27*t + 16) / 116
+                  for t in (x, y, z))
+
+    return 116*fy - 16, 500 * (fx-fy), 200 * (fy-fz)
+
+
+@functools.cache
+def _get_tree(space: Literal["rgb", "lab"]) -> tuple[list[str], tuple | None]:
+    """Build the k-d tree of the color table for a color space.
+
+    Args:
+        space: the color space of the k-d tree.
+
+    Returns:
+        A list of color names and the root node of the k-d tree.
+    """
+    from . import colortable  # Load the huge table on first use
+
+    names = list(colortable.MAPPING_TABLE)
+    points = [(_rgb_to_lab(rgb_code) if space == "lab" else rgb_code, i)
+              for i, rgb_code in enumerate(colortable.MAPPING_TABLE.values())]
+
+    return names, _build_tree(points, 0)
+
+
+def _build_tree(
+    points: list[tuple[tuple[float, float, float], int]],
+    depth: int,
+) -> tuple | None:
+    """Build a k-d tree recursively.
+
+    A node is a tuple of ``(point, index, axis, left, right)``.
+
+    Args:
+        points: points with their indexes in the color table.
+        depth: depth of the current node.
+
+    Returns:
+        The root node of the k-d tree, or ``None`` if there are no points.
+    """
+    if not points:
+        return None
+
+    axis = depth % 3
+    points.sort(key=lambda point: point[0][axis])
+    median = len(points) // 2
+
+    return (*points[median], axis,
+            _build_tree(points[:median], depth+1),
+            _build_tree(points[median+1:], depth+1))
+
+
+def _search_tree(
+    node: tuple | None,
+    target: tuple[float, float, float],
+    k: int,
+    heap: list[tuple[float, int]],
+) -> None:
+    """Search the k nearest points of the k-d tree.
+
+    The ``heap`` keeps the ``k`` best results as ``(-distance, -index)``, so
+    the worst one is always on the top, and a tie is broken by the order of the
+    color table.
+
+    Args:
+        node: the current node of the k-d tree.
+        target: the point to be searched.
+        k: the number of points to search.
+        heap: the results found so far.
+    """
+    if node is None:
+        return
+
+    point, index, axis, left, right = node
+    item = -math.dist(point, target), -index
+
+    if len(heap) < k:
+        heapq.heappush(heap, item)
+    elif item > heap[0]:
+        heapq.heapreplace(heap, item)
+
+    delta = target[axis] - point[axis]
+    near, far = (left, right) if delta < 0 else (right, left)
+
+    _search_tree(near, target, k, heap)
+
+    if len(heap) < k or abs(delta) <= -heap[0][0]:
+        _search_tree(far, target, k, heap)
+
+
 def fix_hex_length(value: str, /) -> str:
     """Fix the length of a hexadecimal code.
 
@@ -287,4 +445,5 @@ name2rgb = name_to_rgb
 rgb2name = rgb_to_name
 name2hex = name_to_hex
 hex2name = hex_to_name
+nearest2name = nearest_name
 str2rgb = str_to_rgb
@@ -6,5 +6,29 @@
 Most of the abstract and base classes are defined here.
 """
 
-from .configs import *
-from .containers import *
+import typing as _typing
+
+from .._lazy import attach as _attach
+
+__all__, __getattr__, __dir__ = _attach(__name__, {
+    ".configs": (
+        "Env",
+        "Font",
+        "Constant",
+        "reset",
+    ),
+    ".containers": (
+        "Tk",
+        "Toplevel",
+        "Canvas",
+        "ScrollableCanvas",
+    ),
+}, {
+    "configs": ".configs",
+    "containers": ".containers",
+    "virtual": ".virtual",
+})
+
+if _typing.TYPE_CHECKING:
+    from .configs import *
+    from .containers import *
@@ -45,20 +45,28 @@ class Env:
         system (str): The system of environment, such as ``"Windows10"``,
             ``"Windows11"``, ``"Linux"``, ``"Darwin"`` (macOS).
         theme (Literal["light", "dark"]): The theme of the application.
+        theme_listener (bool): Whether to listen for changes of the system
+            theme in a background thread. It takes effect when the system theme
+            is detected for the first time.
         gradient_animation (bool): Whether to enable gradient animation for
             widgets that support it by default.
         auto_update (bool): Whether to check for updates automatically on
             startup.
+        resize_delay (int): The default time that the size of a canvas must be
+            stable before its widgets are zoomed, in milliseconds. ``0``
+            indicates zooming them on every change of the size.
         root (tkinter.Tk): The current default root window. It is READ-ONLY.
     """
 
     # Global configurations
     system: ClassVar[str]
     theme: ClassVar[Literal["light", "dark"]]
+    theme_listener: ClassVar[bool]
 
     # Default parameters for widgets
     gradient_animation: ClassVar[bool]
     auto_update: ClassVar[bool]
+    resize_delay: ClassVar[int]
 
     # Dynamic value
     root = _DefaultRootDescriptor()
@@ -68,8 +76,10 @@ class Env:
         """Reset all configuration options."""
         cls.system = cls.get_default_system()
         cls.theme = "light"
+        cls.theme_listener = True
         cls.gradient_animation = True
         cls.auto_update = True
+        cls.resize_delay = 0
 
     @staticmethod
     def get_default_system() -> str:
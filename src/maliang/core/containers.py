@@ -7,7 +7,8 @@ There are two containers at the window level: ``Tk`` and ``Toplevel``. ``Tk`` is
 generally used for the main window, while ``Toplevel`` is a pop-up window.
 
 There is another container at the canvas level: ``Canvas``. ``Canvas`` is the
-main container carrier.
+main container carrier, and ``ScrollableCanvas`` is a ``Canvas`` whose contents
+can be scrolled.
 """
 
 from __future__ import annotations as _
@@ -16,25 +17,43 @@ __all__ = (
     "Tk",
     "Toplevel",
     "Canvas",
+    "ScrollableCanvas",
 )
 
 import abc
+import contextlib
 import functools
 import sys
 import tkinter
 import tkinter.font
 import traceback
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, Final, Literal
+from typing import Any, Final, Literal
 
 from typing_extensions import Self, override
 
+from ..animation import animations, controllers, quality
 from ..theme import manager
 from ..toolbox import enhanced, utility
-from . import configs
+from . import configs, virtual
 
-if TYPE_CHECKING:
-    from . import virtual
+
+class _Resumer(contextlib.AbstractContextManager):
+    """The return value of ``Canvas.freeze`` and ``Canvas.building``, which
+    resumes the ``Canvas`` once on exit when it is used as a context manager."""
+
+    def __init__(self, resume: Callable[[], Any]) -> None:
+        """
+        Args:
+            resume: the function that resumes the ``Canvas``.
+        """
+        self._resume: Callable[[], Any] | None = resume
+
+    @override
+    def __exit__(self, *args: Any) -> None:
+        if (resume := self._resume) is not None:
+            self._resume = None
+            resume()
 
 
 class Misc(abc.ABC):
@@ -118,6 +137,12 @@ class Tk(tkinter.Tk, Misc):
 
         self.bind("<Configure>", lambda _: self._zoom())
 
+        for sequence in "<Map>", "<Unmap>":
+            self.bind(sequence, lambda _: animations.Animation.update_visibility(), "+")
+
+        if not isinstance(self, Toplevel):
+            manager._ensure_poll(self)  # pylint: disable=W0212
+
     @functools.cached_property
     def ratios(self) -> tuple[float, float]:
         """The aspect zoom ratio of the container."""
@@ -400,8 +425,27 @@ class Tk(tkinter.Tk, Misc):
     @override
     def destroy(self) -> None:
         manager.remove_event(self.theme)
+        animations.Animation.stop_owned(self)
+        manager._cancel_poll(self)  # pylint: disable=W0212
         return super().destroy()
 
+    def diagnose(self) -> dict[str, dict[str, int]]:
+        """Report the resources held by each canvas of the window, for catching
+        leaks, see method ``Canvas.diagnose`` for details.
+
+        Returns:
+            A dictionary of the path names of the canvases and their reports.
+        """
+        reports: dict[str, dict[str, int]] = {}
+        canvases = list(self.canvases)
+
+        while canvases:
+            canvas = canvases.pop(0)
+            reports[str(canvas)] = canvas.diagnose()
+            canvases.extend(canvas.canvases)
+
+        return reports
+
     def at_exit(
         self,
         command: Callable[[], Any],
@@ -473,6 +517,7 @@ class Toplevel(tkinter.Toplevel, Tk, Misc):
     @override
     def destroy(self) -> None:
         manager.remove_event(self.theme)
+        animations.Animation.stop_owned(self)
         return super().destroy()
 
 
@@ -481,11 +526,18 @@ class Canvas(tkinter.Canvas, Misc):
 
     The parent widget of all virtual widgets is ``Canvas``.
 
+    Items of virtual widgets are stacked in layers, from the bottom to the top:
+    ``background``, ``content``, ``overlay`` and ``popup``. Widgets are put in
+    the ``content`` layer by default, see method ``Widget.lift`` for details.
+
     Attributes:
         light (dict[str, str | int]): light theme colors.
         dark (dict[str, str | int]): dark theme colors.
+        LAYERS (tuple[str, ...]): names of the stacking layers.
     """
 
+    LAYERS: Final[tuple[str, ...]] = ("background", "content", "overlay", "popup")
+
     light: dict[str, str | int] = {
         "bg": "#F1F1F1",
         "insertbackground": "#000000",
@@ -510,6 +562,8 @@ class Canvas(tkinter.Canvas, Misc):
         free_anchor: bool = False,
         auto_update: bool | None = None,
         zoom_all_items: bool = False,
+        resize_delay: int | None = None,
+        cull_margin: int | None = None,
         **kwargs: Any,
     ) -> None:
         """
@@ -523,6 +577,12 @@ class Canvas(tkinter.Canvas, Misc):
             free_anchor: whether the anchor point is free-floating.
             auto_update: whether the theme manager update it automatically.
             zoom_all_items: whether or not to scale its allitems.
+            resize_delay: the time that the size must be stable before its
+                widgets and items are zoomed, in milliseconds. ``0`` indicates
+                zooming them on every change of the size.
+            cull_margin: the margin around the visible area, widgets entirely
+                outside it are culled, see method ``cull`` for details. ``None``
+                indicates no culling.
             kwargs: compatible with other parameters of class
                 ``tkinter.Canvas``.
         """
@@ -542,7 +602,7 @@ class Canvas(tkinter.Canvas, Misc):
         self._position: tuple[int, int]
 
         self.canvases: list[Canvas] = []
-        self.widgets: list[virtual.Widget] = []
+        self.widgets = virtual.WidgetRegistry(layers=self.LAYERS)
 
         self.events: list[str] = []
 
@@ -557,6 +617,24 @@ class Canvas(tkinter.Canvas, Misc):
         self._keep_ratio: Literal["min", "max"] | None = keep_ratio
         self._zoom_all_items = zoom_all_items
 
+        if resize_delay is None:
+            self._resize_delay = configs.Env.resize_delay
+        else:
+            self._resize_delay = resize_delay
+
+        self._resize_task: str | None = None
+        self._cull_margin = cull_margin
+        self._last_item: int = 0  # The last item checked by _zoom_items
+        self._layers: dict[str, int] = {}  # The anchor item of each layer
+        self._create_layers()
+
+        # Widgets to be repainted, and whether without gradient animation
+        self._dirty: dict[virtual.Widget, bool] = {}
+        self._repaint_task: str | None = None
+        self._frozen: int = 0  # The nesting depth of method freeze
+        self._building: int = 0  # The nesting depth of method building
+        self._built: dict[virtual.Widget, None] = {}  # Widgets built meanwhile
+
         self._focus_widget: virtual.Widget | None = None
         self._focus_rect: int = self.create_rectangle(
             0, 0, 0, 0, outline="red", width=0)
@@ -604,6 +682,159 @@ class Canvas(tkinter.Canvas, Misc):
         """The aspect zoom ratio of the widget."""
         return self._size[0]/self.init_size[0], self._size[1]/self.init_size[1]
 
+    def _create_layers(self) -> None:
+        """Create the anchor items of the stacking layers.
+
+        The anchor of a layer is a hidden item right above all items of the
+        layer, so items are put at the top of a layer by lowering them below
+        its anchor.
+        """
+        for name in self.LAYERS:
+            self._layers[name] = self.create_line(
+                0, 0, 0, 0, state="hidden", tags=f"layer:{name}")
+
+    def diagnose(self) -> dict[str, int]:
+        """Report the resources held by the ``Canvas``, for catching leaks.
+
+        Returns:
+            The numbers of its widgets, items, distinct fonts of texts, active
+                animations of it and its widgets, and nested canvases.
+        """
+        widgets = tuple(self.widgets)
+        fonts = {id(text.font) for widget in widgets for text in widget.texts}
+        animations_ = sum(len(animations.Animation.owned_by(owner)) for owner in (self, *widgets))
+
+        return {
+            "widgets": len(widgets),
+            "items": len(self.find_all()),
+            "fonts": len(fonts),
+            "animations": animations_,
+            "canvases": len(self.canvases),
+        }
+
+    def place_in_layer(self, tag_or_id: str | int, layer: str) -> None:
+        """Place items at the top of a stacking layer.
+
+        The relative order of the items is kept.
+
+        Args:
+            tag_or_id: tag or identifier of the items.
+            layer: name of the layer.
+
+        Raises:
+            ValueError: if the layer does not exist.
+        """
+        if (anchor := self._layers.get(layer)) is None:
+            raise ValueError(f"Layer {layer!r} does not exist.")
+
+        self.tag_lower(tag_or_id, anchor)
+
+    @property
+    def frozen(self) -> bool:
+        """Whether visual changes of its widgets are suspended."""
+        return self._frozen > 0
+
+    def freeze(self) -> contextlib.AbstractContextManager:
+        """Suspend visual changes of its widgets until method ``thaw`` is called.
+
+        Updates of the widgets and culling are deferred, and each affected
+        widget is repainted once when the ``Canvas`` is thawed. Calls can be
+        nested, and the return value can be used as a context manager that
+        calls method ``thaw`` on exit, e.g. ``with canvas.freeze(): ...``.
+        """
+        self._frozen += 1
+        return _Resumer(self.thaw)
+
+    def thaw(self) -> None:
+        """Resume visual changes of its widgets and repaint the affected ones.
+
+        It has no effect unless it is the last call matching method ``freeze``.
+        """
+        if self._frozen == 0:
+            return
+
+        self._frozen -= 1
+
+        if self._frozen == 0:
+            self._repaint()
+            self.cull()
+
+    @property
+    def constructing(self) -> bool:
+        """Whether widgets are being constructed in bulk."""
+        return self._building > 0
+
+    def building(self) -> contextlib.AbstractContextManager:
+        """Construct widgets in bulk until the return value is closed.
+
+        It is used as a context manager, e.g. ``with canvas.building(): ...``.
+        Meanwhile the ``Canvas`` is frozen, see method ``freeze``. Elements of
+        new widgets are not painted with gradient animations, and each new
+        widget is placed in its layer and painted only once at the end, which
+        saves a lot of time when many widgets are created at once.
+        """
+        self._building += 1
+        self._frozen += 1
+        return _Resumer(self._finish_building)
+
+    def _finish_building(self) -> None:
+        """Place the widgets constructed in bulk in their layers and thaw."""
+        try:
+            self._building -= 1
+
+            if self._building:
+                return
+
+            built, self._built = self._built, {}
+
+            # Later widgets are placed later, so they stay above earlier ones
+            for widget in built:
+                if widget.exists():
+                    self.place_in_layer(widget.tags[0], widget.layer)
+        finally:
+            self.thaw()
+
+    def schedule_build(self, widget: virtual.Widget) -> None:
+        """Schedule the placement and painting of a widget constructed in bulk.
+
+        Args:
+            widget: the widget whose elements have been created.
+        """
+        root = widget
+
+        while root.widget is not None:  # Its items have the tag of the root
+            root = root.widget
+
+        self._built[root] = None
+        self._dirty[widget] = True  # New widgets are painted at once
+
+    def schedule_repaint(self, widget: virtual.Widget) -> None:
+        """Schedule a repaint of a widget.
+
+        All scheduled widgets are repainted once when the event loop is idle,
+        or when the ``Canvas`` is thawed if it is frozen. The gradient animation
+        of the widget is used, unless it is constructed in bulk.
+
+        Args:
+            widget: the widget to be repainted.
+        """
+        self._dirty.setdefault(widget, False)
+
+        if self._repaint_task is None and not self._frozen:
+            self._repaint_task = self.after_idle(self._repaint)
+
+    def _repaint(self) -> None:
+        """Repaint the widgets scheduled by method ``schedule_repaint``."""
+        if self._repaint_task is not None:
+            self.after_cancel(self._repaint_task)
+            self._repaint_task = None
+
+        dirty, self._dirty = self._dirty, {}
+
+        for widget, instant in dirty.items():
+            if widget.exists():
+                widget.update(widget.state, gradient_animation=False if instant else None)
+
     def theme(self, value: Literal["light", "dark"]) -> None:
         """Change the color theme of the Canvas and its items.
 
@@ -628,6 +859,7 @@ class Canvas(tkinter.Canvas, Misc):
         """Initialization of size data."""
         self.init_size = self.winfo_width(), self.winfo_height()
         self._size = self.init_size
+        self._zoomed_size = self.init_size
 
         match self.place_info().get("anchor", "nw"):
             case "nw": dx, dy = 0, 0
@@ -675,7 +907,6 @@ class Canvas(tkinter.Canvas, Misc):
             self._initialization()
             return
 
-        size = self._size  # temporary value
         self._position = self.winfo_x(), self.winfo_y()
         self._size = self.winfo_width(), self.winfo_height()
 
@@ -683,37 +914,71 @@ class Canvas(tkinter.Canvas, Misc):
             del self.__dict__["ratios"]  # Clear cache to update the ratios
 
         if self._auto_zoom:
-            # If size hasn't changed (only position changed), skip scaling.
-            # This prevents moving the Canvas (place x/y changes) from
-            # repeatedly triggering automatic zoom operations per frame.
-            if self._size == size:
-                # still need to update child canvases' zoom state
-                for canvas in self.canvases:
-                    canvas.zoom()
-                return
+            if self._resize_task is not None:
+                self.after_cancel(self._resize_task)
+                self._resize_task = None
 
-            relative_ratio = self._size[0]/size[0], self._size[1]/size[1]
-            # If the relative ratio is effectively 1, avoid unnecessary work.
-            if abs(relative_ratio[0] - 1.0) < 1e-12 and abs(relative_ratio[1] - 1.0) < 1e-12:
-                for canvas in self.canvases:
-                    canvas.zoom()
-                return
+            if self._resize_delay > 0:
+                # Only place the child canvases until the size is stable
+                self._resize_task = self.after(
+                    self._resize_delay, self._zoom_widgets)
+            else:
+                self._zoom_widgets()
 
-            self._zoom_tk_widgets(relative_ratio)
+        for canvas in self.canvases:
+            canvas.zoom()
 
-            for widget in self.widgets:
-                # Nested widget will be zoomed by its parent widget
-                if not widget.nested:
-                    widget.zoom(relative_ratio)
+    def _zoom_widgets(self) -> None:
+        """Scale the widgets and items of the ``Canvas`` to its current size."""
+        self._resize_task = None
+        size, self._zoomed_size = self._zoomed_size, self._size
 
-            if self._zoom_all_items:
-                for item in self.find_all():
-                    if self.gettags(item):
-                        continue
-                    self.scale(item, 0, 0, relative_ratio[0], relative_ratio[1])
+        # If size hasn't changed (only position changed), skip scaling.
+        # This prevents moving the Canvas (place x/y changes) from
+        # repeatedly triggering automatic zoom operations per frame.
+        if self._size == size:
+            return
 
-        for canvas in self.canvases:
-            canvas.zoom()
+        relative_ratio = self._size[0]/size[0], self._size[1]/size[1]
+        # If the relative ratio is effectively 1, avoid unnecessary work.
+        if abs(relative_ratio[0] - 1.0) < 1e-12 and abs(relative_ratio[1] - 1.0) < 1e-12:
+            return
+
+        previous = size[0]/self.init_size[0], size[1]/self.init_size[1]
+
+        self._zoom_tk_widgets(relative_ratio)
+
+        for widget in self.widgets:
+            # Nested widget will be zoomed by its parent widget
+            if not widget.nested:
+                # Computed from the recorded geometry to avoid cumulative errors
+                widget.rescale(self.ratios, previous)
+
+        if self._zoom_all_items:
+            self._zoom_items(relative_ratio)
+
+        self.cull()
+
+    def _zoom_items(self, rel_ratio: tuple[float, float]) -> None:
+        """Scale the items without tags of the ``Canvas``.
+
+        The items are tagged with ``"zoom_all_items"`` when they are first met,
+        so that all of them can be scaled at once.
+
+        Args:
+            rel_ratio: the ratio of the current size to the previous size.
+        """
+        last_item = self._last_item
+
+        # The identifiers of items are increasing, so only new items are checked
+        for item in self.find_all():
+            if item > last_item:
+                self._last_item = max(self._last_item, item)
+
+                if not self.gettags(item):
+                    self.addtag_withtag("zoom_all_items", item)
+
+        self.scale("zoom_all_items", 0, 0, *rel_ratio)
 
     def _zoom_tk_widgets(self, rel_ratio: tuple[float, float]) -> None:
         """Scale the ``tkinter`` widgets of the ``Canvas``.
@@ -735,22 +1000,32 @@ class Canvas(tkinter.Canvas, Misc):
     def destroy(self) -> None:
         self.master.canvases.remove(self)
 
+        if self._resize_task is not None:
+            self.after_cancel(self._resize_task)
+
+        if self._repaint_task is not None:
+            self.after_cancel(self._repaint_task)
+
         for widget in tuple(self.widgets):
             # Nested widget will be destroyed by its parent widget
             if widget.exists() and not widget.nested:
                 widget.destroy()
 
+        animations.Animation.stop_owned(self)
         return super().destroy()
 
     def clear(self) -> None:
         """Clear all things in the Canvas."""
         self.canvases.clear()
         self.widgets.clear()
+        self._dirty.clear()
+        self._built.clear()
 
         for child in tuple(self.children.values()):
             child.destroy()
 
         self.delete(*self.find_all())
+        self._create_layers()
 
     @override
     def create_text(self, x: float, y: float, /, *args, **kwargs) -> int:
@@ -774,11 +1049,78 @@ class Canvas(tkinter.Canvas, Misc):
 
         return super().create_text(x, y, *args, **kwargs)
 
+    @override
+    def xview(self, *args: Any) -> Any:
+        result = super().xview(*args)
+
+        if args:  # The view is changed
+            self.cull()
+            animations.Animation.update_visibility()
+
+        return result
+
+    @override
+    def yview(self, *args: Any) -> Any:
+        result = super().yview(*args)
+
+        if args:  # The view is changed
+            self.cull()
+            animations.Animation.update_visibility()
+
+        return result
+
+    @override
+    def xview_moveto(self, fraction: float) -> None:
+        self.xview("moveto", fraction)
+
+    @override
+    def yview_moveto(self, fraction: float) -> None:
+        self.yview("moveto", fraction)
+
+    @override
+    def xview_scroll(self, number: float | str, what: str) -> None:
+        self.xview("scroll", number, what)
+
+    @override
+    def yview_scroll(self, number: float | str, what: str) -> None:
+        self.yview("scroll", number, what)
+
+    def cull(self, *widgets: virtual.Widget) -> None:
+        """Cull the widgets that are entirely outside the visible area.
+
+        Culled widgets are skipped for styling, gradient animations and events,
+        and the latest style is applied when they enter the visible area again.
+        It only works when ``cull_margin`` is not ``None``, and is called
+        automatically when the ``Canvas`` is zoomed or scrolled, or a widget is
+        moved or resized.
+
+        Args:
+            widgets: the widgets to be checked, all widgets by default.
+        """
+        if self._cull_margin is None or not hasattr(self, "_size") or self._frozen:
+            return  # All widgets are checked again when the Canvas is thawed
+
+        margin = self._cull_margin
+        left, top = self.canvasx(0) - margin, self.canvasy(0) - margin
+        right = left + self._size[0] + margin*2
+        bottom = top + self._size[1] + margin*2
+
+        for widget in widgets or self.widgets:
+            # Nested widget will be culled by its parent widget
+            if widget.nested:
+                continue
+
+            x1, y1, x2, y2 = widget.region()
+            culled = x2 < left or x1 > right or y2 < top or y1 > bottom
+
+            if culled != widget.culled:
+                widget.cull(culled)
+
     def on_motion(self, event: tkinter.Event, name: str) -> None:
         """Events to move the mouse."""
         self.trigger_config.reset()
         for widget in reversed(self.widgets):
-            if hasattr(widget, "feature") and not widget.disappeared:
+            if hasattr(widget, "feature") and not (widget.disappeared or widget.culled):
                 flag = widget.feature.get_method(name)(event)
                 if widget.capture_events is None:
                     if flag:
@@ -790,7 +1132,7 @@ class Canvas(tkinter.Canvas, Misc):
     def _on_leave(self, event: tkinter.Event) -> None:
         """Handle mouse leaving the Canvas: normalize widget states."""
         for widget in tuple(self.widgets):
-            if not hasattr(widget, "feature") or widget.disappeared:
+            if not hasattr(widget, "feature") or widget.disappeared or widget.culled:
                 continue
             s = widget.state
             if s.startswith("hover"):
@@ -809,7 +1151,7 @@ class Canvas(tkinter.Canvas, Misc):
         self.hide_focus()
         self.trigger_focus.reset()
         for widget in reversed(self.widgets):
-            if hasattr(widget, "feature") and not widget.disappeared:
+            if hasattr(widget, "feature") and not (widget.disappeared or widget.culled):
                 if widget.feature.get_method(name)(event):
                     self._focus_widget = widget
                     if widget.capture_events:
@@ -819,7 +1161,7 @@ class Canvas(tkinter.Canvas, Misc):
     def on_release(self, event: tkinter.Event, name: str) -> None:
         """Events to release the mouse."""
         for widget in reversed(self.widgets):
-            if hasattr(widget, "feature") and not widget.disappeared:
+            if hasattr(widget, "feature") and not (widget.disappeared or widget.culled):
                 if widget.feature.get_method(name)(event) and widget.capture_events:
                     event.x = 9999
 
@@ -828,21 +1170,34 @@ class Canvas(tkinter.Canvas, Misc):
         if type_ is not None:
             event.delta = 120 if type_ else -120
         for widget in reversed(self.widgets):
-            if hasattr(widget, "feature") and not widget.disappeared:
+            if hasattr(widget, "feature") and not (widget.disappeared or widget.culled):
                 if widget.feature.get_method("<MouseWheel>")(event) and widget.capture_events:
                     event.x = 9999
 
+        if event.x == 9999:
+            return
+
+        # The nested canvas under the mouse pointer may not receive the event
+        # if it doesn't have focus, so route the event to it
+        for canvas in self.canvases:
+            x, y = event.x_root - canvas.winfo_rootx(), event.y_root - canvas.winfo_rooty()
+            if 0 <= x < canvas.winfo_width() and 0 <= y < canvas.winfo_height():
+                event.x, event.y = x, y
+                canvas.on_wheel(event, None)
+                event.x = 9999
+                break
+
     def on_key_press(self, event: tkinter.Event) -> None:
         """Events for typing."""
         for widget in reversed(self.widgets):
-            if hasattr(widget, "feature") and not widget.disappeared:
+            if hasattr(widget, "feature") and not (widget.disappeared or widget.culled):
                 if widget.feature.get_method("<KeyPress>")(event) and widget.capture_events:
                     event.x = 9999
 
     def on_key_release(self, event: tkinter.Event) -> None:
         """Events for typing."""
         for widget in reversed(self.widgets):
-            if hasattr(widget, "feature") and not widget.disappeared:
+            if hasattr(widget, "feature") and not (widget.disappeared or widget.culled):
                 if widget.feature.get_method("<KeyRelease>")(event) and widget.capture_events:
                     event.x = 9999
 
@@ -864,7 +1219,7 @@ class Canvas(tkinter.Canvas, Misc):
         """
         def handle_event(event: tkinter.Event) -> None:
             for widget in reversed(self.widgets):
-                if hasattr(widget, "feature"):
+                if hasattr(widget, "feature") and not widget.culled:
                     if widget.feature.get_method(name)(event) and widget.capture_events:
                         pass
 
@@ -913,3 +1268,152 @@ class Canvas(tkinter.Canvas, Misc):
         self._focus_widget.generate_event("<Motion>", event)
         self._focus_widget.generate_event("<Button-1>", event)
         self._focus_widget.generate_event("<ButtonRelease-1>", event)
+
+
+class ScrollableCanvas(Canvas):
+    """A ``Canvas`` whose contents are scrolled by its view.
+
+    The view is scrolled by ``tkinter`` instead of moving all the items, and
+    the coordinates of events are translated to the coordinates of the canvas
+    before they are dispatched to the widgets.
+    """
+
+    def __init__(
+        self,
+        master: Tk | Toplevel | Canvas | None = None,
+        *,
+        scroll_region: tuple[float, float, float, float] | None = None,
+        scroll_step: int = 60,
+        smooth: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Args:
+            master: parent widget.
+            scroll_region: the region that can be scrolled, (x1, y1, x2, y2).
+                ``None`` indicates the bounding box of all items, which is
+                computed every time the view is scrolled.
+            scroll_step: the distance scrolled by each notch of the mouse
+                wheel, in pixels.
+            smooth: whether to scroll smoothly with an animation.
+            kwargs: compatible with other parameters of class ``Canvas``.
+        """
+        super().__init__(master, **kwargs)
+
+        self.scroll_region = scroll_region
+        self.scroll_step = scroll_step
+        self.smooth = smooth
+
+        self._target: tuple[float, float] = 0, 0
+        self._scrolling: animations.Animation | None = None
+
+    def _get_region(self) -> tuple[float, float, float, float]:
+        """Get the region that can be scrolled and apply it."""
+        if self.scroll_region is not None:
+            region = self.scroll_region
+        else:
+            x1, y1, x2, y2 = self.bbox("all") or (0, 0, 0, 0)
+            region = min(x1, 0), min(y1, 0), max(x2, self.winfo_width()), max(y2, self.winfo_height())
+
+        self.configure(scrollregion=region)
+        return region
+
+    def _moveto(self, x: float, y: float, region: tuple[float, float, float, float]) -> None:
+        """Move the top left corner of the view to the coordinates at once."""
+        x1, y1, x2, y2 = region
+
+        if x2 > x1:
+            self.xview_moveto((x-x1) / (x2-x1))
+        if y2 > y1:
+            self.yview_moveto((y-y1) / (y2-y1))
+
+    def scroll_to(self, x: float, y: float, *, smooth: bool | None = None) -> None:
+        """Scroll the view so that its top left corner is at the coordinates.
+
+        Args:
+            x: x-coordinate of the canvas.
+            y: y-coordinate of the canvas.
+            smooth: whether to scroll smoothly, ``None`` indicates the value of
+                the attribute ``smooth``.
+        """
+        region = self._get_region()
+        x = min(max(x, region[0]), max(region[2] - self.winfo_width(), region[0]))
+        y = min(max(y, region[1]), max(region[3] - self.winfo_height(), region[1]))
+        self._target = x, y
+
+        if self._scrolling is not None:
+            self._scrolling.stop()
+            self._scrolling = None
+
+        if smooth is None:
+            smooth = self.smooth
+
+        if not smooth or not (duration := quality.scale_duration(200)):
+            self._moveto(x, y, region)
+            return
+
+        x0, y0 = self.canvasx(0), self.canvasy(0)
+        self._scrolling = animations.Animation(
+            duration, lambda p: self._moveto(x0 + (x-x0)*p, y0 + (y-y0)*p, region),
+            controller=controllers.ease_out, fps=60)
+        self._scrolling.start()
+
+    def scroll(self, dx: float = 0, dy: float = 0, *, smooth: bool | None = None) -> None:
+        """Scroll the view by pixels.
+
+        If the view is being scrolled smoothly, the distance is added to the
+        destination, so that scrolling quickly is accelerated.
+
+        Args:
+            dx: distance in the x direction.
+            dy: distance in the y direction.
+            smooth: whether to scroll smoothly, ``None`` indicates the value of
+                the attribute ``smooth``.
+        """
+        if self._scrolling is not None and self._scrolling.active:
+            x, y = self._target
+        else:
+            x, y = self.canvasx(0), self.canvasy(0)
+
+        self.scroll_to(x + dx, y + dy, smooth=smooth)
+
+    def _translate(self, event: tkinter.Event) -> None:
+        """Translate the coordinates of the event to the canvas coordinates."""
+        event.x, event.y = self.canvasx(event.x), self.canvasy(event.y)
+
+    @override
+    def on_motion(self, event: tkinter.Event, name: str) -> None:
+        self._translate(event)
+        return super().on_motion(event, name)
+
+    @override
+    def on_click(self, event: tkinter.Event, name: str) -> None:
+        self._translate(event)
+        return super().on_click(event, name)
+
+    @override
+    def on_release(self, event: tkinter.Event, name: str) -> None:
+        self._translate(event)
+        return super().on_release(event, name)
+
+    @override
+    def on_wheel(self, event: tkinter.Event, type_: bool | None) -> None:
+        self._translate(event)
+        super().on_wheel(event, type_)
+
+        if event.x == 9999:  # It is captured by a widget or a nested canvas
+            return
+
+        step = -self.scroll_step if event.delta > 0 else self.scroll_step
+
+        if int(event.state) & 0x0001:  # Shift
+            self.scroll(step, 0)
+        else:
+            self.scroll(0, step)
+
+    @override
+    def destroy(self) -> None:
+        if self._scrolling is not None:
+            self._scrolling.stop()
+
+        return super().destroy()
@@ -25,6 +25,7 @@ __all__ = (
     "Image",
     "Style",
     "Feature",
+    "WidgetRegistry",
     "Widget",
 )
 
@@ -37,12 +38,12 @@ import tkinter.font
 import traceback
 import types
 import warnings
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, Literal
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from typing_extensions import Self, override
 
-from ..animation import animations
+from ..animation import animations, quality
 from ..color import convert, rgb
 from ..theme import manager
 from . import configs
@@ -51,6 +52,23 @@ if TYPE_CHECKING:
     from ..toolbox import enhanced
     from . import containers
 
+_templates: dict[str, tuple[tuple[float, float], list[tuple[str, list[float], list[str], list[str]]]]] = {}
+"""Items recorded for each signature of elements, as (position of the recorded
+element, [(item type, coordinates, options, tags)])."""
+
+_MAX_TEMPLATES = 512
+"""The maximum number of recorded templates."""
+
+_ELEMENT_ATTRIBUTES = frozenset((
+    "widget", "gradient_animation", "position", "size", "name", "items",
+    "gradients", "visible", "kwargs", "_origin", "_style_tags"))
+"""Attributes of ``Element`` that do not affect the items of a ``Shape``."""
+
+
+def _quotable(word: str) -> bool:
+    """Whether a word can be quoted with braces in a Tcl script."""
+    return not any(char in word for char in "{}\\")
+
 
 class Element(abc.ABC):
     """The basic visible part of a ``virtual.Widget``."""
@@ -97,6 +115,13 @@ class Element(abc.ABC):
         self.gradients: list[animations.GradientItem] = []
         self.visible: bool = True
 
+        # Option names and style keys parsed from the tags of each item
+        self._style_tags: dict[int, tuple[list[str], list[str]]] = {}
+
+        # Geometry recorded by the first ``rescale``, as (position, size,
+        # ratios of the canvas that the geometry is based on)
+        self._origin: tuple[tuple[float, float], ...] | None = None
+
         self.kwargs = kwargs
 
         widget.register_elements(self)
@@ -109,6 +134,7 @@ class Element(abc.ABC):
             dy: y-coordinate offset.
         """
         self.position = self.position[0]+dx, self.position[1]+dy
+        self._origin = None
 
         for item in self.items:
             self.widget.master.move(item, dx, dy)
@@ -127,6 +153,7 @@ class Element(abc.ABC):
         for gradient in self.gradients:
             gradient.stop()
 
+        self.gradients.clear()
         self.widget.deregister_elements(self)
         self.widget.master.delete(*self.items)
 
@@ -188,10 +215,16 @@ class Element(abc.ABC):
         self.gradients.clear()
 
         bg = convert.str_to_rgb(self.widget.master.cget("bg"))
+        duration = quality.scale_duration(150)
 
         for item in self.items:
-            tags = self.widget.master.itemcget(item, "tags").split()
-            keys, args = tags[0:-1:2], tags[1:len(tags):2]
+            if (style_tags := self._style_tags.get(item)) is None:
+                # Tags of widgets are not part of the style data
+                tags = [tag for tag in self.widget.master.itemcget(item, "tags").split()
+                        if not tag.startswith("widget:")]
+                style_tags = self._style_tags[item] = tags[0:-1:2], tags[1:len(tags):2]
+
+            keys, args = style_tags
             values = (style.get(arg) for arg in args)
             kwargs = {k: v for k, v in zip(keys, values) if v is not None}
 
@@ -201,7 +234,7 @@ class Element(abc.ABC):
                     kwargs[key] = convert.rgb_to_hex(
                         convert.rgba_to_rgb(rgba_code, refer=bg))
 
-            if self.widget.gradient_animation and self.gradient_animation and gradient_animation:
+            if self.widget.gradient_animation and self.gradient_animation and gradient_animation and duration:
                 for key, value in kwargs.items():
                     start: str = self.widget.master.itemcget(item, key)
 
@@ -215,7 +248,7 @@ class Element(abc.ABC):
                         self.widget.master.itemconfigure(item, {key: value})
                     else:
                         self.gradients.append(animations.GradientItem(
-                            self.widget.master, item, key, (start, value), 150))
+                            self.widget.master, item, key, (start, value), duration))
             else:
                 self.widget.master.itemconfigure(item, kwargs)
 
@@ -274,6 +307,8 @@ class Element(abc.ABC):
         if zoom_position:
             self.position = self.position[0]*ratios[0], self.position[1]*ratios[1]
 
+        self._origin = None
+
         if not zoom_size:
             for item in self.items:
                 self.widget.master.moveto(
@@ -285,6 +320,31 @@ class Element(abc.ABC):
             for item in self.items:
                 self.widget.master.scale(item, 0, 0, *ratios)
 
+    def rescale(
+        self,
+        ratios: tuple[float, float],
+        previous: tuple[float, float],
+    ) -> None:
+        """Zoom the ``Element`` to the absolute ratios of the canvas.
+
+        Unlike ``zoom``, the geometry is computed from the one recorded at the
+        first call, so errors do not accumulate after zooming many times.
+
+        Args:
+            ratios: the absolute ratios of the canvas.
+            previous: the ratios of the canvas that the current geometry is
+                based on.
+        """
+        if self._origin is None:
+            self._origin = self.position, self.size, previous
+
+        origin = self._origin
+        (x, y), (w, h), (rx, ry) = origin
+        kx, ky = ratios[0]/rx, ratios[1]/ry
+
+        self.coords((w*kx, h*ky), (x*kx, y*ky))
+        self._origin = origin  # Method coords has cleared it
+
     @abc.abstractmethod
     def display(self) -> None:
         """Display the ``Element`` on a ``Canvas``."""
@@ -307,11 +367,94 @@ class Element(abc.ABC):
         if position is not None:
             self.position = position
 
+        self._origin = None
+
         # override this method to do something here
 
+    def template_key(self) -> str | None:
+        """Return the signature of the items of the ``Element``.
+
+        Elements with the same signature create the same items apart from an
+        offset of their position, so the items of the first one are recorded
+        and replayed for the others. ``None`` indicates no template.
+        """
+        return None
+
+    def record(self) -> None:
+        """Record the items of the ``Element`` as the template of its signature.
+
+        Nothing is recorded if the template already exists or some options
+        cannot be replayed.
+        """
+        if (key := self.template_key()) is None or key in _templates:
+            return
+
+        master = self.widget.master
+        records: list[tuple[str, list[float], list[str], list[str]]] = []
+
+        for item in self.items:
+            if (kind := master.type(item)) in ("window", "image", "bitmap"):
+                return  # Embedded widgets and images are not copied
+
+            options: list[str] = []
+            tags: list[str] = []
+
+            for config in master.tk.splitlist(master.tk.eval(f"{master} itemconfigure {item}")):
+                name, *_, default, current = master.tk.splitlist(config)
+
+                if name == "-tags":
+                    tags = [tag for tag in master.tk.splitlist(current) if not tag.startswith("widget:")]
+                elif current != default:
+                    options += name, current
+
+            if any(not _quotable(word) for word in options + tags):
+                return
+
+            records.append((kind, master.coords(item), options, tags))
+
+        if len(_templates) >= _MAX_TEMPLATES:
+            _templates.clear()
+
+        _templates[key] = self.position, records
+
+    def replay(self) -> bool:
+        """Create the items of the ``Element`` from the template of its signature.
+
+        All items are created at their final coordinates with a single call to
+        the Tcl interpreter. The tags of the widget are included.
+
+        Returns:
+            Whether there is a template to replay.
+        """
+        if (key := self.template_key()) is None or (template := _templates.get(key)) is None:
+            return False
+
+        master = self.widget.master
+        (x, y), records = template
+        dx, dy = self.position[0] - x, self.position[1] - y
+        commands: list[str] = []
+
+        for kind, coords, options, tags in records:
+            points = (str(value + (dy if i % 2 else dx)) for i, value in enumerate(coords))
+            words = (str(master), "create", kind, *points, *options, "-tags", " ".join((*tags, *self.widget.tags)))
+            commands.append(f"[{' '.join(f'{{{word}}}' for word in words)}]")
+
+        self.items = [int(item) for item in master.tk.splitlist(master.tk.eval(f"list {' '.join(commands)}"))]
+        return True
+
 
 class Shape(Element):
-    """The Shape of a ``Widget``."""
+    """The Shape of a ``Widget``.
+
+    Attributes:
+        templated (bool): whether the items of the shape are created from a
+            template, see method ``template_key``. It is only suitable for a
+            shape whose method ``display`` does nothing but create items and
+            whose method ``coords`` only moves them. It is not inherited, so a
+            subclass has to enable it by itself.
+    """
+
+    templated: ClassVar[bool] = False
 
     @override
     def zoom(
@@ -336,6 +479,22 @@ class Shape(Element):
 
         self.coords(self.size, self.position)
 
+    @override
+    def template_key(self) -> str | None:
+        """Return the signature of the items of the ``Shape``.
+
+        It consists of the class, the size, the extra attributes and parameters
+        of the shape. Coordinates are rounded half to even, so the parity of
+        the position is also part of it. ``None`` is returned unless the class
+        enables ``templated``.
+        """
+        if not vars(type(self)).get("templated", False):
+            return None
+
+        attributes = {k: v for k, v in vars(self).items() if k not in _ELEMENT_ATTRIBUTES}
+        parity = self.position[0] % 2, self.position[1] % 2
+        return repr((type(self), self.size, parity, attributes, self.kwargs))
+
 
 class Text(Element):
     """The Text of a ``Widget``."""
@@ -424,6 +583,17 @@ class Text(Element):
         self.font.config(size=round(self._initial_fontsize*math.sqrt(
             self.widget.master.ratios[0]*self.widget.master.ratios[1])))
 
+    @override
+    def rescale(
+        self,
+        ratios: tuple[float, float],
+        previous: tuple[float, float],
+    ) -> None:
+        super().rescale(ratios, previous)
+
+        self.font.config(size=round(
+            self._initial_fontsize*math.sqrt(ratios[0]*ratios[1])))
+
 
 class Image(Element):
     """The Image of a ``Widget``."""
@@ -492,6 +662,32 @@ class Image(Element):
         for item in self.items:
             self.widget.master.itemconfigure(item, image=self.image)
 
+    @override
+    def rescale(
+        self,
+        ratios: tuple[float, float],
+        previous: tuple[float, float],
+    ) -> None:
+        """Zoom the image to the absolute ratios of the canvas.
+
+        Args:
+            ratios: the absolute ratios of the canvas.
+            previous: the ratios of the canvas that the current geometry is
+                based on.
+
+        Raises:
+            RuntimeError: if the image is empty.
+        """
+        super().rescale(ratios, previous)
+
+        if self.initial_image is None:
+            raise RuntimeError("Image is empty.")
+
+        self.image = self.initial_image.scale(*ratios)
+
+        for item in self.items:
+            self.widget.master.itemconfigure(item, image=self.image)
+
 
 class Style:
     """The styles of a ``Widget``.
@@ -641,8 +837,7 @@ class Style:
             if self.light is not self.__class__.light:
                 del self.light
 
-        for element in self.widget.elements:
-            element.update()
+        self.widget.invalidate()
 
     def detach(self) -> Self:
         """Detach the style data from the class data."""
@@ -765,6 +960,164 @@ class Feature:
         return wrapper
 
 
+class WidgetRegistry:
+    """An ordered collection of widgets.
+
+    The widgets are grouped by stacking layers, and the order is the z-order of
+    the widgets: layers from the bottom to the top, and the widgets of a layer
+    from the bottom to the top. Events are dispatched in the reverse order.
+    Appending, removal, membership test and lifting are all O(1). Iteration
+    uses a snapshot which is only rebuilt after changes, so the registry can be
+    changed while it is iterated over.
+    """
+
+    def __init__(
+        self,
+        widgets: Iterable[Widget] = (),
+        /,
+        *,
+        layers: Iterable[str] = ("content",),
+        default: str = "content",
+    ) -> None:
+        """
+        Args:
+            widgets: the initial widgets, they are added to the default layer.
+            layers: names of the layers, from the bottom to the top.
+            default: name of the layer that widgets are added to by default.
+
+        Raises:
+            ValueError: if the default layer is not one of the layers.
+        """
+        self._layers: dict[str, dict[Widget, None]] = {name: {} for name in layers}
+        self._where: dict[Widget, str] = {}
+        self._snapshot: tuple[Widget, ...] | None = None
+
+        if default not in self._layers:
+            raise ValueError(f"Layer {default!r} is not one of the layers.")
+
+        self._default = default
+
+        for widget in widgets:
+            self.append(widget)
+
+    @property
+    def layers(self) -> tuple[str, ...]:
+        """Names of the layers, from the bottom to the top."""
+        return tuple(self._layers)
+
+    def _get_snapshot(self) -> tuple[Widget, ...]:
+        """Get the widgets as a tuple, it is cached until the next change."""
+        if self._snapshot is None:
+            self._snapshot = tuple(
+                widget for widgets in self._layers.values() for widget in widgets)
+
+        return self._snapshot
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, widget: object) -> bool:
+        return widget in self._where
+
+    def __iter__(self) -> Iterator[Widget]:
+        return iter(self._get_snapshot())
+
+    def __reversed__(self) -> Iterator[Widget]:
+        return reversed(self._get_snapshot())
+
+    def __getitem__(self, index: int) -> Widget:
+        return self._get_snapshot()[index]
+
+    def index(self, widget: Widget) -> int:
+        """Return the index of a widget.
+
+        Args:
+            widget: the widget to be found.
+
+        Raises:
+            ValueError: if the widget is not in the registry.
+        """
+        return self._get_snapshot().index(widget)
+
+    def layer(self, widget: Widget) -> str:
+        """Return the name of the layer that a widget is in.
+
+        Args:
+            widget: the widget to be found.
+
+        Raises:
+            ValueError: if the widget is not in the registry.
+        """
+        try:
+            return self._where[widget]
+        except KeyError:
+            raise ValueError(f"{widget!r} is not in the registry.") from None
+
+    def append(self, widget: Widget, layer: str | None = None) -> None:
+        """Add a widget to the top of a layer, nothing happens if it already
+        exists.
+
+        Args:
+            widget: the widget to be added.
+            layer: name of the layer, ``None`` indicates the default layer.
+
+        Raises:
+            ValueError: if the layer does not exist.
+        """
+        if widget in self._where:
+            return
+
+        if layer is None:
+            layer = self._default
+        elif layer not in self._layers:
+            raise ValueError(f"Layer {layer!r} does not exist.")
+
+        self._layers[layer][widget] = None
+        self._where[widget] = layer
+        self._snapshot = None
+
+    def remove(self, widget: Widget) -> None:
+        """Remove a widget.
+
+        Args:
+            widget: the widget to be removed.
+
+        Raises:
+            ValueError: if the widget is not in the registry.
+        """
+        del self._layers[self.layer(widget)][widget]
+        del self._where[widget]
+        self._snapshot = None
+
+    def lift(self, widget: Widget, layer: str | None = None) -> None:
+        """Move a widget to the top of a layer.
+
+        Args:
+            widget: the widget to be moved.
+            layer: name of the layer, ``None`` indicates the current layer of
+                the widget.
+
+        Raises:
+            ValueError: if the widget is not in the registry or the layer does
+                not exist.
+        """
+        if layer is None:
+            layer = self.layer(widget)
+        elif layer not in self._layers:
+            raise ValueError(f"Layer {layer!r} does not exist.")
+
+        self.remove(widget)
+        self.append(widget, layer)
+
+    def clear(self) -> None:
+        """Remove all widgets."""
+        for widgets in self._layers.values():
+            widgets.clear()
+
+        self._where.clear()
+        self._snapshot = None
+
+
 class Widget:
     """Base Widget Class.
 
@@ -800,6 +1153,8 @@ class Widget:
         if isinstance(master, Widget):
             self.master, self.widget = master.master, master
             self.widget.widgets.append(self)
+            self.layer: str = master.layer
+            self.tags: tuple[str, ...] = (f"widget:{id(self)}", *master.tags)
             self.position: tuple[float, float] = (
                 master.position[0] + position[0],
                 master.position[1] + position[1],
@@ -807,6 +1162,8 @@ class Widget:
             self.size: tuple[float, float] = master.size if size is None else size
         else:
             self.master, self.widget = master, None
+            self.layer: str = "content"
+            self.tags: tuple[str, ...] = (f"widget:{id(self)}",)
             self.position: tuple[float, float] = position
             self.size: tuple[float, float] = (0, 0) if size is None else size
 
@@ -828,7 +1185,7 @@ class Widget:
         else:
             self.auto_update = auto_update
 
-        self.widgets: list[Widget] = []
+        self.widgets = WidgetRegistry()
         self.texts: list[Text] = []
         self.shapes: list[Shape] = []
         self.images: list[Image] = []
@@ -838,10 +1195,17 @@ class Widget:
         self.state: str = "normal"
         self.state_before_disabled: str = ""
         self.disappeared: bool = False
+        self.culled: bool = False
+
+        self._stale: bool = False  # Whether it was updated while culled
 
         self._update_hooks: list[Callable[[str, bool], Any]] = []
 
-        self.master.widgets.append(self)
+        # Geometry recorded by the first ``rescale``, as (position, size,
+        # ratios of the canvas that the geometry is based on)
+        self._origin: tuple[tuple[float, float], ...] | None = None
+
+        self.master.widgets.append(self, self.layer)
 
     @property
     def elements(self) -> tuple[Element, ...]:
@@ -888,9 +1252,23 @@ class Widget:
             elif isinstance(element, Image):
                 self.images.append(element)
 
-            element.display()
-            element.coords()
-            element.update(gradient_animation=True)
+            if not element.replay():
+                element.display()
+
+                for item in element.items:
+                    for tag in self.tags:
+                        self.master.addtag_withtag(tag, item)
+
+                element.coords()
+                element.record()
+
+            if self.master.constructing:
+                # It is placed in its layer and painted once at the end
+                self.master.schedule_build(self)
+            else:
+                # All items of the widget are in the same layer
+                self.master.place_in_layer(self.tags[0], self.layer)
+                element.update(gradient_animation=True)
 
     def deregister_elements(self, *elements: Element) -> None:
         """Deregister a element from the widget.
@@ -923,6 +1301,14 @@ class Widget:
         if state != "disabled" and self.state_before_disabled:
             return  # It is currently disabled
 
+        if self.culled:
+            # The style is applied when the widget is visible again
+            if state is not None:
+                self.state = state
+
+            self._stale = True
+            return
+
         if gradient_animation is None:
             gradient_animation = self.gradient_animation
 
@@ -930,6 +1316,14 @@ class Widget:
             for widget in self.children:
                 widget.update(state, gradient_animation=gradient_animation)
 
+        if self.master.frozen:
+            # The style is applied when the Canvas is thawed
+            if state is not None:
+                self.state = state
+
+            self.master.schedule_repaint(self)
+            return
+
         for element in self.elements:
             element.update(state, gradient_animation=gradient_animation)
 
@@ -944,6 +1338,15 @@ class Widget:
             except Exception as exc:  # pylint: disable=W0718
                 traceback.print_exception(exc)
 
+    def invalidate(self) -> None:
+        """Mark the widget as needing a repaint.
+
+        Unlike method ``update``, the widget is not repainted immediately, but
+        once when the event loop is idle, no matter how many times it is
+        invalidated before that.
+        """
+        self.master.schedule_repaint(self)
+
     def bind_on_update(
         self,
         command: Callable[[str, bool], Any],
@@ -1070,26 +1473,72 @@ class Widget:
     def forget(self, value: bool = True, /) -> None:
         """Let all elements of the widget to forget.
 
+        Args:
+            value: whether to forget the widget.
+        """
+        self._forget(value)
+        animations.Animation.update_visibility()
+
+    def _forget(self, value: bool) -> None:
+        """Let all elements of the widget and its descendants to forget.
+
         Args:
             value: whether to forget the widget.
         """
         self.disappeared = value
 
         for widget in self.children:
-            widget.forget(value)
+            widget._forget(value)
 
         for element in self.elements:
             element.forget(value)
 
-    def lift(self) -> None:
-        """Lift the widget to the top."""
-        self.master.widgets.remove(self)
-        self.master.widgets.append(self)
-        for element in self.elements:
-            for item in tuple(element.items):
-                self.master.tag_raise(item)
+    def cull(self, value: bool = True, /) -> None:
+        """Cull the widget, which is skipped for styling and events.
+
+        In general, you don't need to call this method, it is called by the
+        method ``cull`` of the canvas when ``cull_margin`` of it is enabled.
+
+        Args:
+            value: whether to cull the widget.
+        """
+        self.culled = value
+
         for widget in self.children:
-            widget.lift()
+            widget.cull(value)
+
+        if not value and self._stale:
+            self._stale = False
+            self.update(self.state, gradient_animation=False)
+
+    def lift(self, layer: str | None = None) -> None:
+        """Lift the widget to the top of a stacking layer.
+
+        Args:
+            layer: name of the layer, ``None`` indicates the current layer of
+                the widget. Its child widgets are moved to the layer too.
+
+        Raises:
+            ValueError: if the layer does not exist.
+        """
+        if layer is None:
+            layer = self.layer
+
+        self._lift(layer)
+        # All items of the widget and its child widgets have the first tag
+        self.master.place_in_layer(self.tags[0], layer)
+
+    def _lift(self, layer: str) -> None:
+        """Lift the widget and its child widgets in the registry of the master.
+
+        Args:
+            layer: name of the layer.
+        """
+        self.master.widgets.lift(self, layer)
+        self.layer = layer
+
+        for widget in self.children:
+            widget._lift(layer)  # pylint: disable=W0212
 
     def move(self, dx: float, dy: float) -> None:
         """Move the widget.
@@ -1099,6 +1548,7 @@ class Widget:
             dy: y-coordinate offset.
         """
         self.position = self.position[0]+dx, self.position[1]+dy
+        self._origin = None
 
         for widget in self.children:
             widget.move(dx, dy)
@@ -1106,6 +1556,8 @@ class Widget:
         for element in self.elements:
             element.move(dx, dy)
 
+        self.master.cull(self)
+
     def moveto(self, x: float, y: float) -> None:
         """Move the Widget to a certain position.
 
@@ -1128,6 +1580,7 @@ class Widget:
         for element in self.elements:
             element.destroy()
 
+        animations.Animation.stop_owned(self)
         self.__dict__.clear()
 
     def exists(self) -> bool:
@@ -1184,6 +1637,8 @@ class Widget:
         if zoom_position:
             self.position = self.position[0]*ratios[0], self.position[1]*ratios[1]
 
+        self._origin = None
+
         for widget in self.children:
             widget.zoom(
                 ratios, zoom_position=zoom_position, zoom_size=zoom_size)
@@ -1192,6 +1647,34 @@ class Widget:
             element.zoom(
                 ratios, zoom_position=zoom_position, zoom_size=zoom_size)
 
+    def rescale(
+        self,
+        ratios: tuple[float, float],
+        previous: tuple[float, float],
+    ) -> None:
+        """Zoom the widget to the absolute ratios of its canvas.
+
+        Unlike ``zoom``, the geometry is computed from the one recorded at the
+        first call, so errors do not accumulate after zooming many times.
+
+        Args:
+            ratios: the absolute ratios of the canvas.
+            previous: the ratios of the canvas that the current geometry is
+                based on.
+        """
+        if self._origin is None:
+            self._origin = self.position, self.size, previous
+
+        (x, y), (w, h), (rx, ry) = self._origin
+        kx, ky = ratios[0]/rx, ratios[1]/ry
+        self.position, self.size = (x*kx, y*ky), (w*kx, h*ky)
+
+        for widget in self.children:
+            widget.rescale(ratios, previous)
+
+        for element in self.elements:
+            element.rescale(ratios, previous)
+
     def resize(self, size: tuple[float, float] | None = None) -> None:
         """Resize the widget.
 
@@ -1201,9 +1684,11 @@ class Widget:
         # override this method to do something here
         if size is not None:
             self.size = size
+            self._origin = None
             position = self.position[0] - self.offset[0], \
                 self.position[1] - self.offset[1]
         else:
             position = None
         for element in self.elements:
             element.coords(size, position)
+        self.master.cull(self)
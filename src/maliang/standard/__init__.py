@@ -3,5 +3,50 @@
 
 """All standard things."""
 
-from .dialogs import *
-from .widgets import *
+import typing as _typing
+
+from .._lazy import attach as _attach
+
+__all__, __getattr__, __dir__ = _attach(__name__, {
+    ".dialogs": (
+        "TkMessage",
+        "TkColorChooser",
+        "TkFontChooser",
+    ),
+    ".widgets": (
+        "Text",
+        "Image",
+        "Label",
+        "Button",
+        "Switch",
+        "InputBox",
+        "ToggleButton",
+        "CheckBox",
+        "RadioBox",
+        "ProgressBar",
+        "UnderlineButton",
+        "HighlightButton",
+        "IconButton",
+        "Slider",
+        "SegmentedButton",
+        "SpinBox",
+        "OptionButton",
+        "ComboBox",
+        "Spinner",
+        "Tooltip",
+        "VirtualList",
+        "VirtualGrid",
+    ),
+}, {
+    "dialogs": ".dialogs",
+    "features": ".features",
+    "images": ".images",
+    "shapes": ".shapes",
+    "styles": ".styles",
+    "texts": ".texts",
+    "widgets": ".widgets",
+})
+
+if _typing.TYPE_CHECKING:
+    from .dialogs import *
+    from .widgets import *
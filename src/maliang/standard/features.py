@@ -21,6 +21,8 @@ __all__ = (
     "SliderFeature",
     "SegmentedButtonFeature",
     "SpinBoxFeature",
+    "VirtualListFeature",
+    "VirtualGridFeature",
 )
 
 from collections.abc import Callable
@@ -301,12 +303,10 @@ class RadioBoxFeature(ButtonFeature):
                 if self.widget.get():
                     return flag
 
-                for radio_box in tuple(self.widget.groups):
-                    if radio_box.get():
-                        radio_box.set(False, callback=True)
+                group = self.widget.selection_group
+                group.select(group.index(self.widget), callback=True)
 
-                boolean = not self.widget.get()
-                self.widget.set(boolean)
+                boolean = self.widget.get()
                 self.widget.update(f"hover-{'on' if boolean else 'off'}")
                 if self.command is not None:
                     self.command(boolean)
@@ -498,7 +498,11 @@ class SliderFeature(virtual.Feature):
             delta = next_value - temp_value
             animations.Animation(
                 150, lambda k: self.widget.set(temp_value + delta*k, callback=True),
-                controller=controllers.smooth, fps=60).start()
+                controller=controllers.smooth, fps=60, end=self._end_jump).start()
+
+    def _end_jump(self) -> None:
+        if self.widget.exists() and self.widget.state != "active":
+            self.widget.callback_policy.release()
 
     def _b_1_motion(self, event: tkinter.Event, /) -> bool:
         if self._temp_position is not None:
@@ -514,6 +518,7 @@ class SliderFeature(virtual.Feature):
         if self.widget.state == "active":
             self._temp_position = None
             self.widget.update("hover")
+            self.widget.callback_policy.release()
 
 
 class SegmentedButtonFeature(virtual.Feature):
@@ -546,3 +551,25 @@ class SpinBoxFeature(virtual.Feature):
         if flag := self.widget.children[0].state == "active":
             self.command(event.delta > 0)
         return flag
+
+
+class VirtualListFeature(virtual.Feature):
+    """Feature of VirtualList."""
+
+    def _mouse_wheel(self, event: tkinter.Event, /) -> bool:
+        if flag := self.widget.detect(event.x, event.y):
+            self.widget.scroll(-1 if event.delta > 0 else 1)
+        return flag
+
+
+class VirtualGridFeature(virtual.Feature):
+    """Feature of VirtualGrid."""
+
+    def _mouse_wheel(self, event: tkinter.Event, /) -> bool:
+        if flag := self.widget.detect(event.x, event.y):
+            count = -1 if event.delta > 0 else 1
+            if int(event.state) & 0x0001:  # Shift
+                self.widget.scroll(columns=count)
+            else:
+                self.widget.scroll(count)
+        return flag
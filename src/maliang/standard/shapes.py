@@ -30,6 +30,8 @@ from ..core import virtual
 class Line(virtual.Shape):
     """Create a line for a widget."""
 
+    templated = True
+
     def __init__(
         self,
         widget: virtual.Widget,
@@ -52,6 +54,8 @@ class Line(virtual.Shape):
             kwargs: extra parameters for CanvasItem.
         """
         self.points = [] if points is None else points
+        # Points that the geometry recorded by the first ``rescale`` is based on
+        self._origin_points = self.points
         super().__init__(
             widget, relative_position, size,
             name=name, gradient_animation=gradient_animation, **kwargs)
@@ -75,10 +79,33 @@ class Line(virtual.Shape):
 
         self.widget.master.coords(self.items[0], *points)
 
+    @override
+    def rescale(
+        self,
+        ratios: tuple[float, float],
+        previous: tuple[float, float],
+    ) -> None:
+        """Zoom the ``Line`` to the absolute ratios of the canvas.
+
+        Args:
+            ratios: the absolute ratios of the canvas.
+            previous: the ratios of the canvas that the current geometry is
+                based on.
+        """
+        if self._origin is None:
+            self._origin_points = self.points
+
+        rx, ry = previous if self._origin is None else self._origin[2]
+        kx, ky = ratios[0]/rx, ratios[1]/ry
+        self.points = [(x*kx, y*ky) for x, y in self._origin_points]
+        super().rescale(ratios, previous)
+
 
 class Rectangle(virtual.Shape):
     """Create a rectangle for a widget."""
 
+    templated = True
+
     @override
     def display(self) -> None:
         """Display the ``Element`` on a ``Canvas``."""
@@ -100,6 +127,8 @@ class Rectangle(virtual.Shape):
 class Oval(virtual.Shape):
     """Create a oval for a widget"""
 
+    templated = True
+
     @override
     def display(self) -> None:
         """Display the ``Element`` on a ``Canvas``."""
@@ -127,6 +156,8 @@ class Oval(virtual.Shape):
 class Arc(virtual.Shape):
     """Create a arc for a widget."""
 
+    templated = True
+
     @override
     def display(self) -> None:
         """Display the ``Element`` on a ``Canvas``."""
@@ -148,6 +179,8 @@ class Arc(virtual.Shape):
 class RegularPolygon(virtual.Shape):
     """Create a regular polygon for a widget."""
 
+    templated = True
+
     def __init__(
         self,
         widget: virtual.Widget,
@@ -207,6 +240,8 @@ class RegularPolygon(virtual.Shape):
 class RoundedRectangle(virtual.Shape):
     """Create a rounded rectangle for a widget."""
 
+    templated = True
+
     def __init__(
         self,
         widget: virtual.Widget,
@@ -306,6 +341,8 @@ class RoundedRectangle(virtual.Shape):
 class HalfRoundedRectangle(virtual.Shape):
     """Create a half rounded rectangle for a widget."""
 
+    templated = True
+
     def __init__(
         self,
         widget: virtual.Widget,
@@ -417,6 +454,8 @@ class HalfRoundedRectangle(virtual.Shape):
 class SemicircularRectangle(virtual.Shape):
     """Create a semicircular rectangle for a widget."""
 
+    templated = True
+
     @override
     def display(self) -> None:
         """Display the ``Element`` on a ``Canvas``."""
@@ -483,6 +522,8 @@ class SemicircularRectangle(virtual.Shape):
 class SharpRectangle(virtual.Shape):
     """Create a sharp rectangle for a widget."""
 
+    templated = True
+
     def __init__(
         self,
         widget: virtual.Widget,
@@ -558,6 +599,8 @@ class SharpRectangle(virtual.Shape):
 class Parallelogram(virtual.Shape):
     """Create a parallelogram for a widget."""
 
+    templated = True
+
     def __init__(
         self,
         widget: virtual.Widget,
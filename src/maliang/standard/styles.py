@@ -23,6 +23,8 @@ __all__ = (
     "TooltipStyle",
     "SpinnerStyle",
     "UnderlineButtonStyle",
+    "VirtualListStyle",
+    "VirtualGridStyle",
 )
 
 import copy
@@ -73,7 +75,7 @@ class TextStyle(virtual.Style):
             fg: The foreground color of the widget.
         """
         self._set(theme, fg, fill=-1)
-        self.widget.update()
+        self.widget.invalidate()
 
 
 class LabelStyle(virtual.Style):
@@ -139,7 +141,7 @@ class LabelStyle(virtual.Style):
         self._set(theme, fg, fill=-1)
         self._set(theme, bg, fill=0)
         self._set(theme, ol, outline=0)
-        self.widget.update()
+        self.widget.invalidate()
 
 
 class ButtonStyle(LabelStyle):
@@ -322,7 +324,7 @@ class SwitchStyle(virtual.Style):
         self._set(theme, ol_slot, outline=("Rectangle.out", "SemicircularRectangle"))
         self._set(theme, bg_dot, fill=("Rectangle.in", "Oval"))
         self._set(theme, ol_dot, fill=("Rectangle.in", "Oval"))
-        self.widget.update()
+        self.widget.invalidate()
 
 
 class InputBoxStyle(virtual.Style):
@@ -407,7 +409,7 @@ class InputBoxStyle(virtual.Style):
         self._set(theme, bg, fill=("Rectangle", "RoundedRectangle.in"))
         self._set(theme, ol, outline=("Rectangle", "RoundedRectangle.in"))
         self._set(theme, bg_bar, fill="RoundedRectangle.out", outline="RoundedRectangle.out")
-        self.widget.update()
+        self.widget.invalidate()
 
 
 class ToggleButtonStyle(virtual.Style):
@@ -502,7 +504,7 @@ class ToggleButtonStyle(virtual.Style):
         self._set(theme, fg, fill=-1)
         self._set(theme, bg, fill=0)
         self._set(theme, ol, outline=0)
-        self.widget.update()
+        self.widget.invalidate()
 
 
 class CheckBoxStyle(ToggleButtonStyle):
@@ -657,7 +659,7 @@ class RadioBoxStyle(virtual.Style):
         self._set(theme, ol_box, outline=0)
         self._set(theme, bg_dot, fill=1)
         self._set(theme, ol_dot, outline=1)
-        self.widget.update()
+        self.widget.invalidate()
 
 
 class ProgressBarStyle(virtual.Style):
@@ -734,7 +736,7 @@ class ProgressBarStyle(virtual.Style):
         self._set(theme, ol_slot, outline=0)
         self._set(theme, bg_bar, fill=1)
         self._set(theme, ol_bar, outline=1)
-        self.widget.update()
+        self.widget.invalidate()
 
 
 class UnderlineButtonStyle(TextStyle):
@@ -931,7 +933,7 @@ class SliderStyle(virtual.Style):
         self._set(theme, bg_pnt, fill=2, outline=2)
         self._set(theme, bg_dot, fill="Oval.in", outline="Oval.in")
         # Only works on Windows11 theme, compatible with other themes
-        self.widget.update()
+        self.widget.invalidate()
 
 
 class SegmentedButtonStyle(virtual.Style):
@@ -986,7 +988,7 @@ class SegmentedButtonStyle(virtual.Style):
         """
         self._set(theme, bg, fill=0)
         self._set(theme, ol, outline=0)
-        self.widget.update()
+        self.widget.invalidate()
 
 
 class ToggleButtonStyle4SB(ToggleButtonStyle):
@@ -1010,6 +1012,81 @@ class ToggleButtonStyle4SB(ToggleButtonStyle):
         dark[element]["normal-off"].update({"fill": dark_bg, "outline": dark_bg})
 
 
+class VirtualListStyle(SegmentedButtonStyle):
+    """Style of VirtualList.
+
+    Attributes:
+        states (tuple[str, ...]): all states of the widget.
+        light (dict[str, dict[str, dict[str, str]]]):
+            The light theme style dictionary.
+        dark (dict[str, dict[str, dict[str, str]]]):
+            The dark theme style dictionary.
+    """
+
+    light = copy.deepcopy(SegmentedButtonStyle.light)
+    dark = copy.deepcopy(SegmentedButtonStyle.dark)
+
+
+class VirtualGridStyle(virtual.Style):
+    """Style of VirtualGrid.
+
+    Attributes:
+        states (tuple[str, ...]): all states of the widget.
+        light (dict[str, dict[str, dict[str, str]]]):
+            The light theme style dictionary.
+        dark (dict[str, dict[str, dict[str, str]]]):
+            The dark theme style dictionary.
+    """
+
+    light: dict[str, dict[str, dict[str, str]]] = {
+        "Rectangle": {
+            "normal": {"fill": "#FBFBFB", "outline": "#DCDCDC"},
+        },
+        "Rectangle.cell": {
+            "normal": {"fill": "#FBFBFB", "outline": "#E5E5E5"},
+        },
+        "Information.cell": {
+            "normal": {"fill": "#1A1A1A"},
+        },
+    }
+
+    dark: dict[str, dict[str, dict[str, str]]] = {
+        "Rectangle": {
+            "normal": {"fill": "#2B2B2B", "outline": "#3D3D3D"},
+        },
+        "Rectangle.cell": {
+            "normal": {"fill": "#2B2B2B", "outline": "#383838"},
+        },
+        "Information.cell": {
+            "normal": {"fill": "#F1F1F1"},
+        },
+    }
+
+    @override
+    def set(
+        self,
+        theme: Literal["light", "dark"] | None = None,
+        *,
+        fg: tuple[str | types.EllipsisType, ...] | str | None = None,
+        bg: tuple[str | types.EllipsisType, ...] | str | None = None,
+        ol: tuple[str | types.EllipsisType, ...] | str | None = None,
+    ) -> None:
+        """Set the style of the widget.
+
+        states: ``"normal"``
+
+        Args:
+            theme: the theme name, None indicates both.
+            fg: the foreground color of the cells.
+            bg: the background color of the widget and the cells.
+            ol: the color of the grid lines.
+        """
+        self._set(theme, fg, fill="Information.cell")
+        self._set(theme, bg, fill=("Rectangle", "Rectangle.cell"))
+        self._set(theme, ol, outline="Rectangle.cell")
+        self.widget.invalidate()
+
+
 class OptionButtonStyle(virtual.Style):
     """Style of OptionButton.
 
@@ -1066,7 +1143,7 @@ class OptionButtonStyle(virtual.Style):
         """
         self._set(theme, bg, fill=0)
         self._set(theme, ol, outline=0)
-        self.widget.update()
+        self.widget.invalidate()
 
 
 class SpinnerStyle(virtual.Style):
@@ -1117,7 +1194,7 @@ class SpinnerStyle(virtual.Style):
         """
         self._set(theme, fg, outline=0)
         self._set(theme, bg, outline=1)
-        self.widget.update()
+        self.widget.invalidate()
 
 
 class TooltipStyle(virtual.Style):
@@ -1177,4 +1254,4 @@ class TooltipStyle(virtual.Style):
         self._set(theme, fg, fill=-1)
         self._set(theme, bg, fill=0)
         self._set(theme, ol, outline=0)
-        self.widget.update()
+        self.widget.invalidate()
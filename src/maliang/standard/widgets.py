@@ -26,27 +26,35 @@ __all__ = (
     "ComboBox",
     "Spinner",
     "Tooltip",
+    "VirtualList",
+    "VirtualGrid",
 )
 
+import abc
 import contextlib
 import decimal
 import itertools
 import math
 import warnings
-from collections.abc import Callable
+import weakref
+import tkinter.font
+from collections.abc import Callable, Iterable, Sequence
 from typing import TYPE_CHECKING, Any, Literal
 
 from typing_extensions import override
 
 from ..animation import animations, controllers
 from ..core import configs, virtual
-from ..toolbox import utility
+from ..toolbox import callbacks, models, scheduler, utility
 from . import features, images, shapes, styles, texts
 
 if TYPE_CHECKING:
     from ..core import containers
     from ..toolbox import enhanced
 
+_shared_tooltips: weakref.WeakKeyDictionary[containers.Canvas, Tooltip] = weakref.WeakKeyDictionary()
+"""The tooltips that display the texts of the shared tooltips of each canvas."""
+
 
 class Text(virtual.Widget):
     """Text widget, generally used to display plain text."""
@@ -666,6 +674,7 @@ class ToggleButton(virtual.Widget):
             self, text=text, family=family, fontsize=fontsize, weight=weight, slant=slant,
             underline=underline, overstrike=overstrike, justify=justify)
         self.feature = features.ToggleButtonFeature(self, command=command)
+        self.selection_group: models.SelectionGroup | None = None
         if default is not None:
             self.set(default)
 
@@ -680,6 +689,8 @@ class ToggleButton(virtual.Widget):
         if self.get() == bool(value):
             return
         self.update(f"{self.state.split('-', maxsplit=1)[0]}-{'on' if value else 'off'}")
+        if self.selection_group is not None:
+            self.selection_group.notify(self, bool(value))
 
 
 class RadioBox(virtual.Widget):
@@ -715,7 +726,6 @@ class RadioBox(virtual.Widget):
             auto_update: whether the theme manager update it automatically.
             style: style of the widget.
         """
-        self.groups: list[RadioBox] = [self]
         super().__init__(
             master, position, (length, length), anchor=anchor,
             capture_events=capture_events, gradient_animation=gradient_animation,
@@ -737,9 +747,15 @@ class RadioBox(virtual.Widget):
         if image is not None:
             images.StillImage(self, image=image)
         self.feature = features.RadioBoxFeature(self, command=command)
+        self.selection_group = models.SelectionGroup((self,))
         if default is not None:
             self.set(default)
 
+    @property
+    def groups(self) -> tuple[RadioBox, ...]:
+        """All radio boxes in the group of the radio box."""
+        return self.selection_group.members
+
     def get(self) -> bool:
         """Get the state of the radio button."""
         return self.shapes[1].visible
@@ -749,10 +765,9 @@ class RadioBox(virtual.Widget):
         if callback and self.feature.command is not None:
             self.feature.command(value)
         if self.get() == bool(value):
-            return None
-        if value:
-            return self.shapes[1].forget(False)
-        return self.shapes[1].forget()
+            return
+        self.shapes[1].forget(not value)
+        self.selection_group.notify(self, bool(value))
 
     def group(self, *radio_boxes: RadioBox) -> None:
         """Combine other radio boxes.
@@ -761,11 +776,12 @@ class RadioBox(virtual.Widget):
             radio_boxes: other radio boxes.
         """
         for radio_box in radio_boxes:
-            if radio_box in self.groups:
+            if radio_box in self.selection_group:
                 continue
 
-            self.groups.append(radio_box)
-            radio_box.groups = self.groups
+            radio_box.selection_group.remove(radio_box)
+            self.selection_group.add(radio_box)
+            radio_box.selection_group = self.selection_group
 
 
 class ProgressBar(virtual.Widget):
@@ -779,6 +795,8 @@ class ProgressBar(virtual.Widget):
         *,
         default: float | None = None,
         command: Callable[[float], Any] | None = None,
+        callback_policy: Literal["immediate", "throttle", "debounce", "release"] = "immediate",
+        callback_interval: int = 100,
         image: enhanced.PhotoImage | None = None,
         anchor: Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
         capture_events: bool | None = None,
@@ -794,6 +812,11 @@ class ProgressBar(virtual.Widget):
             default: default value of the widget
             command: a function that is triggered when the progress of progress
                 bar is 100%.
+            callback_policy: when the command is called as the value changes,
+                see ``callbacks.CallbackPolicy`` for details. A pending call is
+                made when the progress reaches 100% or the widget is destroyed.
+            callback_interval: interval of throttling and debouncing the
+                command, in milliseconds.
             image: image of the widget.
             anchor: anchor of the widget.
             capture_events: whether detect another widget under the widget.
@@ -823,6 +846,9 @@ class ProgressBar(virtual.Widget):
         self.feature = features.ProgressBarFeature(self)
         self.shapes[1].forget()
         self.command = command
+        self.callback_policy = callbacks.CallbackPolicy(
+            lambda value: None if self.command is None else self.command(value), callback_policy,
+            interval=callback_interval, master=self.master)
         if default is not None:
             self.set(default)
 
@@ -834,7 +860,9 @@ class ProgressBar(virtual.Widget):
         """Set the progress of the progress bar."""
         self.value = 0 if value < 0 else 1 if value > 1 else value
         if callback and self.command is not None:
-            self.command(value)
+            self.callback_policy(value)
+            if self.value == 1:
+                self.callback_policy.release()
         if self.value == 0:
             return self.shapes[1].forget()
         if not self.shapes[1].visible:
@@ -850,6 +878,12 @@ class ProgressBar(virtual.Widget):
 
         return None
 
+    @override
+    def destroy(self) -> None:
+        """Destroy the widget, a pending call of the command is made first."""
+        self.callback_policy.release()
+        return super().destroy()
+
 
 class UnderlineButton(virtual.Widget):
     """Underline button, generally used to display web links."""
@@ -1058,6 +1092,8 @@ class Slider(virtual.Widget):
         *,
         default: float | None = None,
         command: Callable[[float], Any] | None = None,
+        callback_policy: Literal["immediate", "throttle", "debounce", "release"] = "immediate",
+        callback_interval: int = 100,
         anchor: Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
         capture_events: bool | None = None,
         gradient_animation: bool | None = None,
@@ -1071,6 +1107,11 @@ class Slider(virtual.Widget):
             size: size of the widget.
             default: default value of the widget.
             command: a function that is triggered when the button is pressed.
+            callback_policy: when the command is called as the value changes,
+                see ``callbacks.CallbackPolicy`` for details. A pending call is
+                made when the slider is released or the widget is destroyed.
+            callback_interval: interval of throttling and debouncing the
+                command, in milliseconds.
             anchor: anchor of the widget.
             capture_events: whether detect another widget under the widget.
             gradient_animation: whether enable gradient_animation.
@@ -1095,6 +1136,9 @@ class Slider(virtual.Widget):
             shapes.Oval(self, size=(size[1], size[1]), name=".out")
             shapes.Oval(self, (size[1]/4, size[1]/4), (size[1]/2, size[1]/2), name=".in")
         self.feature = features.SliderFeature(self)
+        self.callback_policy = callbacks.CallbackPolicy(
+            lambda value: None if self.command is None else self.command(value), callback_policy,
+            interval=callback_interval, master=self.master)
         if default is not None:
             self.set(default)
 
@@ -1106,7 +1150,7 @@ class Slider(virtual.Widget):
         """Set the value of the slider."""
         value = 1 if value > 1 else 0 if value < 0 else value
         if callback and self.command is not None:
-            self.command(value)
+            self.callback_policy(value)
         if self.get() == value:
             return
         if isinstance(self.shapes[-1], shapes.Oval):
@@ -1124,6 +1168,12 @@ class Slider(virtual.Widget):
                 (self.size[1]/5 + (self.size[0]-self.size[1]*2/5)
                  * self.value, self.shapes[1].size[1]))
 
+    @override
+    def destroy(self) -> None:
+        """Destroy the widget, a pending call of the command is made first."""
+        self.callback_policy.release()
+        return super().destroy()
+
 
 class SegmentedButton(virtual.Widget):
     """A segmented button that can be used to toggle between multiple states."""
@@ -1201,16 +1251,19 @@ class SegmentedButton(virtual.Widget):
             shapes.Rectangle(self)
         else:
             shapes.RoundedRectangle(self)
+        self.selection_group = models.SelectionGroup()
         total_side_length = 5
         for i, (size, text, image) in enumerate(itertools.zip_longest(sizes, text, image)):
             position = (total_side_length, 5) if layout == "horizontal" else (5, total_side_length)
             position = tuple(i - j for i, j in zip(position, self.offset))
-            ToggleButton(
+            toggle_button = ToggleButton(
                 self, position, size, text=text, family=family, fontsize=fontsize, weight=weight,
                 slant=slant, underline=underline, overstrike=overstrike, justify=justify,
                 gradient_animation=gradient_animation, image=image,
                 command=lambda _, i=i: (self.set(i), command(i) if command else None),
                 style=styles.ToggleButtonStyle4SB)
+            toggle_button.selection_group = self.selection_group
+            self.selection_group.add(toggle_button)
             total_side_length += size[layout == "vertical"] + 5
         self.command = command
         if default is not None:
@@ -1226,8 +1279,10 @@ class SegmentedButton(virtual.Widget):
         """Activate the child toggle button for the specified index."""
         if callback and self.command:
             self.command(value)
-        for i, widget in enumerate(self.children):
-            widget.set(i == value)
+        if value is None:
+            self.selection_group.clear()
+        else:
+            self.selection_group.select(value)
         self.value = value
 
 
@@ -1343,7 +1398,134 @@ class SpinBox(virtual.Widget):
         self.children[0].clear()
 
 
-class OptionButton(virtual.Widget):
+class _OptionsWidget(virtual.Widget, abc.ABC):
+    """Base class of the widgets that choose an option from pop-up options.
+
+    The pop-up options are created when they are opened for the first time
+    and destroyed after they have been closed for a while. If there are more
+    options than the visible ones, they are displayed by a ``VirtualList`` so
+    that only the visible options are created.
+    """
+
+    def _setup_options(
+        self,
+        text: tuple[str, ...],
+        size: tuple[int, int],
+        align: Literal["up", "center", "down"],
+        visible_options: int,
+        release_delay: int | None,
+        command: Callable[[int | None], Any] | None,
+        **kwargs: Any,
+    ) -> None:
+        """Keep the configuration of the pop-up options."""
+        self.text = text
+        self.command = command
+        self.visible_options = visible_options
+        self.release_delay = release_delay
+        self.search_index: models.SearchIndex | None = None
+        self._value: int | None = None
+        self._options: SegmentedButton | VirtualList | None = None
+        self._options_config = size, align, kwargs
+        self._release_task: str | None = None
+
+    @abc.abstractmethod
+    def _get_position(self, align: Literal["up", "center", "down"]) -> tuple[int, int]:
+        """Get the position of "pop-up" options."""
+
+    @abc.abstractmethod
+    def _show_option(self, text: str) -> None:
+        """Show the text of the chosen option."""
+
+    def _create_options(self) -> SegmentedButton | VirtualList:
+        """Create the "pop-up" options."""
+        size, align, kwargs = self._options_config
+        anchor = "s" if align == "up" else "n" if align == "down" else "center"
+        if self.search_index is not None or len(self.text) > self.visible_options:
+            options = VirtualList(
+                self, self._get_position(align),
+                (size[0] + 10, self.visible_options*(size[1]+5) + 5), data=range(len(self.text)),
+                row_height=size[1] + 5, binder=self._bind_option, family=kwargs["family"],
+                fontsize=kwargs["fontsize"], command=self._choose_option, anchor=anchor,
+                capture_events=kwargs["capture_events"], gradient_animation=False)
+            if self._value is not None:
+                options.see(self._value)
+        else:
+            options = SegmentedButton(
+                self, self._get_position(align), (size,)*len(self.text), text=self.text,
+                layout="vertical", gradient_animation=False, command=self._close_options,
+                default=self._value, anchor=anchor, **kwargs)
+        options.capture_events = None
+        options.bind("<Button-1>", self._extra_bind, add="+")
+        return options
+
+    def _bind_option(self, row: virtual.Widget, index: int, _: int) -> None:
+        """Display an option by a row of the scrolling list."""
+        row.set(self.text[index])
+
+    def _choose_option(self, row_index: int) -> None:
+        """Choose the option displayed by a row of the scrolling list."""
+        self._close_options(self._options.data[row_index])
+
+    def _extra_bind(self, event) -> None:
+        if not self._options.detect(event.x, event.y):
+            self._hide_options()
+
+    def _open_options(self) -> None:
+        """Open the options."""
+        if self._release_task is not None:
+            self.master.after_cancel(self._release_task)
+            self._release_task = None
+        if self._options is None:
+            self._options = self._create_options()
+
+        self._options.lift("popup")
+
+        self._options.forget(False)
+
+    def _hide_options(self) -> None:
+        """Hide the options and release them after the delay."""
+        if self._options is None or self._options.disappeared:
+            return
+        self._options.forget(True)
+        if self.release_delay is not None and self._release_task is None:
+            self._release_task = self.master.after(self.release_delay, self._release_options)
+
+    def _release_options(self) -> None:
+        """Destroy the options if they are still hidden."""
+        self._release_task = None
+        if self._options is not None and self._options.disappeared:
+            self._options.destroy()
+            self._options = None
+
+    def _close_options(self, index: int | None = None) -> None:
+        """Close the options."""
+        self._value = index
+        self._show_option("" if index is None else self.text[index])
+        self._hide_options()
+        if self.command is not None:
+            self.command(index)
+
+    def get(self) -> int | None:
+        """Get the index of the chosen option. If not, None is returned."""
+        return self._value
+
+    def set(self, value: int | None, *, callback: bool = False) -> None:
+        """Choose the option for the specified index."""
+        if isinstance(self._options, SegmentedButton):
+            self._options.set(value)
+        self._close_options(value)
+        if callback and self.command is not None:
+            self.command(value)
+
+    @override
+    def destroy(self) -> None:
+        """Destroy the widget."""
+        if self._release_task is not None:
+            self.master.after_cancel(self._release_task)
+        return super().destroy()
+
+
+class OptionButton(_OptionsWidget):
     """A button that has many options to choose."""
 
     def __init__(
@@ -1365,6 +1547,8 @@ class OptionButton(virtual.Widget):
         image: tuple[enhanced.PhotoImage | None, ...] = (),
         anchor: Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
         align: Literal["up", "center", "down"] = "center",
+        visible_options: int = 10,
+        release_delay: int | None = 30000,
         capture_events: bool | None = None,
         gradient_animation: bool | None = None,
         auto_update: bool | None = None,
@@ -1388,6 +1572,10 @@ class OptionButton(virtual.Widget):
             image: image of the widget.
             anchor: anchor of the widget.
             align: align of the widget.
+            visible_options: maximum number of visible options, more options
+                are displayed by a scrolling list without images.
+            release_delay: time in milliseconds that closed options are kept
+                before they are destroyed, ``None`` indicates forever.
             capture_events: whether detect another widget under the widget.
             gradient_animation: whether enable gradient_animation.
             auto_update: whether the theme manager update it automatically.
@@ -1396,7 +1584,6 @@ class OptionButton(virtual.Widget):
         if size is None:
             size = sorted(utility.get_text_size(t, fontsize, family, weight=weight,
                           slant=slant, padding=6, master=master) for t in (list(text) + [""]))[-1]
-        self.text = text
         super().__init__(
             master, position, size, anchor=anchor,
             capture_events=capture_events, gradient_animation=gradient_animation,
@@ -1407,67 +1594,29 @@ class OptionButton(virtual.Widget):
             self, (0, 0), size, family=family, fontsize=fontsize, weight=weight,
             slant=slant, underline=underline, overstrike=overstrike, justify=justify, anchor=anchor,
             command=self._open_options)
-        self._segmented_button = SegmentedButton(
-            self, self._get_position(align), (size,)*len(text), text=text, family=family,
+        self._setup_options(
+            text, size, align, visible_options, release_delay, command, family=family,
             fontsize=fontsize, weight=weight, slant=slant, underline=underline,
-            overstrike=overstrike, justify=justify, image=image, layout="vertical",
-            capture_events=capture_events, gradient_animation=False, command=self._close_options,
-            anchor="s" if align == "up" else "n" if align == "down" else "center")
-        self._segmented_button.capture_events = None
-        self._segmented_button.forget(True)
-        self._segmented_button.bind("<Button-1>", self._extra_bind, add="+")
-        self.command = command
+            overstrike=overstrike, justify=justify, image=image, capture_events=capture_events)
         if default is not None:
             self.set(default)
 
+    @override
     def _get_position(self, align: Literal["up", "center", "down"]) -> tuple[int, int]:
-        """Get the position of "pop-up" SegmentedButton."""
+        """Get the position of "pop-up" options."""
         x, y = self.size[0]/2 - self.offset[0], self.size[1]/2 - self.offset[1]
         match align:
             case "up": y += self.size[1]/2 + 6
             case "down": y -= self.size[1]/2 + 6
         return x, y
 
-    def _extra_bind(self, event) -> None:
-        if not self._segmented_button.detect(event.x, event.y):
-            self._segmented_button.forget(True)
-
-    def _open_options(self) -> None:
-        """Open the options."""
-        self.master.widgets.remove(self._segmented_button)
-        self.master.widgets.append(self._segmented_button)
-        for element in self._segmented_button.elements:
-            for item in element.items:
-                self.master.lift(item)
-        for widget in self._segmented_button.children:
-            self.master.widgets.remove(widget)
-            self.master.widgets.append(widget)
-            for element in widget.elements:
-                for item in element.items:
-                    self.master.lift(item)
-
-        self._segmented_button.forget(False)
-
-    def _close_options(self, index: int | None = None) -> None:
-        """Close the options."""
-        self._button.texts[0].set("" if index is None else self.text[index])
-        self._segmented_button.forget(True)
-        if self.command is not None:
-            self.command(index)
-
-    def get(self) -> int | None:
-        """Get the index of the child toggle button with a value of True. If
-        not, None is returned."""
-        return self._segmented_button.value
-
-    def set(self, value: int | None, *, callback: bool = False) -> None:
-        """Activate the child toggle button for the specified index."""
-        self._segmented_button.set(value, callback=True)
-        if callback and self.command is not None:
-            self.command(value)
+    @override
+    def _show_option(self, text: str) -> None:
+        """Show the text of the chosen option."""
+        self._button.texts[0].set(text)
 
 
-class ComboBox(virtual.Widget):
+class ComboBox(_OptionsWidget):
     """An input box that can provide several options."""
 
     def __init__(
@@ -1489,6 +1638,9 @@ class ComboBox(virtual.Widget):
         image: tuple[enhanced.PhotoImage | None, ...] = (),
         anchor: Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
         align: Literal["up", "down"] = "down",
+        visible_options: int = 10,
+        release_delay: int | None = 30000,
+        searchable: bool = False,
         capture_events: bool | None = None,
         gradient_animation: bool | None = None,
         auto_update: bool | None = None,
@@ -1512,6 +1664,12 @@ class ComboBox(virtual.Widget):
             image: image of the widget.
             anchor: anchor of the widget.
             align: align of the widget.
+            visible_options: maximum number of visible options, more options
+                are displayed by a scrolling list without images.
+            release_delay: time in milliseconds that closed options are kept
+                before they are destroyed, ``None`` indicates forever.
+            searchable: whether to filter the options by the typed text, many
+                options are indexed in the background.
             capture_events: whether detect another widget under the widget.
             gradient_animation: whether enable gradient_animation.
             auto_update: whether the theme manager update it automatically.
@@ -1521,7 +1679,6 @@ class ComboBox(virtual.Widget):
             size = sorted(utility.get_text_size(t, fontsize, family, weight=weight,
                           slant=slant, padding=6, master=master) for t in (list(text) + [""]))[-1]
             size = size[0] + size[1] - 10, size[1]
-        self.text = text
         super().__init__(
             master, position, size, anchor=anchor,
             capture_events=capture_events, gradient_animation=gradient_animation,
@@ -1532,65 +1689,98 @@ class ComboBox(virtual.Widget):
             underline=underline, overstrike=overstrike, anchor=anchor, limit_width=-h)
         self._button = Button(
             self, (size[0]-h-5-self.offset[0], 5-self.offset[1]), (h, h), text="▼",
-            command=lambda: self._open_options() if self._segmented_button.disappeared else self._segmented_button.forget())
-        self._segmented_button = SegmentedButton(
-            self, self._get_position(align), (size,)*len(text), text=text, family=family,
+            command=lambda: self._open_options() if self._options is None or self._options.disappeared else self._hide_options())
+        self._setup_options(
+            text, size, align, visible_options, release_delay, command, family=family,
             fontsize=fontsize, weight=weight, slant=slant, underline=underline,
-            overstrike=overstrike, justify=justify, image=image, layout="vertical",
-            capture_events=capture_events, gradient_animation=False, command=self._close_options,
-            anchor="s" if align == "up" else "n" if align == "down" else "center")
-        self._segmented_button.capture_events = None
-        self._segmented_button.forget(True)
-        self._segmented_button.bind("<Button-1>", self._extra_bind, add="+")
-        self.command = command
+            overstrike=overstrike, justify=justify, image=image, capture_events=capture_events)
+        self._index_job: scheduler.Job | None = None
+        self._filtered = False  # Whether only the matching options are shown
+        if searchable:
+            self.search_index = models.SearchIndex()
+            self._build_index()
+            self._input_box.bind("<KeyPress>", self._filter_options, auto_detect=False)
         if default is not None:
             self.set(default)
 
+    @override
     def _get_position(self, align: Literal["up", "center", "down"]) -> tuple[int, int]:
-        """Get the position of "pop-up" SegmentedButton."""
+        """Get the position of "pop-up" options."""
         x, y = self.size[0]/2 - self.offset[0], self.size[1]/2 - self.offset[1]
         match align:
             case "up": y -= self.size[1]/2
             case "down": y += self.size[1]/2
         return x, y
 
-    def _extra_bind(self, event) -> None:
-        if not self._segmented_button.detect(event.x, event.y):
-            self._segmented_button.forget(True)
-
-    def _open_options(self) -> None:
-        """Open the options."""
-        self.master.widgets.remove(self._segmented_button)
-        self.master.widgets.append(self._segmented_button)
-        for element in self._segmented_button.elements:
-            for item in element.items:
-                self.master.lift(item)
-        for widget in self._segmented_button.children:
-            self.master.widgets.remove(widget)
-            self.master.widgets.append(widget)
-            for element in widget.elements:
-                for item in element.items:
-                    self.master.lift(item)
-
-        self._segmented_button.forget(False)
+    @override
+    def _show_option(self, text: str) -> None:
+        """Show the text of the chosen option."""
+        self._input_box.texts[0].set(text)
+
+    def _build_index(self) -> None:
+        """Index the options, in the background if there are many options."""
+        chunk = 4096
+        if len(self.text) <= chunk:
+            self.search_index.extend(enumerate(self.text))
+        else:
+            self._index_job = scheduler.schedule((
+                self.search_index.extend(enumerate(self.text[i:i+chunk], i))
+                for i in range(0, len(self.text), chunk)), priority=-1)
 
-    def _close_options(self, index: int | None = None) -> None:
-        """Close the options."""
-        self._input_box.texts[0].set("" if index is None else self.text[index])
-        self._segmented_button.forget(True)
-        if self.command is not None:
-            self.command(index)
+    def _filter_options(self, _: tkinter.Event) -> None:
+        """Show the options that match the typed text."""
+        if self._input_box.state != "active":
+            return
+        query = self._input_box.get()
+        self._open_options()
+        data = self._options.data
+        data.clear()
+        data.extend(self.search_index.search(query, 1000) if query else range(len(self.text)))
+        self._filtered = bool(query)
+
+    def _clear_filter(self) -> None:
+        """Show all options again if only the matching options are shown."""
+        if not self._filtered or self._options is None:
+            return
+        self._filtered = False
+        data = self._options.data
+        data.clear()
+        data.extend(range(len(self.text)))
 
-    def get(self) -> int | None:
-        """Get the index of the child toggle button with a value of True. If
-        not, None is returned."""
-        return self._segmented_button.value
+    @override
+    def _hide_options(self) -> None:
+        """Hide the options and release them after the delay."""
+        if self._options is not None and not self._options.disappeared:
+            self._clear_filter()  # Rows are shown by refreshing, so do it before hiding
+        super()._hide_options()
+
+    def set_options(self, text: tuple[str, ...]) -> None:
+        """Replace the options, only the changed options are indexed again."""
+        old, self.text = self.text, text
+        if self._options is not None:
+            self._options.destroy()
+            self._options = None
+        self._filtered = False
+        if self._value is not None and self._value >= len(text):
+            self._value = None
+        self._show_option("" if self._value is None else text[self._value])
+        if self.search_index is None:
+            return
+        if self._index_job is not None and self._index_job.active:
+            self._index_job.cancel()
+            self.search_index.clear()
+            self._build_index()
+            return
+        for key in range(len(text), len(old)):
+            self.search_index.remove(key)
+        self.search_index.extend((i, t) for i, t in enumerate(text) if i >= len(old) or old[i] != t)
 
-    def set(self, value: int | None, *, callback: bool = False) -> None:
-        """Activate the child toggle button for the specified index."""
-        self._segmented_button.set(value, callback=True)
-        if callback and self.command is not None:
-            self.command(value)
+    @override
+    def destroy(self) -> None:
+        """Destroy the widget."""
+        if self._index_job is not None:
+            self._index_job.cancel()
+        return super().destroy()
 
 
 class Spinner(virtual.Widget):
@@ -1648,6 +1838,7 @@ class Spinner(virtual.Widget):
                     self.shapes[1].items[0], start=-p*360, extent=math.cos(p*math.tau)*60+120),
                 controller=controllers.linear, repeat=-1, fps=60,
             )
+            self._spin.attach(self)
             self._spin.start()
 
         if default is not None:
@@ -1678,11 +1869,19 @@ class Spinner(virtual.Widget):
         """Destroy the widget."""
         if self.mode == "indeterminate":
             self._spin.stop()
+            self._spin.detach()
         return super().destroy()
 
 
 class Tooltip(virtual.Widget):
-    """A tooltip that can display additional information."""
+    """A tooltip that can display additional information.
+
+    Only the configuration of the tooltip is kept until it is shown for the
+    first time, it is initialized as a widget of the canvas when the associated
+    widget is hovered for the first time. Shared tooltips of a canvas go
+    further and display their texts with the first one of them that is shown,
+    so the others are never initialized.
+    """
 
     def __init__(
         self,
@@ -1699,6 +1898,7 @@ class Tooltip(virtual.Widget):
         underline: bool = False,
         overstrike: bool = False,
         justify: Literal["left", "center", "right"] = "left",
+        shared: bool = False,
         gradient_animation: bool | None = None,
         auto_update: bool | None = None,
         style: type[virtual.Style] | None = None,
@@ -1717,49 +1917,517 @@ class Tooltip(virtual.Widget):
             underline: whether the text is underline.
             overstrike: whether the text is overstrike.
             justify: justify mode of the text.
+            shared: whether to display the text with the tooltip shared by the
+                canvas, the font and style of the shared tooltip are those of
+                the first shared tooltip that is shown.
             gradient_animation: whether enable gradient_animation.
             auto_update: whether the theme manager update it automatically.
             style: style of the widget.
         """
-        if size is None:
-            size = utility.get_text_size(
-                text, fontsize, family, weight=weight, slant=slant, padding=6, master=widget.master)
-        position = [widget.position[0] + widget.size[0]/2 - widget.offset[0],
-                    widget.position[1] + widget.size[1]/2 - widget.offset[1]]
-        match align:
-            case "up":    position[1] -= widget.size[1]/2 + size[1]/2 + padding
-            case "down":  position[1] += widget.size[1]/2 + size[1]/2 + padding
-            case "right": position[0] += widget.size[0]/2 + size[0]/2 + padding
-            case "left":  position[0] -= widget.size[0]/2 + size[0]/2 + padding
-        super().__init__(
-            widget.master, position, size,
-            capture_events=False, gradient_animation=gradient_animation,
-            anchor="center", auto_update=auto_update, style=style)
-        if style is None:
-            self.style = styles.TooltipStyle(self)
-        if configs.Env.system == "Windows10":
-            shapes.Rectangle(self)
-        else:
-            shapes.RoundedRectangle(self)
-        texts.Information(
-            self, text=text, family=family, fontsize=fontsize, weight=weight, slant=slant,
-            underline=underline, overstrike=overstrike, justify=justify)
+        # The widget is initialized by method ``_realize``
+        self.master = widget.master
+        self.shared = shared
+        self._realized = False
+        self._options: dict[str, Any] = {
+            "gradient_animation": gradient_animation, "auto_update": auto_update, "style": style}
+        self._widget = widget
+        self._text = text
+        self._size = size
+        self._align = align
+        self._padding = padding
+        self._font: dict[str, Any] = {
+            "family": family, "fontsize": fontsize, "weight": weight, "slant": slant,
+            "underline": underline, "overstrike": overstrike, "justify": justify}
+        self._current: Tooltip | None = None  # The tooltip whose text is displayed
         widget._update_hooks.append(self._display)
-        self.forget()
+
+    @property
+    def realized(self) -> bool:
+        """Whether the tooltip has been initialized as a widget."""
+        return self._realized
 
     def get(self) -> str:
         """Get the text of the widget."""
-        return self.texts[0].get()
+        return self._text
 
     def set(self, text: str) -> None:
         """Set the text of the widget."""
-        return self.texts[0].set(text)
+        self._text = text
+        if self.realized and self._current is self:
+            self.texts[0].set(text)
+
+    def _realize(self) -> None:
+        """Initialize the tooltip as a widget and create its elements."""
+        size = self._measure(self)
+        super().__init__(  # pylint: disable=W0233
+            self.master, self._locate(size), size, capture_events=False, anchor="center",
+            gradient_animation=self._options["gradient_animation"],
+            auto_update=self._options["auto_update"], style=self._options["style"])
+        if self._options["style"] is None:
+            self.style = styles.TooltipStyle(self)
+        self._realized = True
+        if configs.Env.system == "Windows10":
+            shapes.Rectangle(self)
+        else:
+            shapes.RoundedRectangle(self)
+        texts.Information(self, text=self._text, **self._font)
+        self._current = self
+        self.lift("overlay")
+
+    def _measure(self, tooltip: Tooltip) -> tuple[float, float]:
+        """Get the size of the tooltip when it displays the text of a tooltip."""
+        if tooltip._size is not None:
+            return tooltip._size
+        font = self._font
+        return utility.get_text_size(
+            tooltip._text, font["fontsize"], font["family"], weight=font["weight"],
+            slant=font["slant"], padding=6, master=self.master)
+
+    def _locate(self, size: tuple[float, float]) -> tuple[float, float]:
+        """Get the position of the tooltip next to the associated widget."""
+        widget, padding = self._widget, self._padding
+        x = widget.position[0] + widget.size[0]/2 - widget.offset[0]
+        y = widget.position[1] + widget.size[1]/2 - widget.offset[1]
+        match self._align:
+            case "up":    y -= widget.size[1]/2 + size[1]/2 + padding
+            case "down":  y += widget.size[1]/2 + size[1]/2 + padding
+            case "right": x += widget.size[0]/2 + size[0]/2 + padding
+            case "left":  x -= widget.size[0]/2 + size[0]/2 + padding
+        return x, y
+
+    def _get_host(self) -> Tooltip:
+        """Get the tooltip that displays the text of the tooltip."""
+        if not self.shared:
+            return self
+        host = _shared_tooltips.get(self.master)
+        if host is None or not host.exists():
+            host = _shared_tooltips[self.master] = self
+        return host
+
+    def _show(self, tooltip: Tooltip) -> None:
+        """Display the text of a tooltip next to its associated widget."""
+        if not self.realized:
+            self._realize()
+        if self._current is not tooltip:
+            self._current = tooltip
+            self.texts[0].set(tooltip._text)
+            self.resize(self._measure(tooltip))
+        self.moveto(*tooltip._locate(self.size))
+        self.forget(False)
 
     def _display(self, state: str | None, _: bool) -> None:
         """Show or hide the tooltip."""
         if state is None:
             return
         if state.startswith("hover"):
-            self.forget(False)
+            self._get_host()._show(self)
         elif state.startswith("normal"):
-            self.forget()
+            host = _shared_tooltips.get(self.master) if self.shared else self
+            if host is not None and host.exists() and host._current is self:
+                host.forget()
+
+    @override
+    def destroy(self) -> None:
+        """Destroy the widget."""
+        if self._widget.exists() and self._display in self._widget._update_hooks:
+            self._widget._update_hooks.remove(self._display)
+        if self._realized:
+            return super().destroy()
+        return self.__dict__.clear()
+
+
+class VirtualList(virtual.Widget):
+    """A scrolling list that only keeps the rows around the visible area.
+
+    The rows are recycled by binding other items to them when the list is
+    scrolled or its data is changed, so the cost depends on the number of
+    visible rows rather than the number of items. The list is scrolled by
+    whole rows, since the items of a canvas can not be clipped.
+    """
+
+    def __init__(
+        self,
+        master: containers.Canvas | virtual.Widget,
+        position: tuple[int, int],
+        size: tuple[int, int] = (200, 300),
+        *,
+        data: Iterable[Any] = (),
+        row_height: int = 35,
+        overscan: int = 2,
+        factory: Callable[[VirtualList, tuple[float, float], tuple[float, float]], virtual.Widget] | None = None,
+        binder: Callable[[virtual.Widget, Any, int], Any] | None = None,
+        family: str | None = None,
+        fontsize: int | None = None,
+        command: Callable[[int], Any] | None = None,
+        anchor: Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
+        capture_events: bool | None = None,
+        gradient_animation: bool | None = None,
+        auto_update: bool | None = None,
+        style: type[virtual.Style] | None = None,
+    ) -> None:
+        """
+        Args:
+            master: parent canvas.
+            position: position of the widget.
+            size: size of the widget.
+            data: items of the list, the changes of a ``ListModel`` are
+                displayed automatically, other iterables are copied into one.
+            row_height: height of each row, including the spacing.
+            overscan: number of extra rows prepared above and below the visible
+                rows, which are hidden until the list is scrolled to them.
+            factory: a function that creates a row with the list, the position
+                and the size as arguments, ``Button`` is created by default.
+            binder: a function that displays an item by a row with the row, the
+                item and the index of the item as arguments. By default, the
+                method ``set`` of the row is called with ``str(item)``.
+            family: font family of the default rows.
+            fontsize: font size of the default rows.
+            command: a function that is triggered with the index of the item
+                when a default row is clicked.
+            anchor: anchor of the widget.
+            capture_events: whether detect another widget under the widget.
+            gradient_animation: whether enable gradient_animation.
+            auto_update: whether the theme manager update it automatically.
+            style: style of the widget.
+        """
+        if isinstance(data, models.ListModel):
+            self.data = data
+        else:
+            self.data = models.ListModel(data)
+        self.row_height = row_height
+        self.overscan = overscan
+        self.command = command
+        self._factory = factory
+        self._binder = binder
+        self._font = family, fontsize
+        self._initial_size = size
+        self._first = 0
+        self._rows: dict[int, virtual.Widget] = {}  # Index of item: row
+        self._free: list[virtual.Widget] = []
+        super().__init__(
+            master, position, size, anchor=anchor,
+            capture_events=capture_events, gradient_animation=gradient_animation,
+            auto_update=auto_update, style=style)
+        if style is None:
+            self.style = styles.VirtualListStyle(self)
+        if configs.Env.system == "Windows10":
+            shapes.Rectangle(self)
+        else:
+            shapes.RoundedRectangle(self)
+        self.feature = features.VirtualListFeature(self)
+        self.data.bind(self._on_change)
+        self._refresh()
+
+    @property
+    def visible_rows(self) -> int:
+        """The number of visible rows."""
+        return max(int((self._initial_size[1]-5) // self.row_height), 1)
+
+    def _create_row(self, position: tuple[float, float], size: tuple[float, float]) -> virtual.Widget:
+        """Create a new row."""
+        if self._factory is not None:
+            return self._factory(self, position, size)
+        row = Button(
+            self, position, size, family=self._font[0], fontsize=self._font[1],
+            gradient_animation=self.gradient_animation,
+            command=lambda: self._click(row))
+        return row
+
+    def _bind_row(self, row: virtual.Widget, index: int) -> None:
+        """Display an item by a row."""
+        if self._binder is not None:
+            self._binder(row, self.data[index], index)
+        else:
+            row.set(str(self.data[index]))
+
+    def _click(self, row: virtual.Widget) -> None:
+        """Call the command with the index of the item of a clicked row."""
+        if self.command is not None:
+            for index, value in self._rows.items():
+                if value is row:
+                    return self.command(index)
+        return None
+
+    def _recycle(self, row: virtual.Widget) -> None:
+        """Hide a row that is no longer bound and keep it for reuse."""
+        if not row.disappeared:
+            row.forget()
+        self._free.append(row)
+
+    def _refresh(self) -> None:
+        """Bind and place the rows of the items around the visible area."""
+        visible, length = self.visible_rows, len(self.data)
+        self._first = first = max(min(self._first, length - visible), 0)
+        start, stop = max(first - self.overscan, 0), min(first + visible + self.overscan, length)
+
+        for index in [index for index in self._rows if not start <= index < stop]:
+            self._recycle(self._rows.pop(index))
+
+        kx, ky = self.size[0]/self._initial_size[0], self.size[1]/self._initial_size[1]
+        x = self.position[0] - self.offset[0] + 5*kx
+        y = self.position[1] - self.offset[1] + 5*ky
+
+        for index in range(start, stop):
+            position = x, y + (index-first)*self.row_height*ky
+            if (row := self._rows.get(index)) is None:
+                if self._free:
+                    row = self._free.pop()
+                else:
+                    row = self._create_row(
+                        (position[0] - self.position[0], position[1] - self.position[1]),
+                        ((self._initial_size[0]-10)*kx, (self.row_height-5)*ky))
+                self._rows[index] = row
+                self._bind_row(row, index)
+            if row.position != position:
+                row.moveto(*position)
+            if row.disappeared != (hidden := not first <= index < first + visible):
+                row.forget(hidden)
+
+    def _on_change(self, kind: Literal["insert", "remove", "update"], index: int, count: int) -> None:
+        """Refresh the rows after the data is changed."""
+        match kind:
+            case "insert":
+                self._rows = {i + count if i >= index else i: row for i, row in self._rows.items()}
+            case "remove":
+                for i in [i for i in self._rows if index <= i < index + count]:
+                    self._recycle(self._rows.pop(i))
+                self._rows = {i - count if i >= index else i: row for i, row in self._rows.items()}
+            case "update":
+                for i in [i for i in self._rows if index <= i < index + count]:
+                    self._bind_row(self._rows[i], i)
+        self._refresh()
+
+    def get(self) -> int:
+        """Get the index of the first visible item."""
+        return self._first
+
+    def set(self, index: int) -> None:
+        """Scroll the list so that the item of the index is the first visible one."""
+        self._first = index
+        self._refresh()
+
+    def scroll(self, count: int) -> None:
+        """Scroll the list by rows, a positive count scrolls down."""
+        self.set(self._first + count)
+
+    def see(self, index: int) -> None:
+        """Scroll the list as little as possible to make an item visible."""
+        if index < self._first:
+            self.set(index)
+        elif index >= self._first + self.visible_rows:
+            self.set(index - self.visible_rows + 1)
+
+    @override
+    def destroy(self) -> None:
+        """Destroy the widget."""
+        self.data.unbind(self._on_change)
+        return super().destroy()
+
+
+class VirtualGrid(virtual.Widget):
+    """A scrolling grid that only creates the cells in the visible area.
+
+    Each visible cell slot is a ``Rectangle`` and an ``Information``, which
+    are reused for other cells when the grid is scrolled, and only the texts
+    that are changed are configured again. The widths of the columns are
+    measured when they are visible for the first time and then cached, until
+    the data is changed or the grid is zoomed.
+    """
+
+    def __init__(
+        self,
+        master: containers.Canvas | virtual.Widget,
+        position: tuple[int, int],
+        size: tuple[int, int] = (400, 300),
+        *,
+        data: Sequence[Sequence[Any]] = (),
+        columns: int | None = None,
+        column_widths: Sequence[int] | None = None,
+        column_width_range: tuple[int, int] = (40, 300),
+        padding: int = 6,
+        family: str | None = None,
+        fontsize: int | None = None,
+        anchor: Literal["n", "e", "w", "s", "nw", "ne", "sw", "se", "center"] = "nw",
+        capture_events: bool | None = None,
+        gradient_animation: bool | None = None,
+        auto_update: bool | None = None,
+        style: type[virtual.Style] | None = None,
+    ) -> None:
+        """
+        Args:
+            master: parent canvas.
+            position: position of the widget.
+            size: size of the widget.
+            data: rows of the cells, the changes of a ``ListModel`` are
+                displayed automatically. The missing cells of short rows are
+                displayed empty.
+            columns: number of columns, the length of the first row by default.
+            column_widths: widths of the columns, they are measured from the
+                visible cells by default.
+            column_width_range: minimum and maximum widths of measured columns.
+            padding: padding around the text of each cell.
+            family: font family.
+            fontsize: font size.
+            anchor: anchor of the widget.
+            capture_events: whether detect another widget under the widget.
+            gradient_animation: whether enable gradient_animation.
+            auto_update: whether the theme manager update it automatically.
+            style: style of the widget.
+        """
+        self.data = data
+        if columns is None:
+            columns = len(data[0]) if data else 0
+        self.columns = columns
+        self.padding = padding
+        self.column_width_range = column_width_range
+        self._fixed_widths: dict[int, float] = {}
+        if column_widths is not None:
+            self._fixed_widths.update(enumerate(column_widths))
+        self._column_widths = dict(self._fixed_widths)
+        self._font = tkinter.font.Font(
+            family=family if family else configs.Font.family,
+            size=-abs(fontsize if fontsize else configs.Font.size))
+        self._font_options = family, fontsize
+        self._initial_fontsize = self._font.cget("size")
+        self._row_height = self._font.metrics("linespace") + padding*2
+        self._initial_size = size
+        self._first = [0, 0]  # Row and column
+        self._cells: dict[tuple[int, int], tuple[shapes.Rectangle, texts.Information]] = {}
+        self._free: list[tuple[shapes.Rectangle, texts.Information]] = []
+        super().__init__(
+            master, position, size, anchor=anchor,
+            capture_events=capture_events, gradient_animation=gradient_animation,
+            auto_update=auto_update, style=style)
+        if style is None:
+            self.style = styles.VirtualGridStyle(self)
+        shapes.Rectangle(self)
+        self.feature = features.VirtualGridFeature(self)
+        if isinstance(data, models.ListModel):
+            data.bind(self._on_change)
+        self._refresh()
+
+    @property
+    def visible_rows(self) -> int:
+        """The number of visible rows."""
+        return max(int((self._initial_size[1]-2) // self._row_height), 1)
+
+    def _text(self, row: int, column: int) -> str:
+        """Get the text of a cell, the missing cells of short rows are empty."""
+        cells = self.data[row]
+        return str(cells[column]) if column < len(cells) else ""
+
+    def _column_width(self, column: int) -> float:
+        """Get the width of a column, it is measured at the first time."""
+        if (width := self._column_widths.get(column)) is None:
+            start = self._first[0]
+            stop = min(start + self.visible_rows, len(self.data))
+            kx = self.size[0]/self._initial_size[0]  # The font is scaled with the canvas
+            width = max((self._font.measure(self._text(row, column))
+                         for row in range(start, stop)), default=0)/kx + self.padding*2
+            minimum, maximum = self.column_width_range
+            width = self._column_widths[column] = min(max(width, minimum), maximum)
+        return width
+
+    def _refresh(self) -> None:
+        """Bind and place the cells in the visible area."""
+        visible = self.visible_rows
+        self._first[0] = row = max(min(self._first[0], len(self.data) - visible), 0)
+        self._first[1] = column = max(min(self._first[1], self.columns - 1), 0)
+        rows = min(visible, len(self.data) - row)
+
+        widths: list[float] = []
+        for i in range(column, self.columns if rows else column):
+            width = self._column_width(i)
+            if widths and sum(widths) + width > self._initial_size[0] - 2:
+                break
+            widths.append(width)
+
+        for key in [key for key in self._cells if key[0] >= rows or key[1] >= len(widths)]:
+            cell = self._cells.pop(key)
+            for element in cell:
+                element.forget()
+            self._free.append(cell)
+
+        kx, ky = self.size[0]/self._initial_size[0], self.size[1]/self._initial_size[1]
+        x0 = self.position[0] - self.offset[0] + kx
+        y0 = self.position[1] - self.offset[1] + ky
+
+        for j, width in enumerate(widths):
+            x = x0 + sum(widths[:j])*kx
+            for i in range(rows):
+                position = x, y0 + i*self._row_height*ky
+                size = width*kx, self._row_height*ky
+                text = self._text(row + i, column + j)
+                if (cell := self._cells.get((i, j))) is None:
+                    if self._free:
+                        cell = self._free.pop()
+                        for element in cell:
+                            element.forget(False)
+                    else:
+                        relative = position[0] - x0 + kx, position[1] - y0 + ky
+                        cell = (shapes.Rectangle(self, relative, size, name=".cell"),
+                                texts.Information(
+                                    self, relative, size, text=text, family=self._font_options[0],
+                                    fontsize=self._font_options[1], name=".cell"))
+                        cell[1].font.config(size=self._font.cget("size"))
+                    self._cells[(i, j)] = cell
+                for element in cell:
+                    if element.position != position or element.size != size:
+                        element.coords(size, position)
+                if cell[1].get() != text:
+                    cell[1].set(text)
+
+    def _remeasure(self) -> None:
+        """Forget the measured widths of the columns and refresh the cells."""
+        self._column_widths = dict(self._fixed_widths)
+        self._refresh()
+
+    def _on_change(self, *_: Any) -> None:
+        """Refresh the cells after the data is changed."""
+        self._remeasure()
+
+    def _scale_font(self) -> None:
+        """Scale the font like the texts of the canvas, and measure again."""
+        ratios = self.master.ratios
+        self._font.config(size=round(self._initial_fontsize*math.sqrt(ratios[0]*ratios[1])))
+        self._remeasure()
+
+    @override
+    def zoom(
+        self,
+        ratios: tuple[float, float] | None = None,
+        *,
+        zoom_position: bool = True,
+        zoom_size: bool = True,
+    ) -> None:
+        super().zoom(ratios, zoom_position=zoom_position, zoom_size=zoom_size)
+        self._scale_font()
+
+    @override
+    def rescale(
+        self,
+        ratios: tuple[float, float],
+        previous: tuple[float, float],
+    ) -> None:
+        super().rescale(ratios, previous)
+        self._scale_font()
+
+    def get(self) -> tuple[int, int]:
+        """Get the indexes of the first visible row and column."""
+        return self._first[0], self._first[1]
+
+    def set(self, row: int, column: int = 0) -> None:
+        """Scroll the grid so that the cell of the indexes is the first visible one."""
+        self._first = [row, column]
+        self._refresh()
+
+    def scroll(self, rows: int = 0, columns: int = 0) -> None:
+        """Scroll the grid by rows and columns, positive counts scroll down and right."""
+        self.set(self._first[0] + rows, self._first[1] + columns)
+
+    @override
+    def destroy(self) -> None:
+        """Destroy the widget."""
+        if isinstance(self.data, models.ListModel):
+            self.data.unbind(self._on_change)
+        return super().destroy()
@@ -7,4 +7,23 @@ Listen to the system's theme and respond accordingly, modify the style of the
 window, and more.
 """
 
-from .manager import *
+import typing as _typing
+
+from .._lazy import attach as _attach
+
+__all__, __getattr__, __dir__ = _attach(__name__, {
+    ".manager": (
+        "set_color_mode",
+        "get_color_mode",
+        "register_event",
+        "remove_event",
+        "apply_file_dnd",
+        "apply_theme",
+        "customize_window",
+    ),
+}, {
+    "manager": ".manager",
+})
+
+if _typing.TYPE_CHECKING:
+    from .manager import *
@@ -21,14 +21,17 @@ __all__ = (
     "customize_window",
 )
 
-import ctypes.wintypes
 import platform
+import queue
 import sys
 import threading
+import tkinter
 import traceback
+import types
 import warnings
+import weakref
 from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, Literal
+from typing import Any, Literal
 
 from ..core import configs
 from ..toolbox import utility
@@ -62,16 +65,28 @@ try:
 except ImportError:
     darkdetect = None
 
-if TYPE_CHECKING:
-    import tkinter
-
-_callback_events: dict[Callable[..., Any], tuple] = {}
-"""Events that are responded to when the system theme changes."""
+_callback_events: dict[Any, tuple[Callable[[], Callable[..., Any] | None], tuple]] = {}
+"""Events that are responded to when the system theme changes, as {key:
+(reference to the function, extra arguments)}. Bound methods are referenced
+weakly, so that they do not keep their objects, such as windows, alive."""
 
 _color_mode: Literal["light", "dark", "system"] = "system"
 """The color mode of the current program, ``"system"`` is the following system,
 ``"light"`` is the light color, and ``"dark"`` is the dark color."""
 
+_pending_themes: queue.SimpleQueue[Literal["light", "dark"]] = queue.SimpleQueue()
+"""System theme changes that are reported by the detection thread and wait to
+be handled on the main thread."""
+
+_theme_detected: bool = False
+"""Whether the system theme has been detected."""
+
+_listener_started: bool = False
+"""Whether the detection thread of the system theme has been started."""
+
+_poll_task: tuple[tkinter.Misc, str] | None = None
+"""The scheduled poll of the system theme changes, as (window, identifier)."""
+
 
 def set_color_mode(mode: Literal["system", "dark", "light"] = "system") -> None:
     """Set the color mode of the program.
@@ -84,12 +99,18 @@ def set_color_mode(mode: Literal["system", "dark", "light"] = "system") -> None:
     """
     global _color_mode  # pylint: disable=W0603
     _color_mode = mode
-    _process_event(configs.Env.theme if mode == "system" else mode)
+    _process_event(get_color_mode())
 
 
 def get_color_mode() -> Literal["dark", "light"]:
-    """Get the color mode of the program."""
+    """Get the color mode of the program.
+
+    Note:
+        The system theme is detected on the first call when following system,
+        and the result is cached in ``configs.Env.theme``.
+    """
     if _color_mode == "system":
+        _detect_theme()
         return configs.Env.theme
 
     return _color_mode
@@ -105,8 +126,20 @@ def register_event(func: Callable[..., Any], *args: Any) -> None:
     Args:
         func: callback function.
         args: extra arguments.
+
+    Note:
+        A bound method is referenced weakly, and it is removed automatically
+        when its object is garbage collected.
     """
-    _callback_events[func] = args
+    key = _get_key(func)
+
+    if isinstance(func, types.MethodType):
+        ref: Callable[[], Callable[..., Any] | None] = weakref.WeakMethod(
+            func, lambda _: _callback_events.pop(key, None))
+    else:
+        ref = lambda: func  # pylint: disable=C3001
+
+    _callback_events[key] = ref, args
 
 
 def remove_event(func: Callable[..., Any]) -> None:
@@ -115,8 +148,22 @@ def remove_event(func: Callable[..., Any]) -> None:
     Args:
         func: callback function.
     """
-    if _callback_events.get(func) is not None:
-        del _callback_events[func]
+    _callback_events.pop(_get_key(func), None)
+
+
+def _get_key(func: Callable[..., Any]) -> Any:
+    """Get the key of a callback function in the registry.
+
+    A new bound method object is created on every attribute access, so bound
+    methods are identified by their objects and functions.
+
+    Args:
+        func: callback function.
+    """
+    if isinstance(func, types.MethodType):
+        return id(func.__self__), func.__func__
+
+    return func
 
 
 def apply_file_dnd(
@@ -162,6 +209,8 @@ def apply_theme(
                 "Package 'win32material' is missing.", UserWarning, 2)
             return
 
+        import ctypes.wintypes  # Only needed on Windows
+
         if theme == "mica":  # NOTE: "mica" of package `pywinstyles` do not work
             win32material.ApplyMica(
                 ctypes.wintypes.HWND(utility.get_parent(window)))
@@ -254,6 +303,8 @@ def customize_window(
 
     if win32material is not None:
         if border_type is not None:
+            import ctypes.wintypes  # Only needed on Windows
+
             match border_type:
                 case "rectangular": type_ = win32material.BORDERTYPE.RECTANGULAR
                 case "smallround": type_ = win32material.BORDERTYPE.SMALLROUND
@@ -270,27 +321,110 @@ def _process_event(theme: Literal["light", "dark"]) -> None:
     Args:
         theme: theme name
     """
-    for func, args in _callback_events.items():
-        try:  # Prevent detection thread from crashing
+    for ref, args in tuple(_callback_events.values()):
+        if (func := ref()) is None:
+            continue
+
+        try:  # Prevent the event loop from crashing
             func(theme, *args)
         except Exception as exc:  # pylint: disable=W0718
             traceback.print_exception(exc)
 
 
+def _detect_theme() -> None:
+    """Detect the system theme and start the detection thread.
+
+    It only takes effect on the first call, so that importing this module does
+    not query the system. The detection thread is not started if
+    ``configs.Env.theme_listener`` is ``False``.
+    """
+    global _theme_detected, _listener_started  # pylint: disable=W0603
+
+    if _theme_detected:
+        return
+
+    _theme_detected = True
+
+    if darkdetect is None:
+        return
+
+    configs.Env.theme = "dark" if darkdetect.isDark() else "light"
+
+    if configs.Env.theme_listener:
+        threading.Thread(
+            target=darkdetect.listener, args=(_callback,), daemon=True).start()
+        _listener_started = True
+        _ensure_poll()
+
+
+def _ensure_poll(window: tkinter.Misc | None = None) -> None:
+    """Poll the system theme changes on a window periodically.
+
+    It only takes effect if the detection thread has been started and no window
+    is polled yet. The detection thread can not touch the widgets, so its
+    changes are queued and handled by the poll, on the thread of the window.
+
+    Args:
+        window: the window, the default root window if it is not given.
+    """
+    global _poll_task  # pylint: disable=W0603
+
+    if not _listener_started or _poll_task is not None:
+        return
+
+    if window is None:
+        window = tkinter._default_root  # pylint: disable=W0212
+
+        if window is None:  # The first main window polls when it is created
+            return
+
+    _poll_task = window, window.after(100, _poll, window)
+
+
+def _poll(window: tkinter.Misc) -> None:
+    """Handle the pending system theme changes and schedule the next poll."""
+    global _poll_task  # pylint: disable=W0603
+    _flush_events()
+    _poll_task = window, window.after(100, _poll, window)
+
+
+def _cancel_poll(window: tkinter.Misc) -> None:
+    """Cancel the poll on a window that is being destroyed.
+
+    Args:
+        window: the window.
+    """
+    global _poll_task  # pylint: disable=W0603
+
+    if _poll_task is not None and _poll_task[0] is window:
+        window.after_cancel(_poll_task[1])
+        _poll_task = None
+
+
+def _flush_events() -> None:
+    """Handle the pending system theme changes on the main thread.
+
+    A burst of changes is collapsed into the last one, so that registered
+    callback functions are called at most once. Valid only if the theme mode is
+    set to follow system.
+    """
+    theme: Literal["light", "dark"] | None = None
+
+    while not _pending_themes.empty():
+        theme = _pending_themes.get_nowait()
+
+    if theme is not None and _color_mode == "system":
+        _process_event(theme)
+
+
 def _callback(theme: str) -> None:
     """Callback function that is triggered when a system theme is switched.
-    Valid only if the theme mode is set to follow system.
+
+    It is called in the detection thread, so the change is only recorded here
+    and handled later on the main thread by ``_flush_events``.
 
     Args:
         theme: theme name.
     """
     configs.Env.theme = "dark" if theme == "Dark" else "light"
-
-    if _color_mode == "system":
-        _process_event(configs.Env.theme)
-
-
-if darkdetect is not None:
-    configs.Env.theme = "dark" if darkdetect.isDark() else "light"
-    threading.Thread(
-        target=darkdetect.listener, args=(_callback,), daemon=True).start()
+    _pending_themes.put(configs.Env.theme)
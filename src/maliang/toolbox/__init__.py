@@ -3,5 +3,53 @@
 
 """Some practical tools."""
 
-from .enhanced import *
-from .utility import *
+import typing as _typing
+
+from .._lazy import attach as _attach
+
+__all__, __getattr__, __dir__ = _attach(__name__, {
+    ".callbacks": (
+        "CallbackPolicy",
+    ),
+    ".enhanced": (
+        "PhotoImage",
+    ),
+    ".models": (
+        "ListModel",
+        "SearchIndex",
+        "SelectionGroup",
+    ),
+    ".pool": (
+        "WidgetPool",
+    ),
+    ".scheduler": (
+        "Job",
+        "schedule",
+        "set_frame_budget",
+        "get_frame_budget",
+    ),
+    ".utility": (
+        "get_parent",
+        "embed_window",
+        "load_font",
+        "screen_size",
+        "get_text_size",
+        "fix_cursor",
+        "create_smoke",
+    ),
+}, {
+    "callbacks": ".callbacks",
+    "enhanced": ".enhanced",
+    "models": ".models",
+    "pool": ".pool",
+    "scheduler": ".scheduler",
+    "utility": ".utility",
+})
+
+if _typing.TYPE_CHECKING:
+    from .callbacks import *
+    from .enhanced import *
+    from .models import *
+    from .pool import *
+    from .scheduler import *
+    from .utility import *
@@ -0,0 +1,130 @@
+# Copyright (c) 2024-2025 Xiaokang2022. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for details.
+
+"""Policies that decide when callbacks of widgets are called."""
+
+from __future__ import annotations as _
+
+__all__ = (
+    "CallbackPolicy",
+)
+
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Literal
+
+from ..core import configs
+
+if TYPE_CHECKING:
+    import tkinter
+
+
+class CallbackPolicy:
+    """A policy that decides when a callback is called, such as the command of
+    a ``Slider``. Only the callback is delayed, the widget is still painted at
+    full rate.
+
+    * ``"immediate"``: each call is passed on at once.
+    * ``"throttle"``: calls are passed on at most once per interval, the last
+      call of an interval is passed on at its end.
+    * ``"debounce"``: the last call is passed on when there have been no calls
+      for an interval.
+    * ``"release"``: the last call is passed on when method ``release`` is
+      called, e.g. when the mouse button is released.
+
+    Examples:
+        >>> policy = CallbackPolicy(print, "release")
+        >>> policy(1)
+        >>> policy(2)
+        >>> policy.release()
+        2
+    """
+
+    def __init__(
+        self,
+        command: Callable[..., Any],
+        mode: Literal["immediate", "throttle", "debounce", "release"] = "immediate",
+        *,
+        interval: int = 100,
+        master: tkinter.Misc | None = None,
+    ) -> None:
+        """
+        Args:
+            command: the callback.
+            mode: the mode of the policy, see class docstring for details.
+            interval: the interval of throttling and debouncing, in milliseconds.
+            master: the widget whose event loop delays the calls, the root
+                window by default.
+        """
+        self.command = command
+        self.mode = mode
+        self.interval = interval
+        self.master = master
+
+        self._pending: tuple[Any, ...] | None = None
+        self._task: str | None = None
+        self._last: float | None = None  # When the last call was passed on
+
+    @property
+    def pending(self) -> bool:
+        """Whether there is a call that has not been passed on."""
+        return self._pending is not None
+
+    def __call__(self, *args: Any) -> None:
+        match self.mode:
+            case "throttle":
+                if self._task is not None:
+                    self._pending = args
+                    return
+
+                now = time.perf_counter()
+
+                if self._last is None or now - self._last >= self.interval/1000:
+                    self._call(args)
+                else:
+                    self._pending = args
+                    delay = round((self._last + self.interval/1000 - now)*1000)
+                    self._schedule(max(delay, 1))
+            case "debounce":
+                self._pending = args
+                self._cancel_task()
+                self._schedule(self.interval)
+            case "release":
+                self._pending = args
+            case _:
+                self._call(args)
+
+    def release(self) -> None:
+        """Pass on the pending call at once."""
+        self._cancel_task()
+        self._flush()
+
+    def cancel(self) -> None:
+        """Discard the pending call."""
+        self._cancel_task()
+        self._pending = None
+
+    def _schedule(self, delay: int) -> None:
+        """Pass on the pending call after a delay, in milliseconds."""
+        master = configs.Env.root if self.master is None else self.master
+        self._task = master.after(delay, self._flush)
+
+    def _cancel_task(self) -> None:
+        """Cancel the scheduled call."""
+        if self._task is not None:
+            master = configs.Env.root if self.master is None else self.master
+            master.after_cancel(self._task)
+            self._task = None
+
+    def _flush(self) -> None:
+        """Pass on the pending call if there is one."""
+        self._task = None
+
+        if self._pending is not None:
+            args, self._pending = self._pending, None
+            self._call(args)
+
+    def _call(self, args: tuple[Any, ...]) -> None:
+        """Call the callback."""
+        self._last = time.perf_counter()
+        self.command(*args)
@@ -0,0 +1,490 @@
+# Copyright (c) 2024-2025 Xiaokang2022. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for details.
+
+"""Models that keep the data of widgets and notify or index their changes,
+so that a view only needs to refresh the part that is changed."""
+
+from __future__ import annotations as _
+
+__all__ = (
+    "ListModel",
+    "SearchIndex",
+    "SelectionGroup",
+)
+
+import bisect
+import collections
+import collections.abc
+import contextlib
+import traceback
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Literal
+
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from ..core import virtual
+
+
+class ListModel(collections.abc.MutableSequence):
+    """A list that notifies its changes, such as the data of ``VirtualList``.
+
+    The functions bound to it are called with the kind of the change, the index
+    of the first changed item and the number of changed items, so that a view
+    only needs to refresh the changed part.
+
+    * ``"insert"``: items are inserted before the index.
+    * ``"remove"``: items are removed from the index.
+    * ``"update"``: items are replaced from the index.
+
+    Examples:
+        >>> model = ListModel("ab")
+        >>> model.bind(lambda *args: print(*args))
+        >>> model.extend("cd")
+        insert 2 2
+        >>> del model[:2]
+        remove 0 2
+        >>> model[-1] = "e"
+        update 1 1
+        >>> list(model)
+        ['c', 'e']
+    """
+
+    def __init__(self, iterable: Iterable[Any] = (), /) -> None:
+        """
+        Args:
+            iterable: the initial items.
+        """
+        self._data: list[Any] = list(iterable)
+        self._commands: list[Callable[[Literal["insert", "remove", "update"], int, int], Any]] = []
+
+    def bind(
+        self,
+        command: Callable[[Literal["insert", "remove", "update"], int, int], Any],
+    ) -> None:
+        """Bind a function that is called when the items are changed.
+
+        Args:
+            command: the function that is bound.
+        """
+        self._commands.append(command)
+
+    def unbind(
+        self,
+        command: Callable[[Literal["insert", "remove", "update"], int, int], Any],
+    ) -> None:
+        """Unbind a function that is bound.
+
+        Args:
+            command: the function that is bound.
+        """
+        self._commands.remove(command)
+
+    def _notify(self, kind: Literal["insert", "remove", "update"], index: int, count: int) -> None:
+        """Call the functions that are bound.
+
+        Args:
+            kind: the kind of the change.
+            index: the index of the first changed item.
+            count: the number of changed items.
+        """
+        for command in tuple(self._commands):
+            try:
+                command(kind, index, count)
+            except Exception as exc:  # pylint: disable=W0718
+                traceback.print_exception(exc)
+
+    def _indices(self, index: int | slice) -> tuple[int, int]:
+        """Convert an index or a contiguous slice to (start, count).
+
+        Args:
+            index: an index or a slice.
+
+        Raises:
+            IndexError: if the index is out of range.
+            ValueError: if the step of the slice is not 1.
+        """
+        if not isinstance(index, slice):
+            return range(len(self._data))[index], 1
+
+        start, stop, step = index.indices(len(self._data))
+
+        if step != 1:
+            raise ValueError("Only contiguous slices are supported.")
+
+        return start, max(stop - start, 0)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        return self._data[index]
+
+    def __setitem__(self, index: int | slice, value: Any) -> None:
+        start, count = self._indices(index)
+
+        if isinstance(index, slice):
+            value = list(value)
+
+            if len(value) != count:
+                raise ValueError(f"Expected {count} items, got {len(value)}.")
+
+            self._data[start:start+count] = value
+        else:
+            self._data[start] = value
+
+        if count:
+            self._notify("update", start, count)
+
+    def __delitem__(self, index: int | slice) -> None:
+        start, count = self._indices(index)
+        del self._data[start:start+count]
+
+        if count:
+            self._notify("remove", start, count)
+
+    @override
+    def insert(self, index: int, value: Any) -> None:
+        length = len(self._data)
+        index = min(max(index + length if index < 0 else index, 0), length)
+        self._data.insert(index, value)
+        self._notify("insert", index, 1)
+
+    @override
+    def extend(self, values: Iterable[Any]) -> None:
+        index = len(self._data)
+        self._data.extend(values)
+
+        if count := len(self._data) - index:
+            self._notify("insert", index, count)
+
+    @override
+    def clear(self) -> None:
+        del self[:]
+
+
+class SearchIndex:
+    """An index that searches texts by prefix, or by n-grams for fuzzy matching.
+
+    The texts are indexed by keys, such as the indices of options. Prefix
+    matches are found by bisecting a sorted array, so they only cost the number
+    of results. Texts containing most of the n-grams of the query are found by
+    an inverted index, which tolerates typos and matches in the middle.
+
+    Examples:
+        >>> index = SearchIndex(["apple", "banana", "pineapple", "applet"])
+        >>> index.search("app")
+        [0, 3, 2]
+        >>> index.search("aple")
+        [0, 2, 3]
+        >>> index.remove(3)
+        >>> index.search("app", fuzzy=False)
+        [0]
+    """
+
+    def __init__(self, texts: Iterable[str] = (), /, *, n: int = 3) -> None:
+        """
+        Args:
+            texts: the initial texts, which are indexed by their indices.
+            n: the length of the n-grams.
+        """
+        self.n = n
+
+        self._texts: dict[int, str] = {}  # Key: normalized text
+        self._sorted: list[tuple[str, int]] = []  # (Normalized text, key)
+        self._grams: dict[str, set[int]] = collections.defaultdict(set)
+
+        self.extend(enumerate(texts))
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._texts
+
+    def _ngrams(self, text: str) -> set[str]:
+        """Get the n-grams of a normalized text."""
+        return {text[i:i+self.n] for i in range(len(text) - self.n + 1)}
+
+    def add(self, key: int, text: str) -> None:
+        """Index a text, the text of the same key is replaced.
+
+        Args:
+            key: the key of the text.
+            text: the text.
+        """
+        if key in self._texts:
+            self.remove(key)
+
+        self._texts[key] = text = text.casefold()
+        bisect.insort(self._sorted, (text, key))
+
+        for gram in self._ngrams(text):
+            self._grams[gram].add(key)
+
+    def extend(self, items: Iterable[tuple[int, str]]) -> None:
+        """Index many texts, which is faster than adding them one by one.
+
+        Args:
+            items: pairs of key and text, the last text of a key is kept.
+        """
+        items = dict(items)
+
+        for key in items:  # The sorted array must stay sorted for bisection
+            if key in self._texts:
+                self.remove(key)
+
+        for key, text in items.items():
+            self._texts[key] = text = text.casefold()
+            self._sorted.append((text, key))
+
+            for gram in self._ngrams(text):
+                self._grams[gram].add(key)
+
+        self._sorted.sort()
+
+    def remove(self, key: int) -> None:
+        """Remove the text of a key from the index.
+
+        Args:
+            key: the key of the text.
+
+        Raises:
+            KeyError: if the key is not indexed.
+        """
+        text = self._texts.pop(key)
+        index = bisect.bisect_left(self._sorted, (text, key))
+
+        if index < len(self._sorted) and self._sorted[index] == (text, key):
+            del self._sorted[index]
+        else:
+            self._sorted.remove((text, key))
+
+        for gram in self._ngrams(text):
+            if keys := self._grams.get(gram):
+                keys.discard(key)
+
+                if not keys:
+                    del self._grams[gram]
+
+    def clear(self) -> None:
+        """Remove all texts from the index."""
+        self._texts.clear()
+        self._sorted.clear()
+        self._grams.clear()
+
+    def search(self, query: str, limit: int | None = None, *, fuzzy: bool = True) -> list[int]:
+        """Search the texts that match a query, case-insensitively.
+
+        Texts starting with the query come first in alphabetical order, then,
+        if ``fuzzy`` is true, texts sharing at least half of the n-grams of the
+        query, the ones sharing more n-grams first.
+
+        Args:
+            query: the text to search for.
+            limit: the maximum number of results, ``None`` indicates no limit.
+            fuzzy: whether to search the texts that do not start with the query.
+
+        Returns:
+            The keys of the matching texts.
+        """
+        query = query.casefold()
+        start = bisect.bisect_left(self._sorted, (query,))
+        stop = len(self._sorted) if limit is None else min(start + limit, len(self._sorted))
+        result: list[int] = []
+
+        for i in range(start, stop):
+            text, key = self._sorted[i]
+
+            if not text.startswith(query):
+                break
+
+            result.append(key)
+
+        if not fuzzy or (limit is not None and len(result) >= limit):
+            return result
+
+        if not (grams := self._ngrams(query)):
+            return result
+
+        counter: collections.Counter[int] = collections.Counter()
+
+        for gram in grams:
+            counter.update(self._grams.get(gram, ()))
+
+        found = set(result)
+        threshold = (len(grams) + 1) // 2
+        candidates = sorted(
+            (-count, key) for key, count in counter.items() if count >= threshold and key not in found)
+        result.extend(key for _, key in candidates[:None if limit is None else limit - len(result)])
+        return result
+
+
+class SelectionGroup:
+    """A group of widgets in which some members are selected, such as radio boxes.
+
+    Members are widgets with methods ``get`` and ``set`` that get and set
+    whether they are selected. The group keeps the indices of the selected
+    members, so changing the selection only touches the members that are
+    deselected and selected, instead of all members. Members can call method
+    ``notify`` when they are selected or deselected by themselves.
+
+    Examples:
+        >>> class Member:
+        ...     def __init__(self): self.value = False
+        ...     def get(self): return self.value
+        ...     def set(self, value, *, callback=False): self.value = value
+        >>> group = SelectionGroup([Member() for _ in range(3)])
+        >>> group.select(1)
+        >>> group.select(2)
+        >>> group.get(), [member.get() for member in group]
+        (2, [False, False, True])
+    """
+
+    def __init__(self, members: Iterable[virtual.Widget] = (), /, *, multiple: bool = False) -> None:
+        """
+        Args:
+            members: the initial members.
+            multiple: whether more than one member can be selected.
+        """
+        self.multiple = multiple
+
+        self._members: list[virtual.Widget] = []
+        self._indices: dict[virtual.Widget, int] = {}
+        self._selected: dict[int, None] = {}  # Indices in the order of selection
+
+        for member in members:
+            self.add(member)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __iter__(self) -> Iterator[virtual.Widget]:
+        return iter(tuple(self._members))
+
+    def __contains__(self, member: object) -> bool:
+        return member in self._indices
+
+    @property
+    def members(self) -> tuple[virtual.Widget, ...]:
+        """All members of the group."""
+        return tuple(self._members)
+
+    def index(self, member: virtual.Widget) -> int:
+        """Get the index of a member.
+
+        Args:
+            member: a member of the group.
+
+        Raises:
+            KeyError: if it is not a member of the group.
+        """
+        return self._indices[member]
+
+    def add(self, member: virtual.Widget) -> None:
+        """Add a member, it has no effect if it is already a member.
+
+        Args:
+            member: the new member.
+        """
+        if member in self._indices:
+            return
+
+        self._indices[member] = len(self._members)
+        self._members.append(member)
+
+        if member.get():
+            self.notify(member, True)
+
+    def remove(self, member: virtual.Widget) -> None:
+        """Remove a member, the indices of the following members are shifted.
+
+        Args:
+            member: a member of the group.
+
+        Raises:
+            KeyError: if it is not a member of the group.
+        """
+        index = self._indices.pop(member)
+        del self._members[index]
+
+        for i in range(index, len(self._members)):
+            self._indices[self._members[i]] = i
+
+        self._selected = {i - (i > index): None for i in self._selected if i != index}
+
+    def get(self) -> int | None:
+        """Get the index of the selected member, the last selected one if more
+        than one is selected. If not, None is returned."""
+        return next(reversed(self._selected), None)
+
+    def get_all(self) -> tuple[int, ...]:
+        """Get the indices of the selected members in the order of selection."""
+        return tuple(self._selected)
+
+    def _batch(self, count: int) -> contextlib.AbstractContextManager:
+        """Freeze the canvas while many members are changed, so that each of
+        them is repainted only once."""
+        if count > 2:
+            return self._members[0].master.freeze()
+
+        return contextlib.nullcontext()
+
+    def select(self, index: int, *, callback: bool = False) -> None:
+        """Select a member, the other selected member is deselected unless
+        multiple selection is allowed.
+
+        Args:
+            index: the index of the member.
+            callback: whether to call the commands of deselected members.
+        """
+        member = self._members[index]
+        deselected = () if self.multiple else [i for i in self._selected if i != index]
+
+        with self._batch(len(deselected) + 1):
+            for i in deselected:
+                self._members[i].set(False, callback=callback)
+                self._selected.pop(i, None)
+
+            if not member.get():
+                member.set(True)
+
+        self._selected.pop(index, None)
+        self._selected[index] = None
+
+    def deselect(self, index: int, *, callback: bool = False) -> None:
+        """Deselect a member.
+
+        Args:
+            index: the index of the member.
+            callback: whether to call the command of the member.
+        """
+        if self._members[index].get():
+            self._members[index].set(False, callback=callback)
+
+        self._selected.pop(index, None)
+
+    def clear(self, *, callback: bool = False) -> None:
+        """Deselect all selected members.
+
+        Args:
+            callback: whether to call the commands of deselected members.
+        """
+        with self._batch(len(self._selected)):
+            for index in tuple(self._selected):
+                self.deselect(index, callback=callback)
+
+    def notify(self, member: virtual.Widget, selected: bool) -> None:
+        """Record that a member is selected or deselected by itself.
+
+        Args:
+            member: a member of the group.
+            selected: whether it is selected.
+        """
+        if (index := self._indices.get(member)) is None:
+            return
+
+        self._selected.pop(index, None)
+
+        if selected:
+            self._selected[index] = None
@@ -0,0 +1,132 @@
+# Copyright (c) 2024-2025 Xiaokang2022. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for details.
+
+"""Pools that reuse widgets instead of creating and destroying them."""
+
+from __future__ import annotations as _
+
+__all__ = (
+    "WidgetPool",
+)
+
+import weakref
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..core import virtual
+
+
+class WidgetPool:
+    """A pool of widgets created by the same function.
+
+    Widgets that are no longer needed are released to the pool instead of
+    being destroyed. They are hidden and parked, and method ``acquire`` reuses
+    them by moving, re-styling and lifting them, which saves the cost of
+    creating their items, fonts and styles again.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[tuple[int, int]], virtual.Widget],
+        *,
+        maxsize: int = 32,
+    ) -> None:
+        """
+        Args:
+            factory: the function that creates a widget at a position.
+            maxsize: the maximum number of parked widgets, widgets released
+                to a full pool are destroyed.
+        """
+        self.factory = factory
+        self.maxsize = maxsize
+
+        self._parked: list[virtual.Widget] = []
+        # The initial states and visibilities of the widgets and their
+        # descendants, in the order of method ``_subtree``. Descendants are not
+        # referenced, since they reference the widgets as their masters
+        self._initial: weakref.WeakKeyDictionary[
+            virtual.Widget, tuple[tuple[str, bool], ...]] = weakref.WeakKeyDictionary()
+        self._stats: dict[str, int] = dict.fromkeys(("created", "reused", "destroyed"), 0)
+
+    def __len__(self) -> int:
+        return len(self._parked)
+
+    @staticmethod
+    def _subtree(widget: virtual.Widget) -> Iterable[virtual.Widget]:
+        """Iterate over a widget and its descendants."""
+        yield widget
+        for child in widget.children:
+            yield from WidgetPool._subtree(child)
+
+    def acquire(self, position: tuple[int, int]) -> virtual.Widget:
+        """Get a widget at a position, a parked one is reused if possible.
+
+        A reused widget and its descendants are restored to their initial states
+        and visibilities, and it is lifted to the top of its layer like a new
+        one.
+
+        Args:
+            position: position of the widget.
+        """
+        while self._parked:
+            widget = self._parked.pop()
+
+            if not widget.exists():  # Destroyed meanwhile, e.g. by the canvas
+                continue
+
+            initial = self._initial.get(widget, ())
+            subtree = tuple(self._subtree(widget))
+            widget.moveto(*position)
+
+            for i, descendant in enumerate(subtree):
+                descendant.state = initial[i][0] if i < len(initial) else "normal"
+
+            widget.forget(False)
+
+            for i, descendant in enumerate(subtree):
+                if i < len(initial) and initial[i][1]:
+                    descendant.forget()
+
+            widget.lift()
+            self._stats["reused"] += 1
+            return widget
+
+        widget = self.factory(position)
+        self._initial[widget] = tuple(
+            (descendant.state, descendant.disappeared) for descendant in self._subtree(widget))
+        self._stats["created"] += 1
+        return widget
+
+    def release(self, widget: virtual.Widget) -> None:
+        """Hide a widget and park it for reuse.
+
+        Args:
+            widget: the widget that is no longer needed.
+        """
+        if not widget.exists():
+            return
+
+        if len(self._parked) >= self.maxsize:
+            widget.destroy()
+            self._stats["destroyed"] += 1
+            return
+
+        if widget.state_before_disabled:
+            widget.disable(False)
+
+        widget.forget()
+        self._parked.append(widget)
+
+    def clear(self) -> None:
+        """Destroy all parked widgets."""
+        for widget in self._parked:
+            if widget.exists():
+                widget.destroy()
+                self._stats["destroyed"] += 1
+
+        self._parked.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return the numbers of widgets created, reused, destroyed and parked."""
+        return {**self._stats, "parked": len(self._parked)}
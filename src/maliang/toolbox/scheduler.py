@@ -0,0 +1,236 @@
+# Copyright (c) 2024-2025 Xiaokang2022. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root for details.
+
+"""Cooperative work scheduler on the event loop of ``tkinter``.
+
+Large work, such as constructing a big view, is split into small steps. The
+steps are run in slices that fit in the frame budget, and events are processed
+between two slices, so the view fills in progressively and stays responsive.
+
+A step is an item of an iterable: if it is callable, it is called, so the
+work can be given as a list of functions or as a generator that does a bit of
+work before each ``yield``.
+"""
+
+from __future__ import annotations as _
+
+__all__ = (
+    "Job",
+    "schedule",
+    "set_frame_budget",
+    "get_frame_budget",
+)
+
+import heapq
+import itertools
+import time
+import traceback
+from collections.abc import Callable, Iterable, Sized
+from typing import TYPE_CHECKING, Any
+
+from ..core import configs
+
+if TYPE_CHECKING:
+    from ..standard import widgets
+
+_budget: float = 8
+"""The time that a slice can take, in milliseconds."""
+
+_queue: list[tuple[int, int, Job]] = []
+"""The heap of pending jobs, as (negative priority, sequence number, job)."""
+
+_sequence = itertools.count()
+"""Sequence numbers keep jobs of the same priority in order."""
+
+_task: str | None = None
+"""The identifier of the scheduled slice."""
+
+
+class Job:
+    """Work scheduled by function ``schedule``.
+
+    Attributes:
+        priority: jobs with higher priority run first.
+        total: the number of steps, ``None`` indicates unknown.
+        count: the number of steps that have been run.
+        progress: the progress bar that shows the progress of the job.
+        command: the function called when the job is finished.
+    """
+
+    def __init__(
+        self,
+        steps: Iterable[Any],
+        *,
+        priority: int = 0,
+        total: int | None = None,
+        progress: widgets.ProgressBar | None = None,
+        command: Callable[[], Any] | None = None,
+    ) -> None:
+        """
+        Args:
+            steps: steps of the job, see module docstring for details.
+            priority: jobs with higher priority run first.
+            total: the number of steps, it is the length of ``steps`` by
+                default if it has one.
+            progress: the progress bar that shows the progress of the job, it
+                only works if the number of steps is known.
+            command: the function called when the job is finished.
+        """
+        if total is None and isinstance(steps, Sized):
+            total = len(steps)
+
+        self.priority = priority
+        self.total = total
+        self.count: int = 0
+        self.progress = progress
+        self.command = command
+
+        self._steps = iter(steps)
+        self._cost: float = 0  # Moving average of the time of a step, in seconds
+        self._finished: bool = False
+        self._cancelled: bool = False
+
+    @property
+    def active(self) -> bool:
+        """Whether the job is neither finished nor cancelled."""
+        return not (self._finished or self._cancelled)
+
+    @property
+    def finished(self) -> bool:
+        """Whether all steps of the job have been run."""
+        return self._finished
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the job has been cancelled."""
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel the job, remaining steps are not run."""
+        if self.active:
+            self._cancelled = True
+
+            if hasattr(self._steps, "close"):
+                self._steps.close()  # Run the cleanup of a generator
+
+    def _step(self) -> None:
+        """Run the next step of the job."""
+        start = time.perf_counter()
+
+        try:
+            step = next(self._steps)
+
+            if callable(step):
+                step()
+        except StopIteration:
+            self._finish()
+            return
+        except Exception as exc:  # pylint: disable=W0718
+            traceback.print_exception(exc)
+            self.cancel()
+            return
+
+        self.count += 1
+        cost = time.perf_counter() - start
+        self._cost = cost if self.count == 1 else self._cost*0.8 + cost*0.2
+
+    def _finish(self) -> None:
+        """Finish the job."""
+        self._finished = True
+        self._report()
+
+        if self.command is not None:
+            try:
+                self.command()
+            except Exception as exc:  # pylint: disable=W0718
+                traceback.print_exception(exc)
+
+    def _report(self) -> None:
+        """Show the progress of the job on its progress bar."""
+        if self.progress is not None and self.total:
+            if self.progress.exists():
+                self.progress.set(1 if self._finished else self.count/self.total)
+
+
+def schedule(
+    steps: Iterable[Any],
+    *,
+    priority: int = 0,
+    total: int | None = None,
+    progress: widgets.ProgressBar | None = None,
+    command: Callable[[], Any] | None = None,
+) -> Job:
+    """Schedule a job to be run in slices on the event loop.
+
+    Args:
+        steps: steps of the job, see module docstring for details.
+        priority: jobs with higher priority run first, jobs with the same
+            priority run in the order they are scheduled.
+        total: the number of steps, it is the length of ``steps`` by default
+            if it has one.
+        progress: the progress bar that shows the progress of the job, it
+            only works if the number of steps is known.
+        command: the function called when the job is finished.
+
+    Returns:
+        The scheduled job, which can be cancelled.
+    """
+    global _task  # pylint: disable=W0603
+
+    job = Job(steps, priority=priority, total=total, progress=progress, command=command)
+    heapq.heappush(_queue, (-priority, next(_sequence), job))
+
+    if _task is None:
+        _task = configs.Env.root.after(1, _run)
+
+    return job
+
+
+def set_frame_budget(budget: float) -> None:
+    """Set the time that a slice of jobs can take.
+
+    Args:
+        budget: the frame budget, in milliseconds.
+    """
+    global _budget  # pylint: disable=W0603
+    _budget = budget
+
+
+def get_frame_budget() -> float:
+    """Get the time that a slice of jobs can take, in milliseconds."""
+    return _budget
+
+
+def _run() -> None:
+    """Run a slice of the scheduled jobs.
+
+    At least one step is run in a slice. After that, a step is only run if it
+    is expected to finish within the budget, according to the average time of
+    the previous steps of its job.
+    """
+    global _task  # pylint: disable=W0603
+    _task = None
+
+    start = time.perf_counter()
+    deadline = start + _budget/1000
+    touched: dict[Job, None] = {}
+
+    while _queue:
+        job = _queue[0][2]
+
+        if not job.active:
+            heapq.heappop(_queue)
+            continue
+
+        if touched and time.perf_counter() + job._cost > deadline:  # pylint: disable=W0212
+            break
+
+        touched[job] = None
+        job._step()  # pylint: disable=W0212
+
+    for job in touched:
+        if not job.finished:
+            job._report()  # pylint: disable=W0212
+
+    if _queue:
+        _task = configs.Env.root.after(1, _run)
@@ -35,6 +35,12 @@ try:
 except ImportError:
     Image = None
 
+_text_sizes: dict[tuple[Any, ...], tuple[int, int]] = {}
+"""Sizes measured by function ``get_text_size`` with a new font."""
+
+_MAX_TEXT_SIZES = 4096
+"""The maximum number of cached sizes of texts."""
+
 
 class Trigger:
     """Single trigger.
@@ -140,6 +146,8 @@ def load_font(
         This function is referenced from ``customtkinter.load_font``,
             ``customtkinter``: https://github.com/TomSchimansky/CustomTkinter.
     """
+    _text_sizes.clear()  # Sizes may be changed by the new fonts
+
     if sys.platform == "win32":
         if isinstance(font_path, str):
             path_buffer = ctypes.create_unicode_buffer(font_path)
@@ -208,20 +216,35 @@ def get_text_size(
 
     Warning:
         This function only works when the fontsize is negative number!
+
+    Note:
+        Sizes measured with a new font are cached for the scaling of the
+        window, as a font object may be changed, the size is always measured
+        when ``font`` is given.
     """
     if wrap_length is None:
         wrap_length = 0
 
-    temp_cv = master if master else tkinter.Canvas(configs.Env.root)
+    while isinstance(master, virtual.Widget):
+        master = master.master
 
-    while isinstance(temp_cv, virtual.Widget):
-        temp_cv = temp_cv.master
+    key: tuple[Any, ...] | None = None
 
     if font is None:
         if family is None:
             family = configs.Font.family
         if fontsize is None:
             fontsize = configs.Font.size
+
+        scaling = (configs.Env.root if master is None else master).tk.call("tk", "scaling")
+        key = text, fontsize, family, wrap_length, scaling, tuple(sorted(kwargs.items()))
+
+        if (size := _text_sizes.get(key)) is not None:
+            return 2*padding + size[0], 2*padding + size[1]
+
+    temp_cv = tkinter.Canvas(configs.Env.root) if master is None else master
+
+    if font is None:
         font = tkinter.font.Font(
             temp_cv, family=family, size=-abs(fontsize), **kwargs)
 
@@ -233,6 +256,12 @@ def get_text_size(
     if master is None:
         temp_cv.destroy()
 
+    if key is not None:
+        if len(_text_sizes) >= _MAX_TEXT_SIZES:
+            _text_sizes.clear()
+
+        _text_sizes[key] = x2 - x1, y2 - y1
+
     return 2*padding + x2 - x1, 2*padding + y2 - y1
 
 
@@ -121,6 +121,46 @@ class TestAnimation(unittest.TestCase):
         self.assertEqual(len(an._tasks), 3+2)
         an.stop()
 
+    def test_pause_and_resume(self) -> None:
+        an = animations.Animation(1000, lambda _: None, fps=10)
+        an.start()
+        an.pause()
+        self.assertTrue(an.paused)
+        self.assertFalse(an.active)
+        self.assertEqual(len(an._remains), 10+1)
+
+        an.resume()
+        self.assertFalse(an.paused)
+        self.assertEqual(len(an._tasks), 10+1)
+
+        an.pause()
+        an.stop()
+        self.assertFalse(an.paused)
+
+    def test_attach(self) -> None:
+        cv = containers.Canvas(self.tk)
+        widget = widgets.Button(cv, (10, 10))
+        an = animations.Animation(1000, lambda _: None, fps=10)
+        an.attach(widget)
+        an.start()
+        self.assertTrue(an.paused)
+        self.assertFalse(an.active)
+
+        cv.place(width=100, height=100)
+        self.tk.update()
+        animations.Animation.update_visibility()
+        self.assertTrue(an.active)
+
+        widget.forget()
+        self.assertTrue(an.paused)
+        widget.forget(False)
+        self.assertTrue(an.active)
+
+        widget.destroy()
+        animations.Animation.update_visibility()
+        self.assertFalse(an.active)
+        self.assertNotIn(an, animations._attached_animations)
+
 
 class TestMoveWindowTk(unittest.TestCase):
 
@@ -208,6 +248,18 @@ class TestMoveWidget(unittest.TestCase):
         self.an.start()
         self.an2.start()
 
+    def test_stop_owned(self) -> None:
+        self.an = animations.MoveWidget(self.widget, (99, 99), 99)
+        self.an2 = animations.MoveWidget((self.widget, self.widget2), (99, 99), 99)
+        self.an.start()
+        self.an2.start()
+        self.assertEqual(set(animations.Animation.owned_by(self.widget)), {self.an, self.an2})
+
+        self.widget.destroy()
+        self.assertFalse(self.an.active)
+        self.assertFalse(self.an2.active)
+        self.assertEqual(animations.Animation.owned_by(self.widget2), [])
+
 
 class TestMoveElement(unittest.TestCase):
 
@@ -0,0 +1,80 @@
+# pylint: disable=C0111
+
+import doctest
+import time
+import unittest
+import unittest.mock
+
+from maliang.animation import quality
+from maliang.core import containers
+
+
+def load_tests(loader: unittest.TestLoader, tests: unittest.TestSuite, pattern: str | None) -> unittest.TestSuite:
+    del loader, pattern
+    tests.addTests(doctest.DocTestSuite(quality))
+    return tests
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.patcher = unittest.mock.patch.multiple(
+            quality, _task="after#0", _level=0, _counter=0, _budget=20, _patience=2, _history=quality.collections.deque())
+        self.patcher.start()
+
+    def tearDown(self) -> None:
+        self.patcher.stop()
+
+    def test_scale(self) -> None:
+        self.assertEqual(quality.scale_fps(60), 60)
+        self.assertEqual(quality.scale_duration(150), 150)
+
+        quality._level = 1
+        self.assertEqual(quality.scale_fps(60), 30)
+        self.assertEqual(quality.scale_fps(1), 1)
+        self.assertEqual(quality.scale_duration(150), 150)
+
+        quality._level = 2
+        self.assertEqual(quality.scale_duration(150), 75)
+
+        quality._level = 3
+        self.assertEqual(quality.scale_fps(60), 30)
+        self.assertEqual(quality.scale_duration(150), 0)
+
+    def test_evaluate(self) -> None:
+        start = time.perf_counter()
+
+        for _ in range(10):
+            quality._evaluate(50, start)
+
+        self.assertEqual(quality.get_quality_level(), 3)
+        self.assertEqual([level for _, level, _, _ in quality.get_quality_history()], [1, 2, 3])
+
+        quality._evaluate(0, time.perf_counter())
+        self.assertEqual(quality.get_quality_level(), 3)
+
+        for _ in range(3):
+            quality._evaluate(0, time.perf_counter())
+
+        self.assertEqual(quality.get_quality_level(), 2)
+
+        for _ in range(3):
+            quality._evaluate(15, time.perf_counter())
+
+        self.assertEqual(quality.get_quality_level(), 2)
+
+    def test_enable_and_disable(self) -> None:
+        with containers.Tk() as tk:
+            quality._task = None
+            quality.enable_adaptive_quality(10, interval=1)
+            self.assertIsNotNone(quality._task)
+            quality._level = 2
+
+            tk.update()
+            quality.disable_adaptive_quality()
+            self.assertIsNone(quality._task)
+            self.assertEqual(quality.get_quality_level(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
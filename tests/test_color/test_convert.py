@@ -77,6 +77,24 @@ class TestCase(unittest.TestCase):
         self.assertEqual(convert.hex_to_name("#FFFFFF"), ["gray100", "grey100", "white"])
         self.assertEqual(convert.hex_to_name("#008000"), ["green"])
 
+    def test_nearest_name(self) -> None:
+        self.assertEqual(convert.nearest_name((255, 255, 255)), ["gray100"])
+        self.assertEqual(convert.nearest_name((255, 255, 255), 3), ["gray100", "grey100", "white"])
+        self.assertEqual(convert.nearest_name((1, 127, 0)), ["green"])
+        self.assertEqual(convert.nearest_name((1, 127, 0), space="lab"), ["green"])
+        self.assertEqual(convert.nearest_name((0, 0, 0), 0), [])
+
+        with self.assertRaises(ValueError):
+            convert.nearest_name((0, 0, 0), space="hsl")
+
+        for value in ((12, 34, 56), (200, 100, 50), (90, 180, 250)):
+            for space in ("rgb", "lab"):
+                names = convert.nearest_name(value, 5, space=space)
+                self.assertEqual(len(names), 5)
+                self.assertEqual(convert.nearest_name(value, space=space), names[:1])
+
+        self.assertIs(convert.nearest2name, convert.nearest_name)
+
     def test_fix_hex_length(self) -> None:
         self.assertEqual(convert.fix_hex_length("#FFF"), "#FFFFFF")
         self.assertEqual(convert.fix_hex_length("#00ff00"), "#00ff00")
@@ -19,15 +19,19 @@ class TestEnv(unittest.TestCase):
     def test_reset(self) -> None:
         configs.Env.system = ""
         configs.Env.theme = "dark"
+        configs.Env.theme_listener = False
         configs.Env.gradient_animation = False
         configs.Env.auto_update = False
+        configs.Env.resize_delay = 100
 
         configs.Env.reset()
 
         self.assertEqual(configs.Env.system, configs.Env.get_default_system())
         self.assertEqual(configs.Env.theme, "light")
+        self.assertTrue(configs.Env.theme_listener)
         self.assertTrue(configs.Env.gradient_animation)
         self.assertTrue(configs.Env.auto_update)
+        self.assertEqual(configs.Env.resize_delay, 0)
 
     def test_get_default_system(self) -> None:
         with unittest.mock.patch('sys.platform', 'win32'):
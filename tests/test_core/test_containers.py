@@ -8,8 +8,9 @@ import tkinter
 import unittest
 import unittest.mock
 
-from maliang.core import containers
-from maliang.standard import widgets
+from maliang.core import containers, virtual
+from maliang.standard import shapes, widgets
+from maliang.theme import manager
 from maliang.toolbox import enhanced
 
 
@@ -107,6 +108,21 @@ class TestTk(unittest.TestCase):
                 with containers.Canvas(tk):
                     tk.theme("dark", include_children=True, include_canvases=True)
 
+    def test_poll_theme(self) -> None:
+        with unittest.mock.patch.multiple(manager, _listener_started=False, _poll_task=None):
+            with containers.Tk():
+                self.assertIsNone(manager._poll_task)
+
+        with unittest.mock.patch.multiple(manager, _listener_started=True, _poll_task=None):
+            tk = containers.Tk()
+            window, task = manager._poll_task
+            self.assertIs(window, tk)
+            tk.destroy()
+            self.assertIsNone(manager._poll_task)
+
+        with self.assertRaises(tkinter.TclError):
+            tk.tk.call("after", "info", task)
+
     def test_at_exit(self) -> None:
         a = None
 
@@ -218,6 +234,180 @@ class TestCanvas(unittest.TestCase):
                 cv._initialization()
                 cv._zoom_self()
 
+    def test_resize_delay(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk, auto_zoom=True, resize_delay=50) as cv:
+                widget = widgets.Button(cv, (0, 0))
+                cv.place(width=100, height=100)
+                cv.update()
+                size = widget.size
+                cv.place(width=200, height=200)
+                cv.update()
+                self.assertEqual(widget.size, size)
+                self.assertIsNotNone(cv._resize_task)
+                tk.after(100)
+                cv.update()
+                self.assertIsNone(cv._resize_task)
+                self.assertEqual(widget.size, (size[0]*2, size[1]*2))
+
+    def test_rescale(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk, auto_zoom=True, zoom_all_items=True) as cv:
+                widget = widgets.Button(cv, (10, 10))
+                item = cv.create_rectangle(0, 0, 10, 10)
+                cv.place(width=100, height=100)
+                cv.update()
+                position, size = widget.position, widget.size
+
+                for width in 37, 113, 71, 300, 100:
+                    cv.place(width=width, height=width)
+                    cv.update()
+
+                self.assertEqual(widget.position, position)
+                self.assertEqual(widget.size, size)
+                self.assertIn("zoom_all_items", cv.gettags(item))
+
+                with unittest.mock.patch.object(widget, "rescale") as mock_rescale:
+                    cv.place(width=100, height=100)
+                    cv.update()
+                    mock_rescale.assert_not_called()
+
+    def test_rescale_line(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk, auto_zoom=True) as cv:
+                cv.place(width=100, height=100)
+                cv.update()
+                widget = virtual.Widget(cv, (10, 10), (20, 20))
+                line = shapes.Line(widget, points=[(0, 0), (20, 10)])
+                coords, ratios = cv.coords(line.items[0]), cv.ratios
+
+                for width, height in (200, 300), (37, 113), (100, 100):
+                    cv.place(width=width, height=height)
+                    cv.update()
+                    k = cv.ratios[0]/ratios[0], cv.ratios[1]/ratios[1]
+
+                    for i, value in enumerate(cv.coords(line.items[0])):
+                        self.assertAlmostEqual(value, coords[i]*k[i % 2], delta=0.01)
+
+    def test_cull(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk, cull_margin=10) as cv:
+                widget = widgets.Button(cv, (500, 500))
+                cv.place(width=100, height=100)
+                cv.update()
+                cv.cull()
+                self.assertTrue(widget.culled)
+                self.assertTrue(all(child.culled for child in widget.children))
+
+                with unittest.mock.patch.object(widget.elements[0], "update") as mock_update:
+                    widget.update("hover")
+                    mock_update.assert_not_called()
+                    self.assertEqual(widget.state, "hover")
+                    self.assertTrue(widget._stale)
+
+                    widget.moveto(50, 50)
+                    self.assertFalse(widget.culled)
+                    self.assertFalse(widget._stale)
+                    mock_update.assert_called_with("hover", gradient_animation=False)
+
+    def test_layers(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk) as cv:
+                a, b = widgets.Button(cv, (0, 0)), widgets.Button(cv, (0, 0))
+                items = cv.find_all()
+                self.assertLess(items.index(a.shapes[0].items[0]), items.index(b.shapes[0].items[0]))
+
+                a.lift()
+                items = cv.find_all()
+                self.assertGreater(items.index(a.texts[0].items[0]), items.index(b.texts[0].items[0]))
+                self.assertEqual(list(cv.widgets), [b, *b.children, a, *a.children])
+
+                b.lift("background")
+                self.assertEqual(b.layer, "background")
+                self.assertEqual(list(cv.widgets), [b, *b.children, a, *a.children])
+                self.assertLess(cv.find_all().index(b.texts[0].items[0]), cv.find_all().index(a.shapes[0].items[0]))
+                self.assertIn(b.texts[0].items[0], cv.find_withtag(b.tags[0]))
+
+                with self.assertRaises(ValueError):
+                    a.lift("nonexistent")
+
+                with self.assertRaises(ValueError):
+                    cv.place_in_layer(a.tags[0], "nonexistent")
+
+    def test_freeze(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk) as cv:
+                widget = widgets.Button(cv, (0, 0))
+
+                with unittest.mock.patch.object(widget.elements[0], "update") as mock_update:
+                    with cv.freeze():
+                        with cv.freeze():
+                            widget.update("hover")
+                            widget.style.set(fg="red")
+
+                        self.assertTrue(cv.frozen)
+                        self.assertEqual(widget.state, "hover")
+                        mock_update.assert_not_called()
+
+                    self.assertFalse(cv.frozen)
+                    # Widgets that are not constructed in bulk keep their animation
+                    mock_update.assert_called_once_with("hover", gradient_animation=widget.gradient_animation)
+
+                    widget.style.set(fg="blue")
+                    widget.style.set(bg="blue")
+                    mock_update.assert_called_once()
+                    cv.update()
+                    self.assertEqual(mock_update.call_count, 2)
+
+    def test_freeze_handle(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk) as cv:
+                handle = cv.freeze()
+                self.assertFalse(hasattr(handle, "pop_all"))
+
+                with cv.freeze() as inner:
+                    self.assertIs(inner.__exit__(None, None, None), None)
+                    self.assertTrue(cv.frozen)
+
+                self.assertTrue(cv.frozen)  # Exiting again has no effect
+                handle.__exit__(None, None, None)
+                self.assertFalse(cv.frozen)
+
+                with self.assertRaises(RuntimeError):
+                    with cv.building():
+                        raise RuntimeError
+
+                self.assertFalse(cv.constructing)
+                self.assertFalse(cv.frozen)
+
+    def test_building(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk) as cv:
+                with cv.building():
+                    self.assertTrue(cv.constructing)
+                    self.assertTrue(cv.frozen)
+                    button = widgets.Button(cv, (0, 0))
+                    item = button.shapes[0].items[0]
+                    self.assertEqual(cv.itemcget(item, "fill"), "")
+
+                self.assertFalse(cv.constructing)
+                self.assertFalse(button.shapes[0].gradients)
+                self.assertNotEqual(cv.itemcget(item, "fill"), "")
+
+                items = cv.find_all()
+                self.assertLess(items.index(item), items.index(cv.find_withtag("layer:content")[0]))
+                self.assertLess(items.index(button.texts[0].items[0]), items.index(cv.find_withtag("layer:content")[0]))
+
+    def test_diagnose(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk) as cv:
+                widgets.Button(cv, (0, 0))
+                report = cv.diagnose()
+                self.assertEqual(report["widgets"], 1)
+                self.assertEqual(report["fonts"], 1)
+                self.assertEqual(report["canvases"], 0)
+                self.assertEqual(tk.diagnose(), {str(cv): report})
+
     def test_create_text(self) -> None:
         with containers.Tk() as tk:
             with containers.Canvas(tk) as cv:
@@ -264,5 +454,41 @@ class TestCanvas(unittest.TestCase):
                 cv.event_generate("<<Test>>")
 
 
+class TestScrollableCanvas(unittest.TestCase):
+
+    def test_scroll(self) -> None:
+        with containers.Tk() as tk:
+            with containers.ScrollableCanvas(tk, scroll_region=(0, 0, 100, 1000), smooth=False) as cv:
+                cv.place(width=100, height=100)
+                cv.update()
+                cv.scroll(0, 300)
+                self.assertEqual(cv.canvasy(0), 300)
+                cv.scroll_to(0, 9999)
+                self.assertEqual(cv.canvasy(0), 900)
+                cv.scroll_to(0, 100, smooth=True)
+                self.assertIsNotNone(cv._scrolling)
+                self.assertEqual(cv._target, (0, 100))
+
+    def test_on_events(self) -> None:
+        with containers.Tk() as tk:
+            with containers.ScrollableCanvas(tk, scroll_region=(0, 0, 100, 1000), smooth=False) as cv:
+                cv.place(width=100, height=100)
+                cv.update()
+                widget = widgets.Button(cv, (0, 500), capture_events=True)
+                cv.scroll(0, 480)
+                event = tkinter.Event()
+                event.x, event.y, event.delta, event.state = 10, 30, -120, 0
+                with unittest.mock.patch.object(widget.feature, "_motion", return_value=True) as mock_motion:
+                    cv.on_motion(event, "<Motion>")
+                    self.assertEqual(mock_motion.call_args.args[0].y, 510)
+                event.x, event.y = 10, 30
+                with unittest.mock.patch.object(widget.feature, "_mouse_wheel", return_value=True, create=True):
+                    cv.on_wheel(event, None)
+                self.assertEqual(cv.canvasy(0), 480)
+                event.x, event.y = 10, 0
+                cv.on_wheel(event, None)
+                self.assertEqual(cv.canvasy(0), 540)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,8 +2,11 @@
 
 import doctest
 import unittest
+import unittest.mock
 
-from maliang.core import virtual
+from maliang.animation import animations
+from maliang.core import containers, virtual
+from maliang.standard import shapes, widgets
 
 
 def load_tests(loader: unittest.TestLoader, tests: unittest.TestSuite, pattern: str | None) -> unittest.TestSuite:
@@ -12,5 +15,119 @@ def load_tests(loader: unittest.TestLoader, tests: unittest.TestSuite, pattern:
     return tests
 
 
+class TestWidgetRegistry(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.a, self.b, self.c = object(), object(), object()
+        self.registry = virtual.WidgetRegistry((self.a, self.b))
+
+    def test_order(self) -> None:
+        self.registry.append(self.c)
+        self.registry.append(self.a)
+        self.assertEqual(list(self.registry), [self.a, self.b, self.c])
+        self.assertEqual(list(reversed(self.registry)), [self.c, self.b, self.a])
+        self.registry.lift(self.a)
+        self.assertEqual(list(self.registry), [self.b, self.c, self.a])
+        self.assertEqual(self.registry[0], self.b)
+        self.assertEqual(self.registry.index(self.a), 2)
+
+    def test_remove(self) -> None:
+        self.registry.remove(self.a)
+        self.assertNotIn(self.a, self.registry)
+        self.assertEqual(len(self.registry), 1)
+
+        with self.assertRaises(ValueError):
+            self.registry.remove(self.a)
+
+        with self.assertRaises(ValueError):
+            self.registry.lift(self.a)
+
+        self.registry.clear()
+        self.assertFalse(self.registry)
+
+    def test_layers(self) -> None:
+        registry = virtual.WidgetRegistry(layers=("bottom", "content", "top"))
+        registry.append(self.a, "top")
+        registry.append(self.b)
+        registry.append(self.c, "bottom")
+        self.assertEqual(list(registry), [self.c, self.b, self.a])
+        self.assertEqual(registry.layer(self.b), "content")
+
+        registry.lift(self.c, "top")
+        registry.lift(self.a)
+        self.assertEqual(list(registry), [self.b, self.c, self.a])
+        self.assertEqual(registry.layers, ("bottom", "content", "top"))
+
+        with self.assertRaises(ValueError):
+            registry.lift(self.a, "nonexistent")
+
+        with self.assertRaises(ValueError):
+            virtual.WidgetRegistry(layers=("bottom",))
+
+    def test_change_while_iterating(self) -> None:
+        for widget in self.registry:
+            self.registry.remove(widget)
+            self.registry.append(self.c)
+
+        self.assertEqual(list(self.registry), [self.c])
+
+
+class TestShape(unittest.TestCase):
+
+    def test_template(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk) as cv:
+                with unittest.mock.patch.dict(virtual._templates, clear=True):
+                    a = widgets.Button(cv, (0, 0), (100, 40))
+
+                    with unittest.mock.patch.object(shapes.RoundedRectangle, "display") as mock_display:
+                        b = widgets.Button(cv, (20, 40), (100, 40))
+                        mock_display.assert_not_called()
+
+                    for item_a, item_b in zip(a.shapes[0].items, b.shapes[0].items, strict=True):
+                        self.assertEqual(cv.type(item_a), cv.type(item_b))
+                        self.assertEqual(cv.itemcget(item_a, "fill"), cv.itemcget(item_b, "fill"))
+                        self.assertEqual([x + (20, 40)[i % 2] for i, x in enumerate(cv.coords(item_a))], cv.coords(item_b))
+                        self.assertIn(b.tags[0], cv.gettags(item_b))
+
+                    self.assertEqual(len(virtual._templates), 1)
+                    widgets.Button(cv, (1, 0), (100, 40))
+                    self.assertEqual(len(virtual._templates), 2)
+
+    def test_template_opt_in(self) -> None:
+        class Shape(shapes.Rectangle):
+            def display(self) -> None:
+                super().display()
+                self.displayed = True
+
+        with containers.Tk() as tk:
+            with containers.Canvas(tk) as cv:
+                widget = virtual.Widget(cv, (0, 0), (100, 40))
+                self.assertIsNotNone(shapes.Rectangle(widget).template_key())
+
+                with unittest.mock.patch.dict(virtual._templates, clear=True):
+                    a, b = Shape(widget), Shape(widget)
+                    self.assertIsNone(a.template_key())
+                    self.assertTrue(b.displayed)
+                    self.assertEqual(virtual._templates, {})
+
+
+class TestWidget(unittest.TestCase):
+
+    def test_forget(self) -> None:
+        with containers.Tk() as tk:
+            with containers.Canvas(tk) as cv:
+                frame = virtual.Widget(cv, (0, 0), (100, 100))
+                child = virtual.Widget(frame, (0, 0), (50, 50))
+                grandchild = widgets.Button(child, (0, 0), (40, 20))
+
+                with unittest.mock.patch.object(animations.Animation, "update_visibility") as mock_update:
+                    frame.forget()
+                    mock_update.assert_called_once_with()
+
+                self.assertTrue(grandchild.disappeared)
+                self.assertTrue(all(not element.visible for element in grandchild.elements))
+
+
 if __name__ == "__main__":
     unittest.main()
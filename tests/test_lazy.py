@@ -0,0 +1,79 @@
+# pylint: disable=C0111
+
+import doctest
+import importlib
+import os
+import subprocess
+import sys
+import unittest
+
+import maliang
+from maliang import _lazy
+
+EXPORTS = {
+    "maliang": ("core.configs", "core.containers", "standard.dialogs", "standard.widgets", "toolbox.enhanced"),
+    "maliang.animation": ("animations", "controllers", "quality"),
+    "maliang.color": ("convert",),
+    "maliang.core": ("configs", "containers"),
+    "maliang.standard": ("dialogs", "widgets"),
+    "maliang.theme": ("manager",),
+    "maliang.toolbox": ("callbacks", "enhanced", "models", "pool", "scheduler", "utility"),
+}
+
+
+def load_tests(loader: unittest.TestLoader, tests: unittest.TestSuite, pattern: str | None) -> unittest.TestSuite:
+    del loader, pattern
+    tests.addTests(doctest.DocTestSuite(_lazy))
+    return tests
+
+
+def import_time(statement: str) -> dict[str, int]:
+    """Returns cumulative import time (us) of the modules imported by the statement."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, check=True, env=env, text=True)
+    modules: dict[str, int] = {}
+
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        modules[name.strip()] = int(cumulative)
+
+    return modules
+
+
+class TestCase(unittest.TestCase):
+
+    def test_import_time(self) -> None:
+        modules = import_time("import maliang")
+        self.assertEqual({name for name in modules if name.startswith("maliang")}, {"maliang", "maliang._lazy"})
+        self.assertNotIn("tkinter", modules)
+
+        modules = import_time("import maliang.color.convert")
+        self.assertIn("maliang.color.convert", modules)
+        self.assertNotIn("maliang.color.colortable", modules)
+        self.assertNotIn("maliang.theme.manager", modules)
+        self.assertNotIn("maliang.standard.widgets", modules)
+
+    def test_all(self) -> None:
+        for package, submodules in EXPORTS.items():
+            module = importlib.import_module(package)
+
+            for name in module.__all__:
+                self.assertIsNotNone(getattr(module, name))
+                self.assertIn(name, dir(module))
+
+            for submodule in submodules:
+                names = importlib.import_module(f"{package}.{submodule}").__all__
+                self.assertLessEqual(set(names), set(module.__all__))
+
+    def test_attribute(self) -> None:
+        self.assertIs(maliang.Tk, maliang.core.containers.Tk)
+        self.assertIs(maliang.configs, maliang.core.configs)
+        self.assertIs(maliang.widgets, maliang.standard.widgets)
+
+        with self.assertRaises(AttributeError):
+            maliang.nonexistent  # pylint: disable=W0104
+
+
+if __name__ == "__main__":
+    unittest.main()
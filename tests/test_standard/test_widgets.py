@@ -0,0 +1,380 @@
+# pylint: disable=C0111
+
+import doctest
+import unittest
+import unittest.mock
+
+from maliang.core import containers
+from maliang.standard import widgets
+from maliang.toolbox import models
+
+
+def load_tests(loader: unittest.TestLoader, tests: unittest.TestSuite, pattern: str | None) -> unittest.TestSuite:
+    del loader, pattern
+    tests.addTests(doctest.DocTestSuite(widgets))
+    return tests
+
+
+class TestOptionButton(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_abstract(self) -> None:
+        with self.assertRaises(TypeError):
+            widgets._OptionsWidget(self.cv, (0, 0))
+
+    def test_build_on_open(self) -> None:
+        button = widgets.OptionButton(self.cv, (0, 0), text=("a", "b"), default=1)
+        self.assertIsNone(button._options)
+        self.assertEqual(button.get(), 1)
+
+        button._open_options()
+        self.assertIsInstance(button._options, widgets.SegmentedButton)
+        self.assertFalse(button._options.disappeared)
+        self.assertEqual(button._options.get(), 1)
+
+    def test_release(self) -> None:
+        button = widgets.OptionButton(self.cv, (0, 0), text=("a", "b"), release_delay=10)
+        button._open_options()
+        options = button._options
+        button._close_options(0)
+        self.assertTrue(options.disappeared)
+        self.assertIsNotNone(button._release_task)
+
+        button._open_options()  # Reopening cancels the release
+        self.assertIsNone(button._release_task)
+        self.assertIs(button._options, options)
+
+        button._hide_options()
+        self.tk.after(50)
+        self.tk.update()
+        self.assertIsNone(button._options)
+        self.assertFalse(options.exists())
+        self.assertEqual(button.get(), 0)
+
+    def test_keep(self) -> None:
+        button = widgets.OptionButton(self.cv, (0, 0), text=("a", "b"), release_delay=None)
+        button._open_options()
+        button._hide_options()
+        self.assertIsNone(button._release_task)
+        self.assertIsNotNone(button._options)
+
+    def test_virtual(self) -> None:
+        button = widgets.OptionButton(self.cv, (0, 0), text=tuple("abcdefgh"), visible_options=3)
+        button._open_options()
+        self.assertIsInstance(button._options, widgets.VirtualList)
+        self.assertLess(len(button._options.children), 8)
+
+        button._choose_option(2)
+        self.assertEqual(button.get(), 2)
+
+
+class TestCallbackPolicy(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+        self.command = unittest.mock.Mock()
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_progress_bar(self) -> None:
+        bar = widgets.ProgressBar(self.cv, (0, 0), command=self.command, callback_policy="release")
+        bar.set(0.5, callback=True)
+        self.command.assert_not_called()
+
+        bar.set(1, callback=True)
+        self.command.assert_called_once_with(1)
+
+    def test_destroy(self) -> None:
+        slider = widgets.Slider(
+            self.cv, (0, 0), command=self.command, callback_policy="throttle", callback_interval=1000)
+        slider.set(0.2, callback=True)
+        slider.set(0.4, callback=True)
+        self.command.assert_called_once_with(0.2)
+
+        slider.destroy()
+        self.command.assert_called_with(0.4)
+
+
+class TestVirtualList(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+        self.command = unittest.mock.Mock()
+        self.data = models.ListModel(range(100))
+        self.list = widgets.VirtualList(self.cv, (0, 0), data=self.data, overscan=2, command=self.command)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def texts(self) -> dict[int, str]:
+        return {index: row.get() for index, row in self.list._rows.items()}
+
+    def test_recycle(self) -> None:
+        visible = self.list.visible_rows
+        self.assertEqual(sorted(self.list._rows), list(range(visible + 2)))
+        rows = set(self.list._rows.values())
+
+        self.list.scroll(50)
+        self.assertEqual(self.list.get(), 50)
+        self.assertEqual(sorted(self.list._rows), list(range(48, 50 + visible + 2)))
+        self.assertEqual(set(self.list._rows.values()), rows)
+        self.assertEqual(len(self.list.children), len(rows))
+        self.assertEqual(self.list._rows[50].get(), "50")
+
+    def test_overscan(self) -> None:
+        visible = self.list.visible_rows
+        self.list.set(20)
+
+        for index, row in self.list._rows.items():
+            self.assertEqual(row.disappeared, not 20 <= index < 20 + visible)
+
+        self.list.set(1000)
+        self.assertEqual(self.list.get(), 100 - visible)
+        self.assertEqual(sorted(self.list._rows), list(range(98 - visible, 100)))
+
+        self.list.set(-5)
+        self.assertEqual(self.list.get(), 0)
+
+    def test_model(self) -> None:
+        self.data.insert(0, "new")
+        self.assertEqual(self.texts()[0], "new")
+        self.assertEqual(self.texts()[1], "0")
+
+        del self.data[:2]
+        self.assertEqual(self.texts()[0], "1")
+        self.assertEqual(len(self.list._rows), self.list.visible_rows + 2)
+
+        self.data[0] = "updated"
+        self.assertEqual(self.texts()[0], "updated")
+
+        del self.data[:]
+        self.assertEqual(self.list._rows, {})
+        self.assertTrue(all(row.disappeared for row in self.list._free))
+
+    def test_see(self) -> None:
+        visible = self.list.visible_rows
+        self.list.see(20)
+        self.assertEqual(self.list.get(), 20 - visible + 1)
+
+        self.list.see(20 - visible + 2)  # Visible already
+        self.assertEqual(self.list.get(), 20 - visible + 1)
+
+        self.list.see(5)
+        self.assertEqual(self.list.get(), 5)
+
+    def test_command(self) -> None:
+        self.list.scroll(30)
+        self.list._click(self.list._rows[32])
+        self.command.assert_called_once_with(32)
+
+        self.data.insert(0, "new")  # Rows are shifted with the items
+        self.list._click(self.list._rows[33])
+        self.command.assert_called_with(33)
+        self.assertEqual(self.list._rows[33].get(), "32")
+
+
+class TestVirtualGrid(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+        self.data = models.ListModel((f"{i}", "x") for i in range(100))
+        self.grid = widgets.VirtualGrid(self.cv, (0, 0), (400, 200), data=self.data, column_width_range=(40, 300))
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_recycle(self) -> None:
+        visible = self.grid.visible_rows
+        self.assertLess(visible, 100)
+        self.assertEqual(len(self.grid._cells), visible*2)
+        cells = set(self.grid._cells.values())
+
+        self.grid.scroll(10)
+        self.assertEqual(self.grid.get(), (10, 0))
+        self.assertEqual(set(self.grid._cells.values()), cells)
+        self.assertEqual(self.grid._cells[(0, 0)][1].get(), "10")
+
+        self.grid.set(1000)
+        self.assertEqual(self.grid.get(), (100 - visible, 0))
+
+    def test_widths(self) -> None:
+        self.assertEqual(self.grid._column_width(1), 40)
+
+        grid = widgets.VirtualGrid(self.cv, (0, 0), data=[("a"*500, "b")], column_widths=(50,))
+        self.assertEqual(grid._column_width(0), 50)
+        self.assertEqual(grid._column_width(1), 40)
+
+        grid = widgets.VirtualGrid(self.cv, (0, 0), data=[("a"*500, "b")])
+        self.assertEqual(grid._column_width(0), 300)
+
+    def test_model(self) -> None:
+        self.data[0] = ("0", "x"*500)
+        self.assertEqual(self.grid._column_width(1), 300)
+        self.assertEqual(self.grid._cells[(0, 1)][1].get(), "x"*500)
+
+        del self.data[:]
+        self.assertEqual(self.grid._cells, {})
+        self.data.append(("y", "y"))
+        self.assertEqual(self.grid._column_width(1), 40)
+        self.assertEqual(len(self.grid._cells), 2)
+
+    def test_ragged(self) -> None:
+        data = models.ListModel([("a", "b", "c"), ("d",), ()] * 20)
+        grid = widgets.VirtualGrid(self.cv, (0, 0), (400, 200), data=data)
+        self.assertEqual(grid.columns, 3)
+        self.assertEqual(grid._cells[(1, 1)][1].get(), "")
+        self.assertEqual(grid._cells[(2, 0)][1].get(), "")
+
+        grid.scroll(1)
+        self.assertEqual(grid._cells[(0, 0)][1].get(), "d")
+        self.assertEqual(grid._cells[(0, 2)][1].get(), "")
+
+        data[1] = ("x", "y", "z", "extra")
+        self.assertEqual(grid._cells[(0, 2)][1].get(), "z")
+
+    def test_zoom(self) -> None:
+        self.cv.__dict__["ratios"] = 2., 2.
+        self.grid.zoom((2, 2))
+        self.assertEqual(self.grid._font.cget("size"), round(self.grid._initial_fontsize*2))
+        self.assertEqual(self.grid._cells[(0, 0)][1].font.cget("size"), self.grid._font.cget("size"))
+
+
+class TestComboBox(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+        self.box = widgets.ComboBox(self.cv, (0, 0), text=("apple", "banana", "cherry"), searchable=True)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def type(self, text: str) -> None:
+        self.box._input_box.state = "active"
+        self.box._input_box.set(text)
+        self.box._filter_options(None)
+
+    def test_filter(self) -> None:
+        self.type("ban")
+        self.assertFalse(self.box._options.disappeared)
+        self.assertEqual(list(self.box._options.data), [1])
+
+        self.box._hide_options()
+        self.assertTrue(self.box._options.disappeared)
+        self.box._open_options()
+        self.assertEqual(list(self.box._options.data), [0, 1, 2])
+
+    def test_set_options(self) -> None:
+        self.type("ch")
+        self.box.set_options(("cherry", "date"))
+        self.assertEqual(self.box.search_index.search("d"), [1])
+
+        self.box._open_options()
+        self.assertEqual(list(self.box._options.data), [0, 1])
+
+    def test_set_options_text(self) -> None:
+        self.box.set(1)
+        self.box.set_options(("apple", "blueberry", "cherry"))
+        self.assertEqual(self.box._input_box.get(), "blueberry")
+
+        self.box.set_options(("apple",))
+        self.assertIsNone(self.box.get())
+        self.assertEqual(self.box._input_box.get(), "")
+
+
+class TestRadioBox(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def test_group(self) -> None:
+        a, b, c = (widgets.RadioBox(self.cv, (0, 40*i)) for i in range(3))
+        a.group(b)
+        self.assertEqual(a.groups, (a, b))
+
+        c.group(b)  # Moved to the group of c
+        self.assertEqual(a.groups, (a,))
+        self.assertEqual(c.groups, (c, b))
+        self.assertIs(b.selection_group, c.selection_group)
+
+        b.set(True)
+        a.set(True)
+        self.assertTrue(b.get())
+        self.assertEqual(a.selection_group.get(), 0)
+
+        c.set(True)
+        self.assertFalse(b.get())
+        self.assertTrue(a.get())
+
+        c.group(c)
+        self.assertEqual(c.groups, (c, b))
+
+
+class TestTooltip(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def tooltips(self) -> list[widgets.Tooltip]:
+        return [widget for widget in self.cv.widgets if isinstance(widget, widgets.Tooltip)]
+
+    def test_lazy(self) -> None:
+        button = widgets.Button(self.cv, (0, 0), text="button")
+        tooltip = widgets.Tooltip(button, text="tooltip")
+        self.assertFalse(tooltip.realized)
+        self.assertEqual(self.tooltips(), [])
+
+        button.update("hover")
+        self.assertTrue(tooltip.realized)
+        self.assertFalse(tooltip.disappeared)
+        self.assertEqual(tooltip.texts[0].get(), "tooltip")
+
+        button.update("normal")
+        self.assertTrue(tooltip.disappeared)
+
+    def test_shared(self) -> None:
+        button1 = widgets.Button(self.cv, (0, 0), text="button1")
+        button2 = widgets.Button(self.cv, (0, 100), text="button2")
+        tooltip1 = widgets.Tooltip(button1, text="tooltip1", shared=True)
+        tooltip2 = widgets.Tooltip(button2, text="tooltip2", shared=True)
+
+        button1.update("hover")
+        button1.update("normal")
+        button2.update("hover")
+        self.assertTrue(tooltip1.realized)
+        self.assertFalse(tooltip2.realized)
+        self.assertEqual(self.tooltips(), [tooltip1])
+        self.assertFalse(tooltip1.disappeared)
+        self.assertEqual(tooltip1.texts[0].get(), "tooltip2")
+
+        button2.update("normal")
+        self.assertTrue(tooltip1.disappeared)
+
+    def test_destroy(self) -> None:
+        button = widgets.Button(self.cv, (0, 0), text="button")
+        tooltip = widgets.Tooltip(button, text="tooltip")
+        tooltip.destroy()
+        self.assertFalse(tooltip.exists())
+        self.assertNotIn(tooltip._display, button._update_hooks)
+
+
+if __name__ == "__main__":
+    unittest.main()
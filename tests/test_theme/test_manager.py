@@ -2,6 +2,7 @@
 
 import contextlib
 import doctest
+import gc
 import importlib
 import io
 import platform
@@ -41,6 +42,64 @@ class TestCase(unittest.TestCase):
         manager._callback(":)")
         self.assertEqual(configs.Env.theme, "light")
 
+        manager._flush_events()
+
+    def test_detect_theme(self) -> None:
+        darkdetect = unittest.mock.Mock()
+        darkdetect.isDark.return_value = True
+        configs.Env.theme_listener = False
+
+        with unittest.mock.patch.object(manager, "darkdetect", darkdetect):
+            with unittest.mock.patch.object(manager, "_theme_detected", False):
+                manager.set_color_mode("system")
+                self.assertEqual(manager.get_color_mode(), "dark")
+                self.assertEqual(manager.get_color_mode(), "dark")
+
+        darkdetect.isDark.assert_called_once()
+        darkdetect.listener.assert_not_called()
+
+        configs.Env.reset()
+
+    def test_listen_after_root(self) -> None:
+        darkdetect = unittest.mock.Mock()
+        darkdetect.isDark.return_value = False
+        themes = []
+        manager.set_color_mode("light")
+
+        with unittest.mock.patch.object(manager, "darkdetect", darkdetect), \
+                unittest.mock.patch.object(manager.threading, "Thread") as mock_thread, \
+                unittest.mock.patch.multiple(manager, _theme_detected=False, _listener_started=False, _poll_task=None):
+            manager.set_color_mode("system")  # The listener starts after the root window
+            mock_thread.return_value.start.assert_called_once_with()
+            self.assertIs(manager._poll_task[0], self.tk)
+
+            manager.register_event(themes.append)
+            manager._callback("Dark")
+            self.tk.after(150)
+            self.tk.update()
+            self.assertEqual(themes, ["dark"])
+
+            manager.remove_event(themes.append)
+            manager._cancel_poll(self.tk)
+
+    def test_flush_events(self) -> None:
+        themes = []
+        manager.set_color_mode("system")
+        manager.register_event(themes.append)
+
+        manager._callback("Dark")
+        manager._callback("Light")
+        manager._callback("Dark")
+        self.assertEqual(themes, [])
+
+        manager._flush_events()
+        self.assertEqual(themes, ["dark"])
+
+        manager._flush_events()
+        self.assertEqual(themes, ["dark"])
+
+        manager.remove_event(themes.append)
+
     def test_process_event(self) -> None:
         a = None
 
@@ -68,6 +127,24 @@ class TestCase(unittest.TestCase):
 
         manager.remove_event(func)
 
+    def test_weak_method(self) -> None:
+        themes = []
+
+        class Window:
+            def theme(self, value: str) -> None:
+                themes.append(value)
+
+        window = Window()
+        manager.register_event(window.theme)
+        manager._process_event("dark")
+        self.assertEqual(themes, ["dark"])
+
+        del window
+        gc.collect()
+        manager._process_event("light")
+        self.assertEqual(themes, ["dark"])
+        self.assertFalse(any(isinstance(key, tuple) and key[1] is Window.theme for key in manager._callback_events))
+
     @unittest.skipUnless(platform.system() == "Windows", "Only works on Windows OS.")
     def test_apply_theme(self) -> None:
         manager.apply_theme(self.tk, theme="normal")
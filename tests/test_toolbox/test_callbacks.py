@@ -0,0 +1,67 @@
+# pylint: disable=C0111
+
+import doctest
+import unittest
+import unittest.mock
+
+from maliang.toolbox import callbacks
+
+
+def load_tests(loader: unittest.TestLoader, tests: unittest.TestSuite, pattern: str | None) -> unittest.TestSuite:
+    del loader, pattern
+    tests.addTests(doctest.DocTestSuite(callbacks))
+    return tests
+
+
+class TestCallbackPolicy(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.command = unittest.mock.Mock()
+        self.master = unittest.mock.Mock()
+        self.master.after.return_value = "after#0"
+
+    def test_immediate(self) -> None:
+        policy = callbacks.CallbackPolicy(self.command, master=self.master)
+        policy(1)
+        policy(2)
+        self.assertEqual(self.command.call_count, 2)
+        self.master.after.assert_not_called()
+
+    def test_throttle(self) -> None:
+        policy = callbacks.CallbackPolicy(self.command, "throttle", interval=1000, master=self.master)
+        policy(1)
+        policy(2)
+        policy(3)
+        self.command.assert_called_once_with(1)
+        self.master.after.assert_called_once()
+        self.assertTrue(policy.pending)
+
+        policy._flush()
+        self.command.assert_called_with(3)
+        self.assertFalse(policy.pending)
+
+    def test_debounce(self) -> None:
+        policy = callbacks.CallbackPolicy(self.command, "debounce", interval=50, master=self.master)
+        policy(1)
+        policy(2)
+        self.master.after_cancel.assert_called_once_with("after#0")
+        self.master.after.assert_called_with(50, policy._flush)
+        self.command.assert_not_called()
+
+        policy.release()
+        self.command.assert_called_once_with(2)
+
+    def test_release(self) -> None:
+        policy = callbacks.CallbackPolicy(self.command, "release", master=self.master)
+        policy(1)
+        policy.cancel()
+        policy.release()
+        self.command.assert_not_called()
+
+        policy(2)
+        policy.release()
+        self.command.assert_called_once_with(2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+# pylint: disable=C0111
+
+import doctest
+import unittest
+import unittest.mock
+
+from maliang.toolbox import models
+
+
+def load_tests(loader: unittest.TestLoader, tests: unittest.TestSuite, pattern: str | None) -> unittest.TestSuite:
+    del loader, pattern
+    tests.addTests(doctest.DocTestSuite(models))
+    return tests
+
+
+class TestListModel(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.model = models.ListModel(range(5))
+        self.changes: list[tuple[str, int, int]] = []
+        self.model.bind(lambda *args: self.changes.append(args))
+
+    def test_insert(self) -> None:
+        self.model.insert(-1, "a")
+        self.model.insert(99, "b")
+        self.model.append("c")
+        self.model.extend("de")
+        self.model.extend(())
+        self.assertEqual(self.changes, [("insert", 4, 1), ("insert", 6, 1), ("insert", 7, 1), ("insert", 8, 2)])
+        self.assertEqual(list(self.model), [0, 1, 2, 3, "a", 4, "b", "c", "d", "e"])
+
+    def test_remove(self) -> None:
+        del self.model[-1]
+        del self.model[1:3]
+        del self.model[5:]
+        self.model.clear()
+        self.assertEqual(self.changes, [("remove", 4, 1), ("remove", 1, 2), ("remove", 0, 2)])
+        self.assertEqual(len(self.model), 0)
+
+        with self.assertRaises(IndexError):
+            del self.model[0]
+
+        with self.assertRaises(ValueError):
+            del self.model[::2]
+
+    def test_update(self) -> None:
+        self.model[0] = "a"
+        self.model[-2:] = "bc"
+        self.assertEqual(self.changes, [("update", 0, 1), ("update", 3, 2)])
+        self.assertEqual(self.model[:], ["a", 1, 2, "b", "c"])
+
+        with self.assertRaises(ValueError):
+            self.model[:2] = "abc"
+
+    def test_unbind(self) -> None:
+        self.model.unbind(self.model._commands[0])
+        self.model.append(5)
+        self.assertEqual(self.changes, [])
+
+
+class TestSearchIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.index = models.SearchIndex(["Apple", "banana", "pineapple", "applet", "cherry"])
+
+    def test_prefix(self) -> None:
+        self.assertEqual(self.index.search("APP", fuzzy=False), [0, 3])
+        self.assertEqual(self.index.search("app", 1), [0])
+        self.assertEqual(self.index.search("z"), [])
+        self.assertEqual(len(self.index.search("")), 5)
+
+    def test_fuzzy(self) -> None:
+        self.assertEqual(self.index.search("apple"), [0, 3, 2])
+        self.assertEqual(self.index.search("chery"), [4])
+        self.assertEqual(self.index.search("nana"), [1])
+        self.assertEqual(self.index.search("xyz"), [])
+
+    def test_update(self) -> None:
+        self.index.add(1, "apricot")
+        self.index.remove(3)
+        self.index.extend([(5, "application"), (0, "avocado")])
+        self.assertEqual(len(self.index), 5)
+        self.assertNotIn(3, self.index)
+        self.assertEqual(self.index.search("ap", fuzzy=False), [5, 1])
+        self.assertEqual(self.index.search("banana"), [])
+
+        with self.assertRaises(KeyError):
+            self.index.remove(3)
+
+        self.index.clear()
+        self.assertEqual(self.index.search("a"), [])
+
+    def test_replace(self) -> None:
+        index = models.SearchIndex(["m", "n"])
+        index.extend([(0, "a"), (1, "b")])
+        self.assertEqual(index._sorted, [("a", 0), ("b", 1)])
+
+        index.extend([(1, "z"), (2, "y"), (0, "x"), (2, "c")])
+        self.assertEqual(index._sorted, [("c", 2), ("x", 0), ("z", 1)])
+        self.assertEqual(index.search("z"), [1])
+        self.assertEqual(index.search("b"), [])
+
+        index.remove(0)
+        self.assertEqual(index._sorted, [("c", 2), ("z", 1)])
+
+
+class TestSelectionGroup(unittest.TestCase):
+
+    @staticmethod
+    def member(value: bool = False) -> unittest.mock.Mock:
+        member = unittest.mock.Mock()
+        member.get.return_value = value
+        member.set.side_effect = lambda value, callback=False: setattr(member.get, "return_value", value)
+        return member
+
+    def setUp(self) -> None:
+        self.members = [self.member() for _ in range(4)]
+        self.group = models.SelectionGroup(self.members)
+
+    def test_select(self) -> None:
+        self.group.select(1)
+        self.group.select(3, callback=True)
+        self.assertEqual(self.group.get(), 3)
+        self.members[1].set.assert_called_with(False, callback=True)
+        self.members[0].set.assert_not_called()
+        self.members[2].set.assert_not_called()
+
+        self.group.deselect(3)
+        self.assertIsNone(self.group.get())
+
+    def test_multiple(self) -> None:
+        self.group.multiple = True
+        self.group.select(2)
+        self.group.select(0)
+        self.assertEqual(self.group.get_all(), (2, 0))
+
+        self.group.clear()
+        self.assertEqual(self.group.get_all(), ())
+        self.assertFalse(any(member.get() for member in self.members))
+
+    def test_members(self) -> None:
+        selected = self.member(True)
+        self.group.add(selected)
+        self.group.add(selected)
+        self.assertEqual(len(self.group), 5)
+        self.assertEqual(self.group.get(), 4)
+
+        self.group.remove(self.members[0])
+        self.assertNotIn(self.members[0], self.group)
+        self.assertEqual(self.group.index(selected), 3)
+        self.assertEqual(self.group.get(), 3)
+
+        self.group.notify(selected, False)
+        self.assertIsNone(self.group.get())
+
+
+if __name__ == "__main__":
+    unittest.main()
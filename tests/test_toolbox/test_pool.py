@@ -0,0 +1,116 @@
+# pylint: disable=C0111
+
+import doctest
+import tkinter
+import unittest
+import unittest.mock
+
+from maliang.core import containers
+from maliang.standard import widgets
+from maliang.toolbox import pool
+
+
+def load_tests(loader: unittest.TestLoader, tests: unittest.TestSuite, pattern: str | None) -> unittest.TestSuite:
+    del loader, pattern
+    tests.addTests(doctest.DocTestSuite(pool))
+    return tests
+
+
+class TestWidgetPool(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.factory = unittest.mock.Mock(side_effect=lambda position: unittest.mock.Mock(
+            state="normal", state_before_disabled="", disappeared=False, children=()))
+        self.pool = pool.WidgetPool(self.factory, maxsize=1)
+
+    def test_reuse(self) -> None:
+        widget = self.pool.acquire((0, 0))
+        self.factory.assert_called_once_with((0, 0))
+
+        widget.state = "hover"
+        self.pool.release(widget)
+        widget.forget.assert_called_once_with()
+        self.assertEqual(len(self.pool), 1)
+
+        self.assertIs(self.pool.acquire((10, 20)), widget)
+        self.factory.assert_called_once()
+        widget.moveto.assert_called_once_with(10, 20)
+        widget.forget.assert_called_with(False)
+        widget.lift.assert_called_once_with()
+        self.assertEqual(widget.state, "normal")
+        self.assertEqual(self.pool.stats(), {"created": 1, "reused": 1, "destroyed": 0, "parked": 0})
+
+    def test_maxsize(self) -> None:
+        a, b = self.pool.acquire((0, 0)), self.pool.acquire((0, 0))
+        self.pool.release(a)
+        self.pool.release(b)
+        b.destroy.assert_called_once_with()
+
+        self.pool.clear()
+        a.destroy.assert_called_once_with()
+        self.assertEqual(self.pool.stats(), {"created": 2, "reused": 0, "destroyed": 2, "parked": 0})
+
+    def test_hidden_descendants(self) -> None:
+        child = unittest.mock.Mock(state="normal", disappeared=True, children=())
+        self.factory.side_effect = lambda position: unittest.mock.Mock(
+            state="normal", state_before_disabled="", disappeared=False, children=(child,))
+
+        widget = self.pool.acquire((0, 0))
+        self.pool.release(widget)
+        self.pool.acquire((0, 0))
+        child.forget.assert_called_once_with()
+
+    def test_descendant_states(self) -> None:
+        grandchild = unittest.mock.Mock(state="normal", disappeared=False, children=())
+        child = unittest.mock.Mock(state="normal", disappeared=False, children=(grandchild,))
+        self.factory.side_effect = lambda position: unittest.mock.Mock(
+            state="normal", state_before_disabled="", disappeared=False, children=(child,))
+
+        widget = self.pool.acquire((0, 0))
+        child.state, grandchild.state = "hover", "active"
+        self.pool.release(widget)
+        self.pool.acquire((0, 0))
+        self.assertEqual((child.state, grandchild.state), ("normal", "normal"))
+        grandchild.forget.assert_not_called()
+
+
+class TestWidgetPoolCanvas(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tk = containers.Tk()
+        self.cv = containers.Canvas(self.tk)
+        self.pool = pool.WidgetPool(lambda position: widgets.SegmentedButton(self.cv, position, text=("a", "b")))
+
+    def tearDown(self) -> None:
+        self.tk.destroy()
+
+    def dispatched(self, widget: widgets.SegmentedButton) -> bool:
+        event = tkinter.Event()
+        event.x, event.y = 10, 10
+        with unittest.mock.patch.object(widget.feature, "get_method") as mock_method:
+            self.cv.on_motion(event, "<Motion>")
+        return mock_method.called
+
+    def test_reuse(self) -> None:
+        widget = self.pool.acquire((0, 0))
+        child = widget.children[0]
+        state = child.state
+        self.assertTrue(self.dispatched(widget))
+
+        child.update("hover")
+        self.pool.release(widget)
+        self.assertTrue(widget.disappeared)
+        self.assertTrue(child.disappeared)
+        self.assertFalse(self.dispatched(widget))
+
+        self.assertIs(self.pool.acquire((10, 20)), widget)
+        self.assertEqual(widget.position, (10, 20))
+        self.assertFalse(widget.disappeared)
+        self.assertFalse(child.disappeared)
+        self.assertTrue(all(element.visible for element in child.elements))
+        self.assertEqual(child.state, state)
+        self.assertTrue(self.dispatched(widget))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# pylint: disable=C0111
+
+import doctest
+import unittest
+import unittest.mock
+
+from maliang.toolbox import scheduler
+
+
+def load_tests(loader: unittest.TestLoader, tests: unittest.TestSuite, pattern: str | None) -> unittest.TestSuite:
+    del loader, pattern
+    tests.addTests(doctest.DocTestSuite(scheduler))
+    return tests
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.root = unittest.mock.MagicMock()
+        self.patchers = [
+            unittest.mock.patch.multiple(scheduler, _task=None, _queue=[], _budget=1000),
+            unittest.mock.patch.object(scheduler.configs.Env, "root", self.root),
+        ]
+
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self) -> None:
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_priority(self) -> None:
+        order: list[str] = []
+        command = unittest.mock.Mock()
+        scheduler.schedule([lambda: order.append("a")] * 2, command=command)
+        scheduler.schedule((order.append("b") for _ in range(2)), priority=1)
+        self.root.after.assert_called_once_with(1, scheduler._run)
+
+        scheduler._run()
+        self.assertEqual(order, ["b", "b", "a", "a"])
+        command.assert_called_once_with()
+        self.assertEqual(scheduler._queue, [])
+
+    def test_budget(self) -> None:
+        scheduler.set_frame_budget(0)
+        self.assertEqual(scheduler.get_frame_budget(), 0)
+        job = scheduler.schedule([lambda: None] * 3)
+
+        scheduler._run()
+        self.assertEqual(job.count, 1)
+        self.assertEqual(self.root.after.call_count, 2)
+
+    def test_progress(self) -> None:
+        progress = unittest.mock.Mock()
+        scheduler.set_frame_budget(0)
+        job = scheduler.schedule(range(4), progress=progress)
+
+        scheduler._run()
+        progress.set.assert_called_with(0.25)
+
+        while job.active:
+            scheduler._run()
+
+        self.assertTrue(job.finished)
+        progress.set.assert_called_with(1)
+
+    def test_cancel(self) -> None:
+        order: list[int] = []
+        job = scheduler.schedule(order.append(i) for i in range(3))
+        job.cancel()
+        self.assertTrue(job.cancelled)
+        self.assertFalse(job.active)
+
+        scheduler._run()
+        self.assertEqual(order, [])
+
+    def test_error(self) -> None:
+        with unittest.mock.patch("traceback.print_exception") as mock_print:
+            job = scheduler.schedule([lambda: 1/0, lambda: None])
+            scheduler._run()
+
+        mock_print.assert_called_once()
+        self.assertTrue(job.cancelled)
+        self.assertEqual(job.count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -100,6 +100,18 @@ class TestCase(unittest.TestCase):
         widget = maliang.Button(self.cv, (0, 0))
         self.assertEqual(utility.get_text_size("", 20, "Fira Code", master=widget), (2, 24))
 
+    def test_text_size_cache(self) -> None:
+        widget = maliang.Button(self.cv, (0, 0))
+
+        with unittest.mock.patch.dict(utility._text_sizes, clear=True):
+            size = utility.get_text_size(":)", 20, master=widget)
+            self.assertEqual(utility.get_text_size(":)", 20, master=self.cv), size)
+            self.assertEqual(len(utility._text_sizes), 1)
+
+            self.tk.tk.call("tk", "scaling", 2*self.tk.tk.call("tk", "scaling"))
+            utility.get_text_size(":)", 20, master=widget)
+            self.assertEqual(len(utility._text_sizes), 2)
+
     def test_fix_cursor(self) -> None:
         self.assertEqual(utility.fix_cursor("a"), "a")
 